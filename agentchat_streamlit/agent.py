@@ -1,26 +1,124 @@
-import yaml
-from autogen_agentchat.agents import AssistantAgent
-from autogen_agentchat.messages import TextMessage
-from autogen_core import CancellationToken
-from autogen_core.models import ChatCompletionClient
+import uuid
+from typing import AsyncGenerator, List, Optional
+
+# prompt tokens kept verbatim per request; older turns are summarized (None = unbounded history)
+DEFAULT_TOKEN_BUDGET = 3000
+SYSTEM_MESSAGE = "You are a helpful AI assistant."
 
 
 class Agent:
-    def __init__(self) -> None:
-        # Load the model client from config.
-        with open("model_config.yml", "r") as f:
-            model_config = yaml.safe_load(f)
-        model_client = ChatCompletionClient.load_component(model_config)
+    def __init__(
+        self,
+        model_client=None,
+        token_budget: Optional[int] = DEFAULT_TOKEN_BUDGET,
+        session_id: Optional[str] = None,
+        cache=None,
+        stateless: bool = False,
+    ) -> None:
+        # autogen_agentchat is heavy; import it on first use so the app can paint before it loads
+        from autogen_agentchat.agents import AssistantAgent
+
+        if model_client is None:
+            # the process-wide client from model_config.yml, behind the fair request limiter;
+            # only the conversation state below belongs to this session
+            from shared_client import session_client
+
+            model_client = session_client(session_id or uuid.uuid4().hex)
+        self.memory = None
+        if token_budget is not None:
+            from memory import SummarizingChatCompletionContext
+
+            self.memory = SummarizingChatCompletionContext(model_client, token_budget=token_budget)
         self.agent = AssistantAgent(
             name="assistant",
             model_client=model_client,
-            system_message="You are a helpful AI assistant.",
+            system_message=SYSTEM_MESSAGE,
+            model_client_stream=True,
+            model_context=self.memory,
         )
+        self._cancellation_token = None  # token of the reply currently streaming, if any
+        self.prompt_tokens: List[int] = []  # prompt tokens of each model request, as reported by the model
+        # optional ResponseCache (response_cache.py): replies to a prompt with no history before
+        # it are shared across sessions; stateless agents forget each exchange, so every prompt qualifies
+        self.cache = cache
+        self.stateless = stateless
+        self.cache_hits = 0
+        self._model_hash = None
+        if cache is not None:
+            from response_cache import model_config_hash
+
+            self._model_hash = model_config_hash(model_client)
+
+    async def _cache_key(self, prompt: str) -> Optional[str]:
+        if self.cache is None or await self.agent.model_context.get_messages():
+            return None
+        from response_cache import cache_key
+
+        return cache_key(prompt, SYSTEM_MESSAGE, self._model_hash)
+
+    async def _remember(self, prompt: str, reply: str) -> None:
+        # a cached reply skips the model, so record the exchange the way a model call would
+        from autogen_core.models import AssistantMessage, UserMessage
+
+        await self.agent.model_context.add_message(UserMessage(content=prompt, source="user"))
+        await self.agent.model_context.add_message(AssistantMessage(content=reply, source=self.agent.name))
+
+    def _record_usage(self, response) -> None:
+        usage = response.chat_message.models_usage
+        if usage is not None:
+            self.prompt_tokens.append(usage.prompt_tokens)
+
+    def cancel(self) -> bool:
+        """Stop the reply currently streaming; call on the event loop the agent runs on"""
+        token, self._cancellation_token = self._cancellation_token, None
+        if token is None:
+            return False
+        token.cancel()
+        return True
+
+    async def chat_stream(self, prompt: str) -> AsyncGenerator[str, None]:
+        """Yield the reply piece by piece as the model generates it; starting a new
+        stream cancels one that is still running"""
+        from autogen_agentchat.base import Response
+        from autogen_agentchat.messages import ModelClientStreamingChunkEvent, TextMessage
+        from autogen_core import CancellationToken
+
+        self.cancel()
+        key = await self._cache_key(prompt)
+        if key is not None:
+            cached = await self.cache.aget(key)
+            if cached is not None:
+                self.cache_hits += 1
+                if not self.stateless:
+                    await self._remember(prompt, cached)
+                yield cached
+                return
+
+        token = self._cancellation_token = CancellationToken()
+        streamed = False
+        events = self.agent.on_messages_stream([TextMessage(content=prompt, source="user")], token)
+        try:
+            async for event in events:
+                if isinstance(event, ModelClientStreamingChunkEvent):
+                    streamed = True
+                    yield event.content
+                elif isinstance(event, Response):
+                    self._record_usage(event)
+                    reply = event.chat_message.content
+                    assert isinstance(reply, str)
+                    if key is not None:
+                        await self.cache.aput(key, reply)
+                    if not streamed:
+                        # the model client does not stream, so the whole reply arrives at once
+                        yield reply
+        finally:
+            if self._cancellation_token is token:
+                self._cancellation_token = None
+            # aborts the model call if the consumer stopped early; no-op once it has finished
+            token.cancel()
+            await events.aclose()
+            if self.stateless:
+                await self.agent.on_reset(CancellationToken())
 
     async def chat(self, prompt: str) -> str:
-        response = await self.agent.on_messages(
-            [TextMessage(content=prompt, source="user")],
-            CancellationToken(),
-        )
-        assert isinstance(response.chat_message.content, str)
-        return response.chat_message.content
\ No newline at end of file
+        return "".join([chunk async for chunk in self.chat_stream(prompt)])
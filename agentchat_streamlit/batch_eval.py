@@ -0,0 +1,189 @@
+"""
+Batch evaluation of prompts through the chat Agent.
+
+Reads a JSONL file of prompts ({"id": ..., "prompt": ...}; id optional), answers each with a
+fresh Agent under bounded concurrency and a per-request timeout, and writes one JSONL line
+per prompt (response, status, latency) followed by a summary line with p50/p95/p99 latency
+and throughput. Requests go through the same per-session client wrapper and fair limiter
+as the app.
+
+Offline clients make runs reproducible and let the stack be measured without a network:
+    --client fake      echoes the prompt after --latency seconds
+    --client replay    answers from a recordings file made with --record on a real run
+
+Usage:
+    python batch_eval.py prompts.jsonl -o results.jsonl --concurrency 8 --timeout 60
+    python batch_eval.py prompts.jsonl -o results.jsonl --record recordings.json
+    python batch_eval.py prompts.jsonl -o results.jsonl --client replay --recordings recordings.json
+    python batch_eval.py prompts.jsonl -o results.jsonl --client fake --sweep 1,4,16,64
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import time
+from typing import Dict, List, Optional
+
+from autogen_core.models import CreateResult, RequestUsage
+from autogen_ext.models.replay import ReplayChatCompletionClient
+
+from agent import Agent
+from shared_client import DEFAULT_MAX_CONCURRENT, FairLimiter, SessionModelClient
+
+
+class FakeClient(ReplayChatCompletionClient):
+    """Answers every prompt after a fixed delay, streaming it word by word"""
+
+    def __init__(self, latency: float = 0.05, recordings: Optional[Dict[str, str]] = None):
+        super().__init__([])
+        self.latency = latency
+        self.recordings = recordings
+
+    def _reply(self, messages) -> str:
+        prompt = messages[-1].content
+        if self.recordings is None:
+            return f"Echo: {prompt}"
+        if prompt not in self.recordings:
+            raise KeyError(f"No recorded response for prompt: {prompt[:60]}")
+        return self.recordings[prompt]
+
+    async def create(self, messages, **kwargs):
+        reply = self._reply(messages)
+        await asyncio.sleep(self.latency)
+        return CreateResult(finish_reason="stop", content=reply, cached=False,
+                            usage=RequestUsage(prompt_tokens=self.count_tokens(messages),
+                                               completion_tokens=len(reply.split())))
+
+    async def create_stream(self, messages, **kwargs):
+        result = await self.create(messages, **kwargs)
+        words = result.content.split(" ")
+        for i, word in enumerate(words):
+            yield word if i == len(words) - 1 else word + " "
+        yield result
+
+
+def load_prompts(path: str) -> List[Dict]:
+    prompts = []
+    with open(path, "r") as f:
+        for line_number, line in enumerate(f, 1):
+            if line.strip():
+                item = json.loads(line)
+                prompts.append({"id": item.get("id", line_number), "prompt": item["prompt"]})
+    return prompts
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def summarize(results: List[Dict], wall_seconds: float, concurrency: int) -> Dict:
+    latencies = sorted(r["latency_ms"] for r in results if r["status"] == "ok")
+    return {
+        "requests": len(results),
+        "ok": len(latencies),
+        "timeouts": sum(1 for r in results if r["status"] == "timeout"),
+        "errors": sum(1 for r in results if r["status"] == "error"),
+        "concurrency": concurrency,
+        "wall_seconds": round(wall_seconds, 3),
+        "throughput_rps": round(len(latencies) / wall_seconds, 2) if wall_seconds else 0.0,
+        "mean_ms": round(sum(latencies) / len(latencies), 1) if latencies else 0.0,
+        "p50_ms": round(percentile(latencies, 50), 1),
+        "p95_ms": round(percentile(latencies, 95), 1),
+        "p99_ms": round(percentile(latencies, 99), 1),
+        "max_ms": round(latencies[-1], 1) if latencies else 0.0,
+    }
+
+
+async def run_batch(prompts: List[Dict], model_client, concurrency: int = 8, timeout: float = 60.0,
+                    limit: int = DEFAULT_MAX_CONCURRENT) -> Dict:
+    """Answer every prompt with its own Agent; returns {"results": [...], "summary": {...}}"""
+    semaphore = asyncio.Semaphore(concurrency)
+    limiter = FairLimiter(limit)
+
+    async def evaluate(item: Dict) -> Dict:
+        async with semaphore:
+            session = f"eval-{item['id']}"
+            agent = Agent(model_client=SessionModelClient(model_client, limiter, session), token_budget=None)
+            start = time.perf_counter()
+            record = {"id": item["id"], "prompt": item["prompt"]}
+            try:
+                record["response"] = await asyncio.wait_for(agent.chat(item["prompt"]), timeout)
+                record["status"] = "ok"
+            except asyncio.TimeoutError:
+                record.update(status="timeout", response=None)
+            except Exception as e:
+                record.update(status="error", response=None, error=str(e))
+            record["latency_ms"] = round((time.perf_counter() - start) * 1000, 2)
+            record["prompt_tokens"] = agent.prompt_tokens[-1] if agent.prompt_tokens else None
+            return record
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(evaluate(item) for item in prompts))
+    return {"results": results, "summary": summarize(results, time.perf_counter() - start, concurrency)}
+
+
+def write_results(path: str, results: List[Dict], summaries: List[Dict]) -> None:
+    with open(path, "w") as f:
+        for record in results:
+            f.write(json.dumps(record) + "\n")
+        for summary in summaries:
+            f.write(json.dumps({"summary": summary}) + "\n")
+
+
+def build_client(args):
+    if args.client == "fake":
+        return FakeClient(args.latency)
+    if args.client == "replay":
+        with open(args.recordings, "r") as f:
+            return FakeClient(args.latency, recordings=json.load(f))
+    from shared_client import get_model_client
+    return get_model_client()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a JSONL file of prompts through the chat agent")
+    parser.add_argument("prompts", help="JSONL file with a 'prompt' (and optional 'id') per line")
+    parser.add_argument("-o", "--output", required=True, help="JSONL results file")
+    parser.add_argument("--concurrency", type=int, default=8, help="Prompts in flight at once")
+    parser.add_argument("--timeout", type=float, default=60.0, help="Seconds per request")
+    parser.add_argument("--limit", type=int, default=DEFAULT_MAX_CONCURRENT,
+                        help="Model requests in flight at once (the app's fair limiter)")
+    parser.add_argument("--client", choices=["config", "fake", "replay"], default="config",
+                        help="config: model_config.yml; fake: echo; replay: answers from --recordings")
+    parser.add_argument("--latency", type=float, default=0.05, help="Fake/replay seconds per request")
+    parser.add_argument("--recordings", help="JSON {prompt: response} for --client replay")
+    parser.add_argument("--record", help="Save {prompt: response} from this run for later replay")
+    parser.add_argument("--sweep", help="Comma-separated concurrency levels to compare, e.g. 1,4,16")
+    args = parser.parse_args()
+
+    prompts = load_prompts(args.prompts)
+    client = build_client(args)
+    levels = [int(level) for level in args.sweep.split(",")] if args.sweep else [args.concurrency]
+
+    async def run_levels():
+        # one event loop for every level, since a real client's connections are bound to it
+        return [await run_batch(prompts, client, level, args.timeout, args.limit) for level in levels]
+
+    runs = asyncio.run(run_levels())
+    summaries = [run["summary"] for run in runs]
+    for s in summaries:
+        print(f"concurrency {s['concurrency']:>4}: {s['ok']}/{s['requests']} ok, {s['throughput_rps']} req/s, "
+              f"p50 {s['p50_ms']} ms, p95 {s['p95_ms']} ms, p99 {s['p99_ms']} ms, "
+              f"{s['timeouts']} timeouts, {s['errors']} errors")
+    run = runs[-1]
+    write_results(args.output, run["results"], summaries)
+
+    if args.record:
+        recordings = {r["prompt"]: r["response"] for r in run["results"] if r["status"] == "ok"}
+        with open(args.record, "w") as f:
+            json.dump(recordings, f, indent=2)
+        print(f"Recorded {len(recordings)} responses to {args.record}")
+
+
+if __name__ == "__main__":
+    main()
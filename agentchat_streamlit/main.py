@@ -1,22 +1,102 @@
-import asyncio
+import os
+import sys
+import time
+from typing import Iterator, List
 
 import streamlit as st
 from agent import Agent
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from cold_start import mark_first_paint, start_warm_up
+from streamlit_loop import get_session_runner
+
+# AGENTCHAT_OFFLINE_QUEUE=<sqlite path> (e.g. the repo's ship_queue.db) queues prompts while
+# the model is unreachable and answers them in the background once it is back
+OFFLINE_QUEUE_PATH = os.environ.get("AGENTCHAT_OFFLINE_QUEUE")
+
+
+def get_agent() -> Agent:
+    # created on the first prompt rather than on page load, so autogen_agentchat loads
+    # while the user is typing; the model client itself is shared by every session
+    if "agent" not in st.session_state:
+        session_id = get_session_runner(st.session_state).session_id
+        # AGENTCHAT_RESPONSE_CACHE=<sqlite path> answers repeated opening prompts from a
+        # cache shared by all sessions and worker processes using that file
+        cache_path = os.environ.get("AGENTCHAT_RESPONSE_CACHE")
+        if cache_path:
+            from response_cache import get_response_cache
+
+            cache = get_response_cache(cache_path)
+        else:
+            cache = None
+        st.session_state["agent"] = Agent(session_id=session_id, cache=cache)
+    return st.session_state["agent"]
+
+
+def get_offline_queue():
+    from ship_queue import get_sync_worker
+
+    async def answer(query: str) -> str:
+        return await Agent(session_id="ship-queue-sync", token_budget=None, stateless=True).chat(query)
+
+    return get_sync_worker(answer, OFFLINE_QUEUE_PATH).queue
+
+
+def answer_offline(prompt: str) -> str:
+    # the model is unreachable: reuse an earlier answer to the same question, or queue it
+    queue = get_offline_queue()
+    cached = queue.cached_response(prompt)
+    if cached is not None:
+        st.markdown(cached)
+        st.caption("Offline: answered from an earlier response")
+        return cached
+    query_id = queue.enqueue(prompt)
+    st.session_state["queued_queries"].append(query_id)
+    response = f"📡 The model is unreachable. Your question is queued (#{query_id}) and will be answered when the connection returns."
+    st.markdown(response)
+    return response
+
+
+def collect(chunks: Iterator[str], received: List[str]) -> Iterator[str]:
+    # keep each chunk as it is shown so an interrupted reply is not lost
+    for chunk in chunks:
+        received.append(chunk)
+        yield chunk
+
 
 def main() -> None:
+    script_started = time.perf_counter()
     st.set_page_config(page_title="AI Chat Assistant", page_icon="🤖")
     st.title("AI Chat Assistant 🤖")
-
-    # adding agent object to session state to persist across sessions
-    # stramlit reruns the script on every user interaction
-    if "agent" not in st.session_state:
-        st.session_state["agent"] = Agent()
+    mark_first_paint("agentchat", script_started)
+    # imports autogen_agentchat and builds a model client in the background on a cold start
+    start_warm_up(__file__)
 
     # initialize chat history
     if "messages" not in st.session_state:
         st.session_state["messages"] = []
 
+    # a reply cut off by a new message (which reruns the script mid-stream) keeps what arrived
+    interrupted = st.session_state.pop("partial_reply", None)
+    if interrupted is not None:
+        st.session_state["messages"].append(
+            {"role": "assistant", "content": "".join(interrupted) + " *(interrupted)*"}
+        )
+
+    # answers to questions queued while offline, synced in the background since the last run
+    if OFFLINE_QUEUE_PATH:
+        queue = get_offline_queue()
+        queued = st.session_state.setdefault("queued_queries", [])
+        for query_id in list(queued):
+            row = queue.get(query_id)
+            if row is not None and not row["synced"]:
+                continue
+            queued.remove(query_id)
+            if row is not None:
+                st.session_state["messages"].append(
+                    {"role": "assistant", "content": f"**Queued question #{query_id}:** {row['query']}\n\n{row['response']}"}
+                )
+
     # displying chat history messages
     for message in st.session_state["messages"]:
         with st.chat_message(message["role"]):
@@ -28,10 +108,31 @@ def main() -> None:
         with st.chat_message("user"):
             st.markdown(prompt)
 
-        response = asyncio.run(st.session_state["agent"].chat(prompt))
-        st.session_state["messages"].append({"role": "assistant", "content": response})
+        # stream on the shared long-lived loop so the model client's connections are reused;
+        # the agent cancels any reply still streaming when it receives this prompt
+        runner = get_session_runner(st.session_state)
+        partial = st.session_state["partial_reply"] = []
+        agent = get_agent()
+        cache_hits = agent.cache_hits
         with st.chat_message("assistant"):
-            st.markdown(response)
+            try:
+                response = st.write_stream(collect(runner.stream(agent.chat_stream(prompt)), partial))
+            except Exception as e:
+                from ship_queue import is_unreachable
+
+                if not OFFLINE_QUEUE_PATH or partial or not is_unreachable(e):
+                    raise
+                response = answer_offline(prompt)
+            else:
+                if OFFLINE_QUEUE_PATH:
+                    get_offline_queue().record(prompt, response)
+                if agent.cache_hits > cache_hits:
+                    st.caption("Answered from the response cache")
+                elif agent.prompt_tokens:
+                    # stays flat in long sessions: older turns are summarized (see memory.py)
+                    st.caption(f"Prompt: {agent.prompt_tokens[-1]} tokens")
+        del st.session_state["partial_reply"]
+        st.session_state["messages"].append({"role": "assistant", "content": response})
 
 
 if __name__ == "__main__":
@@ -0,0 +1,180 @@
+import asyncio
+from typing import Any, List, Mapping, Optional
+
+from autogen_core.model_context import ChatCompletionContext
+from autogen_core.models import (
+    AssistantMessage,
+    ChatCompletionClient,
+    FunctionExecutionResultMessage,
+    LLMMessage,
+    SystemMessage,
+    UserMessage,
+)
+
+DEFAULT_TOKEN_BUDGET = 3000
+DEFAULT_SUMMARY_WORDS = 150
+
+SUMMARY_INSTRUCTIONS = (
+    "You maintain a running summary of a conversation between a user and an AI assistant. "
+    "Merge the new messages into the existing summary. Keep facts, names, decisions, open "
+    "questions and user preferences; drop pleasantries. Reply with the updated summary only, "
+    "in at most {words} words."
+)
+
+
+class SummarizingChatCompletionContext(ChatCompletionContext):
+    """Model context bounded by a token budget: recent messages are kept verbatim and
+    older ones are folded into a rolling summary.
+
+    Messages that no longer fit are summarized by a background task, so a request never
+    waits for summarization; it uses the latest summary that has finished. Token counts
+    come from the model client's own tokenizer."""
+
+    def __init__(
+        self,
+        model_client: ChatCompletionClient,
+        token_budget: int = DEFAULT_TOKEN_BUDGET,
+        summary_client: Optional[ChatCompletionClient] = None,
+        summary_words: int = DEFAULT_SUMMARY_WORDS,
+    ) -> None:
+        super().__init__()
+        if token_budget <= 0:
+            raise ValueError("token_budget must be greater than 0.")
+        self._model_client = model_client
+        self._summary_client = summary_client or model_client
+        self._token_budget = token_budget
+        self._summary_words = summary_words
+        self._token_counts: List[int] = []  # tokens of each message in self._messages
+        self._summary = ""
+        self._summary_tokens = 0
+        self._unsummarized: List[LLMMessage] = []  # evicted, waiting for the summarizer
+        self._summary_task: Optional[asyncio.Task] = None
+        self.summaries_made = 0
+        self.summary_errors = 0
+        self.last_prompt_tokens = 0  # tokens of the last get_messages() result
+
+    @property
+    def summary(self) -> str:
+        return self._summary
+
+    @property
+    def window_tokens(self) -> int:
+        return sum(self._token_counts)
+
+    def _count(self, messages: List[LLMMessage]) -> int:
+        return self._model_client.count_tokens(messages)
+
+    async def add_message(self, message: LLMMessage) -> None:
+        self._messages.append(message)
+        self._token_counts.append(self._count([message]))
+        self._evict()
+
+    def _evict(self) -> None:
+        # the newest message always stays, even if it alone is over budget
+        budget = self._token_budget - self._summary_tokens
+        evicted = []
+        while len(self._messages) > 1 and (
+            sum(self._token_counts) > budget
+            # a tool result is meaningless without the call that precedes it
+            or isinstance(self._messages[0], FunctionExecutionResultMessage)
+        ):
+            evicted.append(self._messages.pop(0))
+            self._token_counts.pop(0)
+        if evicted:
+            self._unsummarized.extend(evicted)
+            if self._summary_task is None or self._summary_task.done():
+                self._summary_task = asyncio.get_running_loop().create_task(self._summarize())
+
+    async def _summarize(self) -> None:
+        while self._unsummarized:
+            batch, self._unsummarized = self._unsummarized, []
+            transcript = "\n".join(f"{_speaker(m)}: {_text(m)}" for m in batch)
+            prompt = f"Existing summary:\n{self._summary or '(none)'}\n\nNew messages:\n{transcript}"
+            try:
+                result = await self._summary_client.create(
+                    [
+                        SystemMessage(content=SUMMARY_INSTRUCTIONS.format(words=self._summary_words)),
+                        UserMessage(content=prompt, source="user"),
+                    ]
+                )
+            except Exception as e:
+                print(f"Conversation summary failed: {e}")
+                self.summary_errors += 1
+                self._unsummarized = batch + self._unsummarized
+                return
+            if isinstance(result.content, str):
+                self._summary = result.content.strip()
+                self._summary_tokens = self._count([self._summary_message()])
+                self.summaries_made += 1
+                self._evict()  # a longer summary leaves less room for the window
+
+    def _summary_message(self) -> SystemMessage:
+        return SystemMessage(content=f"Summary of the earlier conversation:\n{self._summary}")
+
+    async def get_messages(self) -> List[LLMMessage]:
+        messages = list(self._messages)
+        if self._summary:
+            messages.insert(0, self._summary_message())
+        self.last_prompt_tokens = self.window_tokens + self._summary_tokens
+        return messages
+
+    async def wait_for_summary(self) -> None:
+        """Wait for any summarization in progress (tests, shutdown)"""
+        while self._summary_task is not None and not self._summary_task.done():
+            await self._summary_task
+
+    async def _cancel_summary(self) -> None:
+        # A summary still running would write the old conversation back into a reset context
+        task, self._summary_task = self._summary_task, None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def clear(self) -> None:
+        await self._cancel_summary()
+        await super().clear()
+        self._token_counts = []
+        self._summary = ""
+        self._summary_tokens = 0
+        self._unsummarized = []
+
+    async def save_state(self) -> Mapping[str, Any]:
+        state = dict(await super().save_state())
+        state["summary"] = self._summary
+        return state
+
+    async def load_state(self, state: Mapping[str, Any]) -> None:
+        await self._cancel_summary()
+        await super().load_state(state)
+        self._token_counts = [self._count([m]) for m in self._messages]
+        self._summary = state.get("summary", "")
+        self._summary_tokens = self._count([self._summary_message()]) if self._summary else 0
+
+    def get_stats(self) -> dict:
+        return {
+            "window_messages": len(self._messages),
+            "window_tokens": self.window_tokens,
+            "summary_tokens": self._summary_tokens,
+            "last_prompt_tokens": self.last_prompt_tokens,
+            "summaries_made": self.summaries_made,
+            "pending_summary": len(self._unsummarized),
+        }
+
+
+def _speaker(message: LLMMessage) -> str:
+    if isinstance(message, AssistantMessage):
+        return "Assistant"
+    if isinstance(message, UserMessage):
+        return "User"
+    return type(message).__name__
+
+
+def _text(message: LLMMessage) -> str:
+    content = message.content
+    if isinstance(content, str):
+        return content
+    # tool calls and results, multimodal content
+    return " ".join(str(getattr(part, "content", part)) for part in content)
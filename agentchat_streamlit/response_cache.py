@@ -0,0 +1,225 @@
+import asyncio
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional, Set, Tuple
+
+DEFAULT_CACHE_PATH = "response_cache.db"
+DEFAULT_TTL = 24 * 3600.0  # seconds a cached reply stays valid
+DEFAULT_MAX_ENTRIES = 10000
+DEFAULT_USAGE_BATCH = 64  # lookups recorded in memory before they are written
+
+
+def normalize_prompt(prompt: str) -> str:
+    return re.sub(r"\s+", " ", prompt).strip().casefold()
+
+
+def model_config_hash(model_client) -> str:
+    """Identifies the model and its settings, so a config change never serves old replies"""
+    try:
+        config = model_client.dump_component().model_dump_json()
+    except Exception:
+        # clients without a component config (test fakes)
+        config = f"{type(model_client).__name__}:{json.dumps(model_client.model_info, sort_keys=True, default=str)}"
+    return hashlib.sha256(config.encode()).hexdigest()[:16]
+
+
+def cache_key(prompt: str, system_message: str, model_hash: str) -> str:
+    # only replies to an empty history are cached, so the history is not part of the key
+    text = json.dumps([normalize_prompt(prompt), system_message, model_hash])
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+class ResponseCache:
+    """Exact-match reply cache in SQLite, shared by every Streamlit worker process using
+    the same file. Entries expire after `ttl` seconds; beyond `max_entries` the least
+    recently used are evicted. Hit/miss counters are kept both per process and in the
+    database (totals across processes).
+
+    A lookup is a plain read: its hit/miss and last-used time are kept in memory and written
+    in one transaction with the next put, or once `usage_batch` lookups are waiting. On an
+    event loop use aget()/aput(), which run the SQLite calls in a worker thread."""
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, ttl: float = DEFAULT_TTL,
+                 max_entries: int = DEFAULT_MAX_ENTRIES, usage_batch: int = DEFAULT_USAGE_BATCH) -> None:
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.usage_batch = usage_batch
+        self._lock = threading.Lock()
+        # timeout: wait for another process's write instead of failing with "database is locked"
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                response TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                last_used REAL NOT NULL,
+                hits INTEGER NOT NULL DEFAULT 0
+            );
+            CREATE INDEX IF NOT EXISTS idx_responses_last_used ON responses(last_used);
+            CREATE TABLE IF NOT EXISTS cache_stats (
+                name TEXT PRIMARY KEY,
+                value INTEGER NOT NULL
+            );
+        """)
+        self.stats = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0, "expired": 0}
+        # lookups not yet written: key -> (last used, hits), expired keys, counter deltas
+        self._used: Dict[str, Tuple[float, int]] = {}
+        self._expired_keys: Set[str] = set()
+        self._unwritten = {"hits": 0, "misses": 0, "expired": 0}
+        self._lookups = 0
+
+    def _bump(self, **counts: int) -> None:
+        # caller holds self._lock and is inside a transaction
+        for name, value in counts.items():
+            self.stats[name] += value
+            self._write_count(name, value)
+
+    def _write_count(self, name: str, value: int) -> None:
+        if value:
+            self._conn.execute(
+                "INSERT INTO cache_stats (name, value) VALUES (?, ?) "
+                "ON CONFLICT(name) DO UPDATE SET value = value + excluded.value",
+                (name, value),
+            )
+
+    def _write_usage(self) -> None:
+        # caller holds self._lock and is inside a transaction
+        self._conn.executemany(
+            "UPDATE responses SET last_used = max(last_used, ?), hits = hits + ? WHERE key = ?",
+            [(last_used, hits, key) for key, (last_used, hits) in self._used.items()],
+        )
+        self._conn.executemany(
+            "DELETE FROM responses WHERE key = ? AND created_at < ?",
+            [(key, time.time() - self.ttl) for key in self._expired_keys],
+        )
+        for name, value in self._unwritten.items():
+            self._write_count(name, value)
+        self._used = {}
+        self._expired_keys = set()
+        self._unwritten = dict.fromkeys(self._unwritten, 0)
+        self._lookups = 0
+
+    def get(self, key: str) -> Optional[str]:
+        """Look up a reply with a read only; usage is recorded for the next write"""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None and now - row[1] > self.ttl:
+                self._expired_keys.add(key)
+                self.stats["expired"] += 1
+                self._unwritten["expired"] += 1
+                row = None
+            outcome = "hits" if row is not None else "misses"
+            self.stats[outcome] += 1
+            self._unwritten[outcome] += 1
+            if row is not None:
+                self._used[key] = (now, self._used.get(key, (now, 0))[1] + 1)
+            self._lookups += 1
+        return row[0] if row else None
+
+    def flush_usage(self) -> None:
+        """Write recorded lookups (hit counts, last-used times, expired entries) in one transaction"""
+        with self._lock:
+            if not self._lookups:
+                return
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._write_usage()
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def put(self, key: str, response: str) -> None:
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                # recorded lookups first, so eviction sees current last-used times
+                self._write_usage()
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, response, created_at, last_used) VALUES (?, ?, ?, ?)",
+                    (key, response, now, now),
+                )
+                self._bump(stores=1)
+                count = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+                if count > self.max_entries:
+                    expired = self._conn.execute(
+                        "DELETE FROM responses WHERE created_at < ?", (now - self.ttl,)
+                    ).rowcount
+                    excess = count - expired - self.max_entries
+                    evicted = 0
+                    if excess > 0:
+                        evicted = self._conn.execute(
+                            "DELETE FROM responses WHERE key IN "
+                            "(SELECT key FROM responses ORDER BY last_used LIMIT ?)",
+                            (excess,),
+                        ).rowcount
+                    self._bump(expired=expired, evictions=evicted)
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    async def aget(self, key: str) -> Optional[str]:
+        """get() in a worker thread, also writing recorded usage once a batch has built up"""
+        response = await asyncio.to_thread(self.get, key)
+        if self._lookups >= self.usage_batch:
+            await asyncio.to_thread(self.flush_usage)
+        return response
+
+    async def aput(self, key: str, response: str) -> None:
+        await asyncio.to_thread(self.put, key, response)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._used = {}
+            self._expired_keys = set()
+            self._unwritten = dict.fromkeys(self._unwritten, 0)
+            self._lookups = 0
+            self._conn.execute("DELETE FROM responses")
+            self._conn.execute("DELETE FROM cache_stats")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """This process's counters, plus totals across all processes sharing the file"""
+        self.flush_usage()
+        with self._lock:
+            shared = dict(self._conn.execute("SELECT name, value FROM cache_stats").fetchall())
+            entries = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        lookups = self.stats["hits"] + self.stats["misses"]
+        shared_lookups = shared.get("hits", 0) + shared.get("misses", 0)
+        return dict(
+            self.stats,
+            entries=entries,
+            hit_rate=self.stats["hits"] / lookups if lookups else 0.0,
+            shared_hits=shared.get("hits", 0),
+            shared_misses=shared.get("misses", 0),
+            shared_hit_rate=shared.get("hits", 0) / shared_lookups if shared_lookups else 0.0,
+        )
+
+    def close(self) -> None:
+        self.flush_usage()
+        self._conn.close()
+
+
+_response_caches: Dict[str, ResponseCache] = {}
+_response_cache_lock = threading.Lock()
+
+
+def get_response_cache(path: str = DEFAULT_CACHE_PATH) -> ResponseCache:
+    """Process-wide cache on `path` (one per file); other processes opening the same file
+    share its entries"""
+    path = os.path.abspath(path)
+    with _response_cache_lock:
+        if path not in _response_caches:
+            _response_caches[path] = ResponseCache(path)
+        return _response_caches[path]
@@ -0,0 +1,171 @@
+import asyncio
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Any, AsyncGenerator, Dict, Optional
+
+import yaml
+from autogen_core.models import ChatCompletionClient
+
+MODEL_CONFIG_PATH = "model_config.yml"
+# model requests in flight at once across all sessions in this process
+DEFAULT_MAX_CONCURRENT = 8
+
+
+class FairLimiter:
+    """Caps concurrent model requests; waiting sessions are served round-robin, so a
+    session with many queued requests gets one slot per round like everyone else.
+
+    Use it from a single event loop (the shared background loop in the app)."""
+
+    def __init__(self, max_concurrent: int = DEFAULT_MAX_CONCURRENT) -> None:
+        if max_concurrent <= 0:
+            raise ValueError("max_concurrent must be greater than 0.")
+        self.max_concurrent = max_concurrent
+        self.active = 0
+        self._queues: "OrderedDict[str, deque]" = OrderedDict()  # session -> waiting futures, in turn order
+        self.granted = 0
+        self.queued = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    @property
+    def waiting(self) -> int:
+        return sum(len(q) for q in self._queues.values())
+
+    async def acquire(self, session_id: str) -> None:
+        start = time.perf_counter()
+        if self.active < self.max_concurrent and not self._queues:
+            self.active += 1
+        else:
+            self.queued += 1
+            future = asyncio.get_running_loop().create_future()
+            self._queues.setdefault(session_id, deque()).append(future)
+            try:
+                await future
+            except asyncio.CancelledError:
+                if future.done() and not future.cancelled():
+                    self.release()  # the slot was handed over just as we were cancelled
+                else:
+                    self._discard(session_id, future)
+                raise
+        waited = time.perf_counter() - start
+        self.granted += 1
+        self.total_wait += waited
+        self.max_wait = max(self.max_wait, waited)
+
+    def release(self) -> None:
+        # hand the slot straight to the session at the front; it then goes to the back
+        while self._queues:
+            session_id, queue = next(iter(self._queues.items()))
+            future = queue.popleft()
+            if queue:
+                self._queues.move_to_end(session_id)
+            else:
+                del self._queues[session_id]
+            if not future.done():
+                future.set_result(None)
+                return
+        self.active -= 1
+
+    def _discard(self, session_id: str, future: asyncio.Future) -> None:
+        queue = self._queues.get(session_id)
+        if queue is not None and future in queue:
+            queue.remove(future)
+            if not queue:
+                del self._queues[session_id]
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "max_concurrent": self.max_concurrent,
+            "active": self.active,
+            "waiting": self.waiting,
+            "waiting_sessions": len(self._queues),
+            "granted": self.granted,
+            "queued": self.queued,
+            "avg_wait_ms": self.total_wait / self.granted * 1000 if self.granted else 0.0,
+            "max_wait_ms": self.max_wait * 1000,
+        }
+
+
+class SessionModelClient(ChatCompletionClient):
+    """One session's view of the shared client: requests go through the fair limiter
+    under the session's ID; everything else is delegated. Closing it leaves the shared
+    client open."""
+
+    def __init__(self, client: ChatCompletionClient, limiter: FairLimiter, session_id: str) -> None:
+        self._client = client
+        self._limiter = limiter
+        self.session_id = session_id
+
+    async def create(self, messages, **kwargs):
+        await self._limiter.acquire(self.session_id)
+        try:
+            return await self._client.create(messages, **kwargs)
+        finally:
+            self._limiter.release()
+
+    async def create_stream(self, messages, **kwargs) -> AsyncGenerator:
+        # the slot is held until the whole reply has streamed
+        await self._limiter.acquire(self.session_id)
+        try:
+            async for chunk in self._client.create_stream(messages, **kwargs):
+                yield chunk
+        finally:
+            self._limiter.release()
+
+    async def close(self) -> None:
+        pass
+
+    def actual_usage(self):
+        return self._client.actual_usage()
+
+    def total_usage(self):
+        return self._client.total_usage()
+
+    def count_tokens(self, messages, **kwargs) -> int:
+        return self._client.count_tokens(messages, **kwargs)
+
+    def remaining_tokens(self, messages, **kwargs) -> int:
+        return self._client.remaining_tokens(messages, **kwargs)
+
+    @property
+    def capabilities(self):
+        return self._client.capabilities
+
+    @property
+    def model_info(self):
+        return self._client.model_info
+
+    def dump_component(self):
+        return self._client.dump_component()
+
+
+_model_client: Optional[ChatCompletionClient] = None
+_limiter: Optional[FairLimiter] = None
+_shared_lock = threading.Lock()
+
+
+def get_model_client() -> ChatCompletionClient:
+    """Process-wide model client built from model_config.yml on first use, so sessions
+    share one connection pool"""
+    global _model_client
+    with _shared_lock:
+        if _model_client is None:
+            with open(MODEL_CONFIG_PATH, "r") as f:
+                model_config = yaml.safe_load(f)
+            _model_client = ChatCompletionClient.load_component(model_config)
+        return _model_client
+
+
+def get_limiter(max_concurrent: int = DEFAULT_MAX_CONCURRENT) -> FairLimiter:
+    """Process-wide limiter for model requests"""
+    global _limiter
+    with _shared_lock:
+        if _limiter is None:
+            _limiter = FairLimiter(max_concurrent)
+        return _limiter
+
+
+def session_client(session_id: str) -> SessionModelClient:
+    return SessionModelClient(get_model_client(), get_limiter(), session_id)
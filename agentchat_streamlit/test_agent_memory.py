@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Test script for the token-bounded chat memory with rolling summaries
+"""
+
+import asyncio
+import os
+import sys
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from autogen_core.models import CreateResult, RequestUsage
+from autogen_ext.models.replay import ReplayChatCompletionClient
+
+from agent import Agent
+
+
+class EchoClient(ReplayChatCompletionClient):
+    """Fake model: fixed-length replies, slow summaries, usage reported from the prompt it was sent"""
+
+    def __init__(self, reply_words=60, summary_delay=0.3):
+        super().__init__([])
+        self.reply_words = reply_words
+        self.summary_delay = summary_delay
+        self.summary_calls = 0
+
+    async def create(self, messages, **kwargs):
+        self.summary_calls += 1
+        await asyncio.sleep(self.summary_delay)
+        words = " ".join(messages[-1].content.split()[-120:])  # Keeps roughly the newest 120 words
+        return CreateResult(finish_reason="stop", content=words, cached=False,
+                            usage=RequestUsage(prompt_tokens=self.count_tokens(messages), completion_tokens=120))
+
+    async def create_stream(self, messages, **kwargs):
+        await asyncio.sleep(0.02)  # Time to first token
+        reply = " ".join(f"detail{i}" for i in range(self.reply_words))
+        for word in reply.split(" "):
+            yield word + " "
+        yield CreateResult(finish_reason="stop", content=reply, cached=False,
+                           usage=RequestUsage(prompt_tokens=self.count_tokens(messages), completion_tokens=self.reply_words))
+
+
+async def chat_turns(agent, turns):
+    latencies = []
+    for turn in range(turns):
+        start = time.perf_counter()
+        async for _ in agent.chat_stream(f"Question {turn}: " + "please explain more " * 10):
+            pass
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+async def test_agent_memory():
+    """Prompt size grows without bound by default but stays flat with a token budget"""
+    print("🧠 Testing Bounded Chat Memory")
+    print("=" * 60)
+
+    unbounded = Agent(model_client=EchoClient(), token_budget=None)
+    await chat_turns(unbounded, 40)
+    print(f"1. ✅ Unbounded history: prompt tokens {unbounded.prompt_tokens[0]} → {unbounded.prompt_tokens[-1]}")
+    assert unbounded.prompt_tokens[-1] > 40 * 80
+
+    client = EchoClient()
+    bounded = Agent(model_client=client, token_budget=600)
+    latencies = await chat_turns(bounded, 40)
+    late = bounded.prompt_tokens[10:]
+    assert max(late) <= 600 + 200, f"Prompt exceeded the budget: {max(late)}"
+    assert max(late) - min(late) < 250, "Prompt size is not flat"
+    print(f"2. ✅ Budget 600: prompt tokens {bounded.prompt_tokens[0]} → {bounded.prompt_tokens[-1]}, "
+          f"turns 10-40 stay within {min(late)}-{max(late)}")
+
+    # Summaries take 0.3 s each but no turn waited for one
+    assert max(latencies) < client.summary_delay, f"A turn waited for summarization: {max(latencies):.2f}s"
+    print(f"3. ✅ Slowest turn {max(latencies) * 1000:.0f} ms while {client.summary_calls} summaries ran in the background")
+
+    await bounded.memory.wait_for_summary()
+    messages = await bounded.memory.get_messages()
+    assert bounded.memory.summary and "Summary of the earlier conversation" in messages[0].content
+    assert "Question 39" in messages[-2].content
+    print(f"4. ✅ Context = summary + {len(messages) - 1} recent messages; stats: {bounded.memory.get_stats()}")
+
+    state = await bounded.memory.save_state()
+    restored = Agent(model_client=EchoClient(), token_budget=600)
+    await restored.memory.load_state(state)
+    assert restored.memory.summary == bounded.memory.summary
+    assert restored.memory.window_tokens == bounded.memory.window_tokens
+    print("5. ✅ Summary and window survive save_state/load_state")
+
+    # Resetting while a summary is still running leaves nothing of the old conversation
+    await chat_turns(bounded, 3)
+    assert bounded.memory._summary_task is not None and not bounded.memory._summary_task.done()
+    await bounded.memory.clear()
+    await asyncio.sleep(client.summary_delay * 2)
+    assert bounded.memory.summary == "" and await bounded.memory.get_messages() == []
+    print("6. ✅ clear() cancels the summary in flight; the reset context stays empty")
+
+    print("\n✅ Bounded memory test completed!")
+
+if __name__ == "__main__":
+    asyncio.run(test_agent_memory())
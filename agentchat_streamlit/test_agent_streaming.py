@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Test script for streaming chat replies through the shared background loop
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from autogen_core.models import CreateResult, RequestUsage
+from autogen_ext.models.replay import ReplayChatCompletionClient
+
+from agent import Agent
+from streamlit_loop import get_session_runner
+
+
+class SlowReplayClient(ReplayChatCompletionClient):
+    """Replay client that takes a while per token and honours the cancellation token, like a real model"""
+
+    def __init__(self, replies, delay):
+        super().__init__(replies)
+        self.delay = delay
+        self.cancelled_streams = 0
+
+    async def create_stream(self, messages, *, cancellation_token=None, **kwargs):
+        reply = self.chat_completions[self._current_index]
+        self._current_index += 1
+        words = reply.split(" ")
+        try:
+            for i, word in enumerate(words):
+                wait = asyncio.ensure_future(asyncio.sleep(self.delay))
+                if cancellation_token is not None:
+                    cancellation_token.link_future(wait)
+                await wait
+                yield word if i == len(words) - 1 else word + " "
+            yield CreateResult(finish_reason="stop", content=reply, cached=False,
+                               usage=RequestUsage(prompt_tokens=0, completion_tokens=len(words)))
+        except (asyncio.CancelledError, GeneratorExit):
+            self.cancelled_streams += 1
+            raise
+
+
+def test_agent_streaming():
+    """Chunks reach a synchronous consumer as they are generated, and a new prompt cancels the old reply"""
+    print("🌊 Testing Streaming Chat Replies")
+    print("=" * 60)
+
+    long_reply = " ".join(f"word{i}" for i in range(40))
+    client = SlowReplayClient([long_reply, long_reply, "Short answer after the interruption.", long_reply,
+                               "Final short answer."], delay=0.02)
+    agent = Agent(model_client=client)
+    runner = get_session_runner({})
+
+    start = time.perf_counter()
+    chunks, first_chunk_at = [], None
+    for chunk in runner.stream(agent.chat_stream("Tell me a long story")):
+        first_chunk_at = first_chunk_at or time.perf_counter() - start
+        chunks.append(chunk)
+    total = time.perf_counter() - start
+    assert "".join(chunks) == long_reply and len(chunks) == 40
+    assert first_chunk_at < total / 4, "Reply was not streamed"
+    print(f"1. ✅ {len(chunks)} chunks; first after {first_chunk_at * 1000:.0f} ms, full reply after {total * 1000:.0f} ms")
+
+    # The user sends a new message mid-stream: the script rerun drops the old consumer
+    old = runner.stream(agent.chat_stream("Another long story"))
+    received = [next(old) for _ in range(5)]
+    old.close()
+    reply = "".join(runner.stream(agent.chat_stream("Actually, just answer briefly")))
+    assert reply == "Short answer after the interruption.", reply
+    time.sleep(0.1)
+    assert client.cancelled_streams == 1, "The interrupted model call kept running"
+    print(f"2. ✅ Interrupted after {len(received)} chunks; model call cancelled; new reply: {reply!r}")
+
+    # The old script thread is still reading when the new prompt starts: the agent cancels its reply
+    old_chunks, old_error = [], []
+
+    def read_old_reply():
+        try:
+            for chunk in runner.stream(agent.chat_stream("One more long story")):
+                old_chunks.append(chunk)
+        except Exception as e:
+            old_error.append(e)
+
+    reader = threading.Thread(target=read_old_reply)
+    reader.start()
+    time.sleep(0.2)
+    reply = "".join(runner.stream(agent.chat_stream("Stop, answer this instead")))
+    reader.join(timeout=5)
+    assert not reader.is_alive() and old_error and 0 < len(old_chunks) < 40, (old_chunks, old_error)
+    assert reply == "Final short answer." and client.cancelled_streams == 2
+    print(f"3. ✅ Reply still being read was cancelled after {len(old_chunks)} chunks "
+          f"({type(old_error[0]).__name__}); new reply: {reply!r}")
+
+    print("\n✅ Streaming chat test completed!")
+
+
+if __name__ == "__main__":
+    test_agent_streaming()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Test script for the offline batch evaluation runner
+"""
+
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from batch_eval import FakeClient, percentile, run_batch
+
+async def test_batch_eval():
+    """Throughput scales with concurrency offline; timeouts and missing recordings are reported per request"""
+    print("📋 Testing Batch Evaluation Runner")
+    print("=" * 60)
+
+    assert percentile([float(v) for v in range(1, 101)], 50) == 50.0
+    assert percentile([float(v) for v in range(1, 101)], 99) == 99.0
+    print("1. ✅ Nearest-rank percentiles")
+
+    prompts = [{"id": i, "prompt": f"Question {i}"} for i in range(64)]
+    client = FakeClient(latency=0.05)
+    serial = await run_batch(prompts, client, concurrency=1, limit=64)
+    parallel = await run_batch(prompts, client, concurrency=16, limit=64)
+    assert serial["summary"]["ok"] == parallel["summary"]["ok"] == 64
+    assert parallel["results"][5]["response"] == "Echo: Question 5"
+    speedup = parallel["summary"]["throughput_rps"] / serial["summary"]["throughput_rps"]
+    assert speedup > 8, f"Concurrency did not scale: {speedup:.1f}x"
+    print(f"2. ✅ 64 prompts: {serial['summary']['throughput_rps']} req/s serial, "
+          f"{parallel['summary']['throughput_rps']} req/s at concurrency 16 ({speedup:.1f}x), "
+          f"p95 {parallel['summary']['p95_ms']} ms")
+
+    # The app's fair limiter still caps model requests however many prompts are in flight
+    limited = await run_batch(prompts, client, concurrency=16, limit=4)
+    assert limited["summary"]["throughput_rps"] < parallel["summary"]["throughput_rps"] / 2
+    print(f"3. ✅ Limiter at 4 caps throughput at {limited['summary']['throughput_rps']} req/s")
+
+    slow = await run_batch(prompts[:8], FakeClient(latency=0.5), concurrency=8, timeout=0.1)
+    assert slow["summary"]["timeouts"] == 8 and all(r["latency_ms"] < 300 for r in slow["results"])
+    replay = await run_batch(prompts[:4], FakeClient(latency=0, recordings={"Question 0": "Zero"}), concurrency=2)
+    assert replay["results"][0]["response"] == "Zero" and replay["summary"]["errors"] == 3
+    print("4. ✅ Timeouts and unrecorded prompts are reported per request without stopping the batch")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        prompts_path = os.path.join(tmp, "prompts.jsonl")
+        with open(prompts_path, "w") as f:
+            f.writelines(json.dumps({"prompt": f"Prompt {i}"}) + "\n" for i in range(20))
+        output = os.path.join(tmp, "results.jsonl")
+        recordings = os.path.join(tmp, "recordings.json")
+        script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "batch_eval.py")
+        subprocess.run([sys.executable, script, prompts_path, "-o", output, "--client", "fake",
+                        "--latency", "0.01", "--record", recordings], check=True, capture_output=True)
+        proc = subprocess.run([sys.executable, script, prompts_path, "-o", output, "--client", "replay",
+                               "--recordings", recordings, "--sweep", "1,8"], check=True, capture_output=True, text=True)
+        with open(output) as f:
+            lines = [json.loads(line) for line in f]
+        assert len(lines) == 22 and lines[0]["response"] == "Echo: Prompt 0"
+        assert [l["summary"]["concurrency"] for l in lines[20:]] == [1, 8]
+        print(f"5. ✅ CLI record → replay sweep:\n{proc.stdout.rstrip()}")
+
+    print("\n✅ Batch evaluation test completed!")
+
+if __name__ == "__main__":
+    asyncio.run(test_batch_eval())
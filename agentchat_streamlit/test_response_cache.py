@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Test script for the shared SQLite response cache
+"""
+
+import asyncio
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from autogen_core.models import CreateResult, RequestUsage
+from autogen_ext.models.replay import ReplayChatCompletionClient
+
+from agent import Agent
+from response_cache import ResponseCache, cache_key, get_response_cache
+
+
+class CountingClient(ReplayChatCompletionClient):
+    """Fake model that answers after `delay` seconds and counts its calls"""
+
+    def __init__(self, delay=0.2):
+        super().__init__([])
+        self.delay = delay
+        self.calls = 0
+
+    async def create_stream(self, messages, **kwargs):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        reply = f"Answer to: {messages[-1].content}"
+        yield reply
+        yield CreateResult(finish_reason="stop", content=reply, cached=False,
+                           usage=RequestUsage(prompt_tokens=self.count_tokens(messages), completion_tokens=3))
+
+
+def fill_from_process(path, worker):
+    cache = ResponseCache(path)
+    for i in range(200):
+        cache.put(cache_key(f"question {worker}-{i}", "system", "model"), f"reply {worker}-{i}")
+        cache.get(cache_key(f"question {worker}-{i}", "system", "model"))
+    cache.close()
+
+
+async def test_response_cache():
+    """Repeated onboarding prompts are answered from the cache across sessions and processes"""
+    print("🗄️ Testing Response Cache")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "cache.db")
+        cache = ResponseCache(path)
+        client = CountingClient()
+
+        first = Agent(model_client=client, cache=cache, stateless=True)
+        start = time.perf_counter()
+        reply = await first.chat("How do I reset my password?")
+        miss_ms = (time.perf_counter() - start) * 1000
+
+        latencies = []
+        for i in range(20):
+            agent = Agent(model_client=client, cache=cache, stateless=True)
+            start = time.perf_counter()
+            assert await agent.chat("  how do I reset my   password? ") == reply
+            latencies.append((time.perf_counter() - start) * 1000)
+        latencies.sort()
+        assert client.calls == 1
+        print(f"1. ✅ 1 model call for 21 sessions; miss {miss_ms:.0f} ms, median hit {latencies[10]:.2f} ms")
+
+        # Stateful session: only the opening prompt is cacheable, and the hit joins its history
+        session = Agent(model_client=client, cache=cache)
+        await session.chat("How do I reset my password?")
+        await session.chat("How do I reset my password?")
+        history = await session.agent.model_context.get_messages()
+        assert client.calls == 2 and len(history) == 4
+        print(f"2. ✅ Stateful session: cached opener recorded in history, follow-up went to the model")
+
+        expiring = ResponseCache(path, ttl=0.05)
+        expiring.put("k", "v")
+        assert expiring.get("k") == "v"
+        time.sleep(0.1)
+        assert expiring.get("k") is None
+        print("3. ✅ Entries expire after the TTL")
+
+        bounded = ResponseCache(os.path.join(tmp, "bounded.db"), max_entries=50)
+        for i in range(60):
+            bounded.put(f"key{i}", f"value{i}")
+            if i >= 1:
+                bounded.get("key0")  # Keep the first entry hot
+        stats = bounded.get_stats()
+        assert stats['entries'] == 50 and stats['evictions'] == 10
+        assert bounded.get("key0") == "value0" and bounded.get("key1") is None
+        print(f"4. ✅ Size bound holds at {stats['entries']} entries; least recently used evicted first")
+
+        processes = [multiprocessing.Process(target=fill_from_process, args=(path, w)) for w in range(4)]
+        for p in processes:
+            p.start()
+        for p in processes:
+            p.join()
+        assert all(p.exitcode == 0 for p in processes)
+        stats = cache.get_stats()
+        assert cache.get(cache_key("question 3-199", "system", "model")) == "reply 3-199"
+        assert stats['shared_hits'] >= 800
+        print(f"5. ✅ 4 processes wrote and read concurrently; stats: {stats}")
+
+        # Lookups only read: a hit is served while another connection holds the write lock
+        blocker = ResponseCache(path)
+        blocker._conn.execute("BEGIN IMMEDIATE")
+        loop_ticks = 0
+
+        async def tick():
+            nonlocal loop_ticks
+            while True:
+                await asyncio.sleep(0.001)
+                loop_ticks += 1
+
+        ticker = asyncio.create_task(tick())
+        start = time.perf_counter()
+        assert await cache.aget(cache_key("question 2-5", "system", "model")) == "reply 2-5"
+        hit_ms = (time.perf_counter() - start) * 1000
+        ticks_before = loop_ticks
+        put = asyncio.create_task(cache.aput("written later", "value"))
+        await asyncio.sleep(0.2)
+        assert not put.done() and loop_ticks > ticks_before + 20  # the loop kept running meanwhile
+        blocker._conn.execute("COMMIT")
+        await put
+        ticker.cancel()
+        blocker.close()
+        assert cache.get("written later") == "value"
+        print(f"6. ✅ Hit served in {hit_ms:.1f} ms under another writer's lock; "
+              f"a blocked put waited off the event loop")
+
+        other = os.path.join(tmp, "other.db")
+        assert get_response_cache(path) is get_response_cache(path)
+        assert get_response_cache(other).path == os.path.abspath(other) != get_response_cache(path).path
+        print("7. ✅ get_response_cache keeps one cache per file")
+
+    print("\n✅ Response cache test completed!")
+
+if __name__ == "__main__":
+    asyncio.run(test_response_cache())
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Test script for the process-wide model client and fair request limiter
+"""
+
+import asyncio
+import os
+import sys
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from autogen_core.models import CreateResult, RequestUsage
+from autogen_ext.models.replay import ReplayChatCompletionClient
+
+import shared_client
+from agent import Agent
+from shared_client import FairLimiter, SessionModelClient
+
+
+class SlowClient(ReplayChatCompletionClient):
+    """Fake model that takes `delay` seconds per request and tracks how many run at once"""
+
+    def __init__(self, delay=0.05):
+        super().__init__([])
+        self.delay = delay
+        self.in_flight = 0
+        self.peak = 0
+
+    async def create_stream(self, messages, **kwargs):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            yield "ok"
+            yield CreateResult(finish_reason="stop", content="ok", cached=False,
+                               usage=RequestUsage(prompt_tokens=self.count_tokens(messages), completion_tokens=1))
+        finally:
+            self.in_flight -= 1
+
+
+async def timed_chat(agent, prompt, start):
+    async for _ in agent.chat_stream(prompt):
+        pass
+    return time.perf_counter() - start
+
+
+async def test_shared_client():
+    """Sessions share one client; a chatty session cannot starve the others"""
+    print("🤝 Testing Shared Model Client")
+    print("=" * 60)
+
+    client = SlowClient()
+    shared_client._model_client = client  # Stands in for the client built from model_config.yml
+    shared_client._limiter = FairLimiter(max_concurrent=2)
+
+    agents = [Agent(session_id=f"user{i}", token_budget=None) for i in range(5)]
+    assert all(a.agent._model_client._client is client for a in agents)
+    print("1. ✅ Five sessions, one model client (each session keeps only its own conversation)")
+
+    # user0 fires 20 requests at once (one agent per request, as parallel tabs would)
+    start = time.perf_counter()
+    chatty = [Agent(session_id="user0", token_budget=None) for _ in range(20)]
+    burst = [asyncio.create_task(timed_chat(a, f"spam {i}", start)) for i, a in enumerate(chatty)]
+    await asyncio.sleep(0.01)
+    others = [asyncio.create_task(timed_chat(a, "hello", start)) for a in agents[1:]]
+    other_times = await asyncio.gather(*others)
+    burst_times = await asyncio.gather(*burst)
+
+    assert client.peak <= 2, f"Limiter allowed {client.peak} concurrent requests"
+    # FIFO would make the others wait for the whole burst (~0.5s); round-robin serves them in the first rounds
+    assert max(other_times) < 0.35, f"Other sessions were starved: {max(other_times):.2f}s"
+    print(f"2. ✅ Peak {client.peak} requests in flight; other sessions done after "
+          f"{max(other_times) * 1000:.0f} ms while the burst finished after {max(burst_times) * 1000:.0f} ms")
+    print(f"   Limiter: {shared_client.get_limiter().get_stats()}")
+
+    # A cancelled waiter gives up its place without leaking a slot
+    limiter = FairLimiter(max_concurrent=1)
+    session = SessionModelClient(client, limiter, "solo")
+    await limiter.acquire("holder")
+    waiter = asyncio.create_task(limiter.acquire("solo"))
+    await asyncio.sleep(0.01)
+    waiter.cancel()
+    await asyncio.gather(waiter, return_exceptions=True)
+    limiter.release()
+    assert limiter.active == 0 and limiter.waiting == 0
+    await session.close()
+    print("3. ✅ Cancelled waiters leave no queued entry or held slot; closing a session keeps the shared client")
+
+    print("\n✅ Shared client test completed!")
+
+if __name__ == "__main__":
+    asyncio.run(test_shared_client())
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Test script for the offline query queue on ship_queue.db
+"""
+
+import asyncio
+import os
+import shutil
+import sys
+import tempfile
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ship_queue import DEFAULT_QUEUE_PATH, ShipQueue, SyncWorker, ask
+
+async def test_ship_queue():
+    """Prompts queue while offline and drain in batched transactions once the model is back"""
+    print("🚢 Testing Offline Query Queue")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "ship_queue.db")
+        shutil.copy(DEFAULT_QUEUE_PATH, path)  # The schema the repo ships with
+        queue = ShipQueue(path)
+        shipped_backlog = queue.pending_count()  # Rows already waiting in the shipped file
+        mode = queue._conn.execute("PRAGMA journal_mode").fetchone()[0]
+        indexes = [row[1] for row in queue._conn.execute("PRAGMA index_list(queries)")]
+        assert mode == "wal" and "idx_queries_synced" in indexes
+        print(f"1. ✅ Opened the shipped queries table in {mode} mode with indexes {indexes}")
+
+        online = True
+        in_flight = peak = calls = 0
+
+        async def answer(query):
+            nonlocal in_flight, peak, calls
+            calls += 1
+            if not online:
+                raise ConnectionError("model unreachable")
+            if query.startswith("Poison"):
+                raise ValueError("prompt rejected by the model")
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return f"Answer: {query}"
+
+        assert (await ask(queue, answer, "What is the weather?"))[:2] == ("online", "Answer: What is the weather?")
+        online = False
+        status, response, _ = await ask(queue, answer, "What is the weather?")
+        assert (status, response) == ("cached", "Answer: What is the weather?")
+        status, response, query_id = await ask(queue, answer, "Where is the nearest port?")
+        assert status == "queued" and response is None and not queue.get(query_id)["synced"]
+        print(f"2. ✅ Online answer recorded; offline repeat served from cache; new prompt queued as #{query_id}")
+
+        for i in range(999 - shipped_backlog):
+            queue.enqueue(f"Queued question {i}")
+        worker = SyncWorker(queue, answer, batch_size=100, concurrency=8, interval=0.01)
+        calls = 0
+        assert await worker.drain_once() == 0 and queue.pending_count() == 1000 and calls == 1
+        print(f"3. ✅ Still offline: {queue.pending_count()} rows stay unsynced after a single probe call")
+
+        online = True
+        start = time.perf_counter()
+        task = asyncio.create_task(worker.run())
+        while queue.pending_count():
+            await asyncio.sleep(0.01)
+        elapsed = time.perf_counter() - start
+        worker.stop()
+        task.cancel()
+        stats = worker.get_stats()
+        assert stats['synced'] == 1000 and stats['batches'] == 10 and peak <= 8
+        assert queue.get(query_id)["response"] == "Answer: Where is the nearest port?"
+        print(f"4. ✅ Drained 1000 rows in {stats['batches']} batch transactions, {elapsed:.2f}s, "
+              f"at most {peak} model calls at once; {stats['rows_per_second']:.0f} rows/s")
+        print(f"   Stats: {stats}")
+
+        # Rows the model keeps rejecting are parked instead of blocking the queue
+        poison = [queue.enqueue(f"Poison {i}") for i in range(worker.batch_size)]
+        later = queue.enqueue("Queued after the poison rows")
+        for _ in range(queue.max_attempts):
+            await worker.drain_once()
+        assert queue.parked_count() == len(poison) and queue.pending_count() == 1
+        parked = queue.get(poison[0])
+        assert parked['parked'] and parked['attempts'] == queue.max_attempts
+        assert parked['last_error'] == "ValueError: prompt rejected by the model"
+        assert await worker.drain_once() == 1 and queue.get(later)['synced'] and queue.pending_count() == 0
+        print(f"5. ✅ {queue.parked_count()} permanently failing rows parked after {queue.max_attempts} attempts; "
+              f"the row queued behind them synced")
+        queue.close()
+
+    print("\n✅ Offline query queue test completed!")
+
+if __name__ == "__main__":
+    asyncio.run(test_ship_queue())
@@ -0,0 +1,14 @@
+"""
+Warm-up hook for the chat app, run at server boot by `python cold_start.py serve` or in a
+background thread on the first script run. Each step is timed by cold_start.
+"""
+
+import importlib
+
+
+def warm_up(step):
+    step("import autogen_agentchat", lambda: [importlib.import_module(m) for m in (
+        "autogen_agentchat.agents", "autogen_agentchat.messages", "autogen_core.models")])
+    step("start background loop", lambda: importlib.import_module("streamlit_loop").get_background_loop())
+    # Builds the shared model client (and imports its provider package, e.g. openai) once per process
+    step("load model client", lambda: importlib.import_module("shared_client").get_model_client())
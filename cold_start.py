@@ -0,0 +1,166 @@
+"""
+Cold-start instrumentation and warm-up for the Streamlit apps.
+
+Heavy modules (plotly, pandas, autogen) are imported where they are first used, and each
+app renders its first elements before loading the rest. Whatever is still expensive is
+moved off the first user's path by a warm-up hook: a `warmup.py` next to the app defines
+`warm_up()`, which either runs at server boot through the launcher below or, under a plain
+`streamlit run`, in a background thread started by the first script run.
+
+Usage:
+    python cold_start.py profile game_play/arctic_wargame_app.py    # import profile + first paint
+    python cold_start.py serve game_play/arctic_wargame_app.py [streamlit args...]
+"""
+
+import argparse
+import ast
+import importlib.util
+import json
+import os
+import re
+import subprocess
+import sys
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+WARMED_ENV = "COLD_START_WARMED_APP"
+
+first_paint: Dict[str, float] = {}  # App name -> seconds from script start to first element, first run only
+warm_up_timings: Dict[str, float] = {}  # Step -> seconds spent in the warm-up hook
+_warm_up_thread: Optional[threading.Thread] = None
+_warm_up_lock = threading.Lock()
+
+
+def mark_first_paint(app: str, script_started: float) -> None:
+    """Record how long the first run in this process took to emit its first element"""
+    first_paint.setdefault(app, time.perf_counter() - script_started)
+
+
+def run_warm_up(app_path: str) -> Dict[str, float]:
+    """Import the app's warmup.py and run its warm_up(), timing each step it reports"""
+    app_dir = os.path.dirname(os.path.abspath(app_path))
+    warmup_path = os.path.join(app_dir, "warmup.py")
+    if not os.path.exists(warmup_path):
+        return {}
+    if app_dir not in sys.path:
+        sys.path.insert(0, app_dir)
+    spec = importlib.util.spec_from_file_location(f"warmup_{os.path.basename(app_dir)}", warmup_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    start = time.perf_counter()
+    module.warm_up(_record_step)
+    warm_up_timings["total"] = time.perf_counter() - start
+    return dict(warm_up_timings)
+
+
+def _record_step(name: str, fn: Callable) -> None:
+    start = time.perf_counter()
+    try:
+        fn()
+    except Exception as e:
+        print(f"Warm-up step '{name}' failed: {e}")
+    warm_up_timings[name] = time.perf_counter() - start
+
+
+def start_warm_up(app_path: str) -> threading.Thread:
+    """Run the warm-up hook once per process in a daemon thread (no-op if already started)"""
+    global _warm_up_thread
+    with _warm_up_lock:
+        if _warm_up_thread is None:
+            # Nothing left to do if `cold_start.py serve` already warmed this process at boot
+            warmed = os.environ.get(WARMED_ENV) == os.path.abspath(app_path)
+            _warm_up_thread = threading.Thread(target=None if warmed else run_warm_up, args=(app_path,),
+                                               name="warm-up", daemon=True)
+            _warm_up_thread.start()
+        return _warm_up_thread
+
+
+def top_level_imports(app_path: str) -> List[str]:
+    """Modules an app script imports at module level"""
+    with open(app_path, "r") as f:
+        tree = ast.parse(f.read())
+    modules = []
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            modules.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and node.level == 0:
+            modules.append(node.module)
+    return list(dict.fromkeys(modules))
+
+
+def profile_imports(modules: List[str], path: List[str], top: int = 15) -> List[Tuple[str, float]]:
+    """Cumulative import time (ms) per module in a fresh interpreter, largest first"""
+    code = f"import sys; sys.path[:0] = {path!r}\n" + "\n".join(f"import {m}" for m in modules)
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True)
+    timings = []
+    for line in proc.stderr.splitlines():
+        match = re.match(r"import time:\s+\d+ \|\s+(\d+) \|( *)(\S+)", line)
+        if match and len(match.group(2)) <= 2:  # Only modules imported directly by the script
+            timings.append((match.group(3), int(match.group(1)) / 1000))
+    return sorted(timings, key=lambda t: -t[1])[:top]
+
+
+def measure_app(app_path: str) -> Dict[str, float]:
+    """Run an app twice with Streamlit's AppTest in a fresh interpreter: cold and warm timings"""
+    root = os.path.dirname(os.path.abspath(__file__))
+    code = f"""
+import json, sys, time
+sys.path[:0] = [{root!r}, {os.path.dirname(os.path.abspath(app_path))!r}]
+from streamlit.testing.v1 import AppTest
+import cold_start
+timings = {{}}
+for run in ("first_run", "second_run"):
+    start = time.perf_counter()
+    AppTest.from_file({os.path.abspath(app_path)!r}, default_timeout=300).run()
+    timings[run] = time.perf_counter() - start
+timings.update({{"first_paint:" + k: v for k, v in cold_start.first_paint.items()}})
+print("TIMINGS " + json.dumps(timings))
+"""
+    proc = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    for line in proc.stdout.splitlines():
+        if line.startswith("TIMINGS "):
+            return json.loads(line[len("TIMINGS "):])
+    raise RuntimeError(f"Could not measure {app_path}: {proc.stderr[-500:]}")
+
+
+def profile(app_path: str) -> None:
+    root = os.path.dirname(os.path.abspath(__file__))
+    app_dir = os.path.dirname(os.path.abspath(app_path))
+    modules = [m for m in top_level_imports(app_path) if m != "streamlit"]
+    print(f"📦 Module-level imports of {app_path} (cumulative ms, fresh interpreter, streamlit excluded)")
+    for module, ms in profile_imports(modules, [root, app_dir]):
+        print(f"   {ms:8.1f}  {module}")
+    timings = measure_app(app_path)
+    print("⏱️ AppTest timings (seconds)")
+    for name, seconds in timings.items():
+        print(f"   {seconds:8.3f}  {name}")
+
+
+def serve(app_path: str, streamlit_args: List[str]) -> None:
+    """Warm up in this process, then hand it over to `streamlit run`"""
+    timings = run_warm_up(app_path)
+    os.environ[WARMED_ENV] = os.path.abspath(app_path)
+    print("🔥 Warm-up done: " + ", ".join(f"{k} {v * 1000:.0f} ms" for k, v in timings.items()))
+    from streamlit.web import cli as stcli
+    sys.argv = ["streamlit", "run", app_path] + streamlit_args
+    sys.exit(stcli.main())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cold-start profiling and warm-up for the Streamlit apps")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    profile_parser = subparsers.add_parser("profile", help="Import-time profile and first-paint timings")
+    profile_parser.add_argument("app")
+    serve_parser = subparsers.add_parser("serve", help="Run the app's warm-up hook, then start Streamlit")
+    serve_parser.add_argument("app")
+    args, extra = parser.parse_known_args()
+
+    if args.command == "profile":
+        profile(args.app)
+    else:
+        serve(args.app, extra)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,14 @@
 import asyncio
 import random
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 from enum import Enum
 from pydantic import BaseModel, Field
 
+from game_events import EventLog
+
+if TYPE_CHECKING:
+    from policy_distill import DecisionLogger, DistilledPolicy
+
 from autogen_core import (
     CancellationToken,
     DefaultTopicId,
@@ -35,9 +40,10 @@ class GameState(BaseModel):
     russia_resources: Dict[str, int] = Field(default_factory=lambda: {"military": 8, "economic": 5, "political": 7, "information": 6})
     china_resources: Dict[str, int] = Field(default_factory=lambda: {"military": 6, "economic": 9, "political": 6, "information": 7})
     us_resources: Dict[str, int] = Field(default_factory=lambda: {"military": 9, "economic": 7, "political": 8, "information": 8})
-    recent_events: List[str] = Field(default_factory=list)
-    adversary_reactions: List[str] = Field(default_factory=list)
-    tension_changes: List[str] = Field(default_factory=list)
+    # Event logs render their entries when read; see game_events
+    recent_events: EventLog = Field(default_factory=EventLog)
+    adversary_reactions: EventLog = Field(default_factory=EventLog)
+    tension_changes: EventLog = Field(default_factory=EventLog)
 
 class GameStateMessage(BaseModel):
     game_state: GameState
@@ -148,20 +154,28 @@ class ArcticGameMaster(RoutedAgent):
 
 @type_subscription("arctic_game")
 class RussianAgent(RoutedAgent):
-    def __init__(self, model_client: ChatCompletionClient):
+    def __init__(self, model_client: ChatCompletionClient, decision_logger: Optional["DecisionLogger"] = None,
+                 policy: Optional["DistilledPolicy"] = None):
         super().__init__("Russian Federation Arctic Strategy Agent")
         self._model_client = model_client
         self._name = "Russia"
+        self._decision_logger = decision_logger  # Records successful LLM decisions for distillation
+        self._policy = policy  # Distilled local policy used when no model is available
         
     @message_handler
     async def handle_game_state(self, message: GameStateMessage, ctx: MessageContext) -> None:
-        action = await self._decide_action(message.game_state)
+        action = await self.decide_action(message.game_state)
         if action:
             await self.publish_message(action, topic_id=DefaultTopicId("arctic_game"))
     
-    async def _decide_action(self, game_state: GameState) -> Optional[ActionMessage]:
+    async def decide_action(self, game_state: GameState) -> Optional[ActionMessage]:
+        """Choose this nation's move for a game state (the engine asks for it directly on live turns)"""
         if not self._model_client:
-            # Fallback to simple decision if no model available
+            # Use the distilled policy if one was trained, otherwise fall back to simple decision
+            if self._policy:
+                action = self._policy.decide(game_state, self._get_own_resources(game_state))
+                if action:
+                    return action
             return await self._fallback_decision(game_state)
         
         # Create Putin advisor prompt
@@ -235,7 +249,7 @@ Cost should not exceed available resources. Be aggressive and strategic - you ar
                 # Validate the action can be afforded
                 resources = game_state.russia_resources
                 if self._can_afford_action(resources, action_data.get("cost", {})):
-                    return ActionMessage(
+                    action = ActionMessage(
                         agent=self._name,
                         action_type=ActionType(action_data["action_type"]),
                         action_name=action_data["action_name"],
@@ -243,6 +257,9 @@ Cost should not exceed available resources. Be aggressive and strategic - you ar
                         description=action_data["description"],
                         cost=action_data["cost"]
                     )
+                    if self._decision_logger:
+                        self._decision_logger.log(self._name, game_state, action)
+                    return action
             except (json.JSONDecodeError, KeyError, ValueError) as e:
                 print(f"Error parsing Russian agent response: {e}")
                 return await self._fallback_decision(game_state)
@@ -253,6 +270,9 @@ Cost should not exceed available resources. Be aggressive and strategic - you ar
         
         return None
     
+    def _get_own_resources(self, game_state: GameState) -> Dict[str, int]:
+        return game_state.russia_resources
+    
     def _can_afford_action(self, resources: Dict[str, int], costs: Dict[str, int]) -> bool:
         """Check if Russia can afford the proposed action"""
         for resource, cost in costs.items():
@@ -303,20 +323,28 @@ Cost should not exceed available resources. Be aggressive and strategic - you ar
 
 @type_subscription("arctic_game")
 class ChineseAgent(RoutedAgent):
-    def __init__(self, model_client: ChatCompletionClient):
+    def __init__(self, model_client: ChatCompletionClient, decision_logger: Optional["DecisionLogger"] = None,
+                 policy: Optional["DistilledPolicy"] = None):
         super().__init__("Chinese Arctic Economic Strategy Agent")
         self._model_client = model_client
         self._name = "China"
+        self._decision_logger = decision_logger  # Records successful LLM decisions for distillation
+        self._policy = policy  # Distilled local policy used when no model is available
         
     @message_handler
     async def handle_game_state(self, message: GameStateMessage, ctx: MessageContext) -> None:
-        action = await self._decide_action(message.game_state)
+        action = await self.decide_action(message.game_state)
         if action:
             await self.publish_message(action, topic_id=DefaultTopicId("arctic_game"))
     
-    async def _decide_action(self, game_state: GameState) -> Optional[ActionMessage]:
+    async def decide_action(self, game_state: GameState) -> Optional[ActionMessage]:
+        """Choose this nation's move for a game state (the engine asks for it directly on live turns)"""
         if not self._model_client:
-            # Fallback to simple decision if no model available
+            # Use the distilled policy if one was trained, otherwise fall back to simple decision
+            if self._policy:
+                action = self._policy.decide(game_state, self._get_own_resources(game_state))
+                if action:
+                    return action
             return await self._fallback_decision(game_state)
         
         # Create Xi Jinping advisor prompt
@@ -389,7 +417,7 @@ Cost should not exceed available resources. Be creative and strategic - you are
                 # Validate the action can be afforded
                 resources = game_state.china_resources
                 if self._can_afford_action(resources, action_data.get("cost", {})):
-                    return ActionMessage(
+                    action = ActionMessage(
                         agent=self._name,
                         action_type=ActionType(action_data["action_type"]),
                         action_name=action_data["action_name"],
@@ -397,6 +425,9 @@ Cost should not exceed available resources. Be creative and strategic - you are
                         description=action_data["description"],
                         cost=action_data["cost"]
                     )
+                    if self._decision_logger:
+                        self._decision_logger.log(self._name, game_state, action)
+                    return action
             except (json.JSONDecodeError, KeyError, ValueError) as e:
                 print(f"Error parsing Chinese agent response: {e}")
                 return await self._fallback_decision(game_state)
@@ -407,6 +438,9 @@ Cost should not exceed available resources. Be creative and strategic - you are
         
         return None
     
+    def _get_own_resources(self, game_state: GameState) -> Dict[str, int]:
+        return game_state.china_resources
+    
     def _can_afford_action(self, resources: Dict[str, int], costs: Dict[str, int]) -> bool:
         """Check if China can afford the proposed action"""
         for resource, cost in costs.items():
@@ -463,11 +497,11 @@ class USAgent(RoutedAgent):
         
     @message_handler
     async def handle_game_state(self, message: GameStateMessage, ctx: MessageContext) -> None:
-        action = await self._decide_action(message.game_state)
+        action = await self.decide_action(message.game_state)
         if action:
             await self.publish_message(action, topic_id=DefaultTopicId("arctic_game"))
     
-    async def _decide_action(self, game_state: GameState) -> Optional[ActionMessage]:
+    async def decide_action(self, game_state: GameState) -> Optional[ActionMessage]:
         # US prioritizes maintaining balance of power and alliance coordination
         available_actions = [
             {
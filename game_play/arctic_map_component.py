@@ -0,0 +1,97 @@
+"""
+Live Arctic theater map as a bidirectional Streamlit custom component.
+
+The component (components/arctic_map/index.html) mounts once and is fed compact per-turn
+diffs - tension, per-nation resource totals and newly resolved actions to animate - instead
+of re-embedding the page. Each diff carries the sequence number it was computed against;
+if the browser missed one (or was reloaded) it asks for a resync and gets a full snapshot.
+Region clicks come back to Python as the component value.
+"""
+
+import os
+from typing import Dict, List, Optional
+
+import streamlit as st
+import streamlit.components.v1 as components
+
+from arctic_agents import GameState
+
+COMPONENT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "components", "arctic_map")
+_arctic_map = components.declare_component("arctic_map", path=COMPONENT_DIR)
+
+NATION_FIELDS = [("Russia", "russia_resources"), ("China", "china_resources"), ("United States", "us_resources")]
+
+
+def map_state(game_state: GameState) -> Dict:
+    """The small slice of game state the map displays"""
+    return {
+        "turn": game_state.turn,
+        "tension": game_state.tension_level,
+        "totals": {nation: sum(getattr(game_state, field).values()) for nation, field in NATION_FIELDS},
+    }
+
+
+class MapDiffTracker:
+    """Per-session record of what the mounted map has been sent"""
+
+    def __init__(self):
+        self.seq = 0
+        self.sent: Dict = {}
+        self.action_seq = 0
+        self.payload: Optional[Dict] = None
+        self.last_event_id = None
+
+    def update(self, game_state: GameState, new_actions: List[Dict], full: bool = False) -> Dict:
+        """Payload for this rerun: a full snapshot, a diff, or the previous payload if nothing changed"""
+        current = map_state(game_state)
+        if new_actions:
+            self.action_seq = new_actions[-1]["seq"]
+
+        if full or self.payload is None:
+            self.seq += 1
+            self.payload = {"seq": self.seq, "base_seq": None, "full": True, "changes": current,
+                            "actions": new_actions[-5:]}
+        else:
+            changes = {}
+            for key in ("turn", "tension"):
+                if current[key] != self.sent.get(key):
+                    changes[key] = current[key]
+            changed_totals = {n: v for n, v in current["totals"].items() if self.sent.get("totals", {}).get(n) != v}
+            if changed_totals:
+                changes["totals"] = changed_totals
+            if not changes and not new_actions:
+                # Identical args - Streamlit delivers them but the map ignores an already-applied seq
+                return self.payload
+            self.seq += 1
+            self.payload = {"seq": self.seq, "base_seq": self.seq - 1, "full": False, "changes": changes,
+                            "actions": new_actions}
+
+        self.sent = current
+        return self.payload
+
+    def take_event(self, value) -> Optional[Dict]:
+        """Return a component event only the first time it is seen (values persist across reruns)"""
+        if not isinstance(value, dict) or value.get("id") == self.last_event_id:
+            return None
+        self.last_event_id = value.get("id")
+        return value
+
+
+def arctic_map(engine, tracker: MapDiffTracker, key: str = "arctic_map", height: int = 460) -> Optional[Dict]:
+    """Render the live map and return a new region click event, if any"""
+    game_state = engine.get_game_state()
+    if not game_state:
+        return None
+
+    # The previous rerun's component value tells us whether the browser needs a full resync
+    event = tracker.take_event(st.session_state.get(key))
+    resync = bool(event and event.get("type") == "resync")
+
+    payload = tracker.update(game_state, engine.get_resolved_actions_since(tracker.action_seq), full=resync)
+    value = _arctic_map(update=payload, height=height, key=key, default=None)
+
+    event = tracker.take_event(value) or event
+    if event and event.get("type") == "region_click":
+        return event
+    return None
+
@@ -1,12 +1,15 @@
 import streamlit as st
-import asyncio
-import plotly.express as px
-import pandas as pd
-from datetime import datetime
+import os
+import sys
 import time
+import uuid
+from datetime import datetime
 
-from game_engine import ArcticWargameEngine
-from arctic_agents import GameState
+_rerun_started = time.perf_counter()
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from cold_start import first_paint, mark_first_paint, start_warm_up
+from streamlit_loop import get_background_loop, get_session_runner
 
 # Configure page
 st.set_page_config(
@@ -15,10 +18,334 @@ st.set_page_config(
     layout="wide"
 )
 
+# Paint the title before loading the simulation modules (autogen runtime, agents), and
+# start the warm-up hook so plotly, pandas and engine initialization are ready before the
+# first "Start New Game" click. Both are no-ops once the process is warm.
+st.title("🧊 Arctic Resource Competition Wargame")
+mark_first_paint("arctic_wargame_app", _rerun_started)
+start_warm_up(__file__)
+
+from game_engine import ArcticWargameEngine
+from arctic_agents import GameState
+from autoplay import AutoPlayDriver
+from arctic_map_component import MapDiffTracker, arctic_map
+from spectator_hub import BroadcastHub, GameBroadcaster
+from multiplayer import NATIONS, MultiplayerTable, prune_tables
+from engine_pool import get_engine_pool
+
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets")
+
+
+@st.cache_resource(show_spinner=False)
+def load_asset(name: str) -> str:
+    """Read a static CSS/HTML asset once per process"""
+    with open(os.path.join(ASSETS_DIR, name), "r") as f:
+        return f.read()
+
+
+def resource_snapshot(game_state: GameState) -> tuple:
+    """Hashable version of the resource dicts - the chart only changes when this does"""
+    return tuple(
+        (nation, tuple(resources.items()))
+        for nation, resources in [
+            ("Russia", game_state.russia_resources),
+            ("China", game_state.china_resources),
+            ("United States", game_state.us_resources)
+        ]
+    )
+
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def build_resource_figure(snapshot: tuple) -> dict:
+    """Build the resource comparison figure once per distinct resource state"""
+    resources_data = []
+    for nation, resources in snapshot:
+        for resource_type, value in resources:
+            resources_data.append({
+                "Nation": nation,
+                "Resource": resource_type.title(),
+                "Value": value
+            })
+
+    # Only needed once a game is on screen, so kept off the cold-start path
+    import pandas as pd
+    import plotly.express as px
+
+    df = pd.DataFrame(resources_data)
+
+    # Vertical resource comparison chart for sidebar
+    fig = px.bar(df, x="Resource", y="Value", color="Nation",
+                title="Resource Comparison",
+                color_discrete_map={
+                    "Russia": "#FF6B6B",
+                    "China": "#FF0000", 
+                    "United States": "#45B7D1"
+                })
+    fig.update_layout(height=400)
+    return fig.to_dict()
+
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def build_event_feed(recent_events: tuple, adversary_reactions: tuple, tension_changes: tuple) -> dict:
+    """Style and timestamp the feed entries once per distinct event log"""
+    events = []
+    for i, event in enumerate(reversed(recent_events[-8:])):
+        # Add timestamp simulation
+        time_ago = f"{(i+1)*2}m ago"
+
+        # Style different types of events
+        if "🚨" in event or "BREAKING" in event:
+            style = "error"
+        elif "🧠" in event:
+            style = "info"
+        elif "⚡" in event:
+            style = "warning"
+        elif "📋" in event:
+            style = "success"
+        else:
+            style = "markdown"
+        events.append((style, f"**{time_ago}**\n{event}"))
+
+    reactions = [f"**{(i+1)*3}m ago**\n{reaction}" for i, reaction in enumerate(reversed(adversary_reactions[-5:]))]
+
+    changes = []
+    for i, change in enumerate(reversed(tension_changes[-3:])):
+        style = "error" if "rises" in change or "spikes" in change else "success"
+        changes.append((style, f"**{(i+1)*4}m ago**\n{change}"))
+
+    return {"events": events, "reactions": reactions, "changes": changes}
+
+
+def render_event_panels(game_state: GameState):
+    """Recent events, intel reports and tension monitor"""
+    feed = build_event_feed(tuple(game_state.recent_events), tuple(game_state.adversary_reactions),
+                            tuple(game_state.tension_changes))
+    render_styled = {"error": st.error, "info": st.info, "warning": st.warning,
+                     "success": st.success, "markdown": st.markdown}
+
+    st.markdown("### 📰 Recent Events")
+
+    if feed["events"]:
+        for style, text in feed["events"]:
+            render_styled[style](text)
+    else:
+        st.info("No recent events...")
+
+    st.divider()
+
+    # Adversary reactions in sidebar
+    st.markdown("### 💬 Intel Reports")
+
+    if feed["reactions"]:
+        for text in feed["reactions"]:
+            st.warning(text)
+    else:
+        st.info("No intercepted communications...")
+
+    st.divider()
+
+    # Tension changes in sidebar
+    st.markdown("### 🌡️ Tension Monitor")
+
+    if feed["changes"]:
+        for style, text in feed["changes"]:
+            render_styled[style](text)
+    else:
+        st.info("Tensions stable...")
+
+
+@st.cache_resource(show_spinner=False)
+def broadcast_hub() -> BroadcastHub:
+    """Spectator pub/sub shared by every session in this server process"""
+    return BroadcastHub()
+
+
+SPECTATOR_REFRESH_SECONDS = 1.5
+
+
+def render_spectator_feed():
+    """Read-only view of a broadcast game, drawn from the hub's latest snapshot"""
+    subscription = st.session_state.spectator_subscription
+    for update in subscription.poll():
+        st.session_state.spectator_actions.extend(update.get('actions', []))
+    del st.session_state.spectator_actions[:-10]
+    latest = subscription.latest
+    if latest is None:
+        st.info("Waiting for the operator to start the game...")
+        return
+    game_state = latest['state']
+
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Turn", game_state.turn)
+    with col2:
+        st.metric("Tension Level", f"{game_state.tension_level}/10")
+    with col3:
+        if game_state.tension_level <= 3:
+            phase = "🟢 Stable"
+        elif game_state.tension_level <= 6:
+            phase = "🟡 Escalating"
+        else:
+            phase = "🔴 Critical"
+        st.metric("Phase", phase)
+    with col4:
+        st.metric("Spectators", subscription.channel.subscriber_count)
+
+    left_col, main_col, right_col = st.columns([1, 2, 1])
+    with left_col:
+        st.subheader("🏛️ Nation Resources")
+        st.plotly_chart(build_resource_figure(resource_snapshot(game_state)), use_container_width=True)
+    with main_col:
+        st.subheader("🎯 Situation Room")
+        crisis = latest.get('opening_crisis')
+        if crisis:
+            st.markdown(f"**🚨 {crisis['name']}**")
+            st.markdown(f"*{crisis['description']}*")
+        st.markdown("### ⚡ Latest Moves")
+        if st.session_state.spectator_actions:
+            for action in reversed(st.session_state.spectator_actions):
+                icon = "✅" if action['success'] else "❌"
+                st.markdown(f"{icon} Turn {action['turn']} · **{action['nation']}** {action['name']} ({action['type']})")
+        else:
+            st.info("No moves yet...")
+        if latest.get('final_adjudication'):
+            st.subheader("🏆 Final Game Adjudication")
+            st.markdown(latest['final_adjudication'])
+    with right_col:
+        render_event_panels(game_state)
+
+
+def render_spectator_page(game_id: str):
+    """Spectator sessions never create an engine - they only subscribe to the broadcast"""
+    st.markdown(f"### 👁️ Spectating game **{game_id}** (read-only)")
+    channel = broadcast_hub().get_channel(game_id)
+    if channel is None:
+        st.warning("No game is broadcasting under that ID.")
+        active = broadcast_hub().active_games()
+        if active:
+            st.markdown("Live games: " + ", ".join(f"[{g}](?spectate={g})" for g in active))
+        return
+    subscription = st.session_state.get('spectator_subscription')
+    if subscription is None or subscription.channel is not channel or not subscription.active:
+        st.session_state.spectator_subscription = channel.subscribe()
+        st.session_state.spectator_actions = []
+    refresh = None if channel.closed else SPECTATOR_REFRESH_SECONDS
+    st.fragment(run_every=refresh)(render_spectator_feed)()
+
+
+@st.cache_resource(show_spinner=False)
+def multiplayer_tables() -> dict:
+    """Open multiplayer tables (table ID -> MultiplayerTable) shared by every session"""
+    return {}
+
+
+NATION_FLAGS = {"Russia": "🇷🇺", "China": "🇨🇳", "United States": "🇺🇸"}
+MOVE_STATUS_LABELS = {"ai": "🤖 AI", "next_turn": "⏭️ joins next turn", "waiting": "⏳ deciding", "submitted": "✅ committed"}
+
+
+def render_table_feed(table: MultiplayerTable):
+    """Live table state and, for a seated player, the move picker"""
+    token = st.session_state.mp_token
+    nation = table.seat_of(token)
+    game_state = table.engine.get_game_state()
+    if table.error:
+        st.error(f"Table error: {table.error}")
+    if not game_state:
+        st.info("Table is starting...")
+        return
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Turn", game_state.turn)
+    with col2:
+        st.metric("Tension Level", f"{game_state.tension_level}/10")
+    with col3:
+        seconds_left = table.seconds_left()
+        st.metric("Move Deadline", f"{seconds_left:.0f}s" if seconds_left is not None else "-")
+
+    status = table.move_status()
+    status_cols = st.columns(len(NATIONS))
+    for col, seat_nation in zip(status_cols, NATIONS):
+        with col:
+            st.markdown(f"{NATION_FLAGS[seat_nation]} **{seat_nation}** · {MOVE_STATUS_LABELS[status[seat_nation]]}")
+
+    if table.result == "game_over":
+        st.subheader("🏆 Game Over")
+        st.markdown(table.engine.get_game_result())
+    elif nation and status[nation] == "waiting":
+        actions = table.engine.get_nation_actions(nation)
+        if actions:
+            choice = st.selectbox(f"{NATION_FLAGS[nation]} Your move", [a['name'] for a in actions], key="mp_choice")
+            if st.button("✅ Commit Move", type="primary", key="mp_submit"):
+                if get_session_runner(st.session_state).run(table.submit_move(nation, token, choice)):
+                    st.success("Move committed - waiting for the other commanders")
+                else:
+                    st.warning("Turn already closed - the AI moved for you")
+        else:
+            st.info("No affordable actions this turn - the AI will hold position for you")
+    elif nation and status[nation] == "submitted":
+        st.success("Move committed - waiting for the other commanders")
+
+    if table.last_turn:
+        last = table.last_turn
+        st.caption(f"Turn {last['turn']} resolved · players: {', '.join(last['human']) or 'none'} · "
+                   f"timed out: {', '.join(last['timed_out']) or 'none'}")
+    render_event_panels(game_state)
+
+
+def render_multiplayer_page(table_id: str):
+    """Shared table: claim a nation, commit moves before the deadline"""
+    st.markdown(f"### 👥 Multiplayer table **{table_id}** (simultaneous moves)")
+    if 'mp_token' not in st.session_state:
+        st.session_state.mp_token = uuid.uuid4().hex
+    tables = multiplayer_tables()
+    for finished_id in prune_tables(tables):
+        broadcast_hub().close_channel(finished_id)
+    table = tables.get(table_id)
+    if table is None:
+        deadline = st.slider("Move deadline (sec)", 10, 180, 60, step=5)
+        if st.button("🚀 Open Table", type="primary"):
+            table = MultiplayerTable(table_id, move_deadline=deadline)
+            GameBroadcaster(table.engine, broadcast_hub().open_channel(table_id))
+            tables[table_id] = table
+            table.start(get_background_loop())
+            st.rerun()
+        return
+
+    token = st.session_state.mp_token
+    seated = table.seat_of(token)
+    seat_cols = st.columns(len(NATIONS))
+    for col, nation in zip(seat_cols, NATIONS):
+        with col:
+            if seated == nation:
+                if st.button(f"Leave {nation}", key=f"mp_leave_{nation}"):
+                    table.release_seat(nation, token)
+                    st.rerun()
+            elif nation not in table.seats and not seated:
+                if st.button(f"{NATION_FLAGS[nation]} Play {nation}", key=f"mp_claim_{nation}"):
+                    table.claim_seat(nation, token)
+                    st.rerun()
+    st.caption(f"Spectators can watch with `?spectate={table_id}` · empty seats are played by the AI")
+    st.fragment(run_every=1.0 if table.running else None)(render_table_feed)(table)
+
+
+# Spectators (?spectate=<game id>) render from the shared hub and never run an engine
+if st.query_params.get("spectate"):
+    render_spectator_page(st.query_params["spectate"].upper())
+    st.stop()
+
+# Multiplayer tables (?table=<table id>) are owned by the server, not by any one session
+if st.query_params.get("table"):
+    render_multiplayer_page(st.query_params["table"].upper())
+    st.stop()
 
 # Initialize session state
 if 'engine' not in st.session_state:
     st.session_state.engine = ArcticWargameEngine()
+    st.session_state.autoplay_driver = AutoPlayDriver(st.session_state.engine)
+    st.session_state.map_tracker = MapDiffTracker()
+    st.session_state.selected_region = None
+    st.session_state.broadcaster = None
     st.session_state.game_active = False
     st.session_state.auto_play = False
     st.session_state.human_action_needed = False
@@ -28,39 +355,14 @@ if 'engine' not in st.session_state:
     st.session_state.current_discussion = None
     st.session_state.discussing_action = None
 
+# All engine coroutines run on the shared long-lived event loop so background work survives reruns
+runner = get_session_runner(st.session_state)
+
 # Title and description
-st.title("🧊 Arctic Resource Competition Wargame")
 st.markdown("### 🎮 **Human vs AI**: You control 🇺🇸 United States against 🇷🇺 Russia-🇨🇳 China Alliance")
 
 # Floating Game Controls Panel - Fixed at top of browser like menu bar
-st.markdown("""
-<style>
-.floating-controls {
-    position: fixed;
-    top: 0;
-    left: 0;
-    right: 0;
-    background: rgba(38, 39, 48, 0.95);
-    backdrop-filter: blur(10px);
-    border-bottom: 1px solid #464853;
-    padding: 15px 20px;
-    z-index: 1000;
-    box-shadow: 0 4px 20px rgba(0, 0, 0, 0.3);
-}
-.floating-controls .stButton button {
-    width: 100%;
-    margin: 0 5px;
-}
-.control-grid {
-    display: grid;
-    grid-template-columns: 1fr 1fr 1fr 1fr;
-    gap: 15px;
-    max-width: 1200px;
-    margin: 0 auto;
-    align-items: center;
-}
-</style>
-""", unsafe_allow_html=True)
+st.markdown(f"<style>{load_asset('floating_controls.css')}</style>", unsafe_allow_html=True)
 
 # Create floating controls container
 st.markdown('<div class="floating-controls">', unsafe_allow_html=True)
@@ -73,7 +375,18 @@ with col1:
         if st.button("🚀 Start New Game", type="primary", key="floating_start"):
             with st.spinner("Initializing agents..."):
                 try:
-                    asyncio.run(st.session_state.engine.start_game())
+                    if not st.session_state.engine.is_initialized:
+                        # Swap in a pre-warmed engine (initialized, crisis attached): start_game is then O(1)
+                        pooled = get_engine_pool().checkout()
+                        pooled.pipelined_mode = st.session_state.engine.pipelined_mode
+                        st.session_state.engine = pooled
+                        st.session_state.autoplay_driver = AutoPlayDriver(pooled)
+                        st.session_state.map_tracker = MapDiffTracker()
+                    # Attach before starting so spectators receive the opening snapshot
+                    if st.session_state.broadcaster is None:
+                        st.session_state.broadcaster = GameBroadcaster(
+                            st.session_state.engine, broadcast_hub().open_channel())
+                    runner.run(st.session_state.engine.start_game())
                     st.session_state.game_active = True
                     st.success("Game started!")
                     st.rerun()
@@ -84,7 +397,7 @@ with col1:
             if st.button("⏭️ Next Turn", key="floating_next"):
                 with st.spinner("Processing turn..."):
                     try:
-                        result = asyncio.run(st.session_state.engine.execute_turn())
+                        result = runner.run(st.session_state.engine.execute_turn())
                         if result == "game_over":
                             st.session_state.game_active = False
                             st.success("Game completed! Check the final adjudication below.")
@@ -103,7 +416,11 @@ with col2:
         if st.button("🛑 End Game", key="floating_end"):
             try:
                 final_adjudication = st.session_state.engine.get_final_adjudication()
-                asyncio.run(st.session_state.engine.shutdown())
+                if st.session_state.broadcaster:
+                    st.session_state.broadcaster.publish("game_over", final_adjudication)
+                st.session_state.autoplay_driver.stop()
+                runner.cancel_all()
+                runner.run(st.session_state.engine.shutdown())
                 st.session_state.game_active = False
                 st.session_state.final_adjudication = final_adjudication
                 st.success("Game ended! Check the final adjudication below.")
@@ -113,47 +430,128 @@ with col2:
 
 with col3:
     st.session_state.auto_play = st.toggle("🔄 Auto-Play", value=st.session_state.auto_play, key="floating_autoplay")
+    st.session_state.engine.pipelined_mode = st.toggle(
+        "⚡ Pipelined AI", value=st.session_state.engine.pipelined_mode, key="floating_pipelined",
+        help="Plan Russia-China moves while you choose your action so Next Turn returns faster")
 
 with col4:
+    driver = st.session_state.autoplay_driver
     if st.session_state.auto_play and st.session_state.game_active:
-        auto_speed = st.slider("Speed (sec)", 1, 10, 3, key="floating_speed")
-        if st.button("▶️ Start Auto-Play", key="floating_auto_start"):
+        auto_speed = st.slider("Speed (sec)", 0.25, 10.0, 3.0, step=0.25, key="floating_speed")
+        driver.set_interval(auto_speed)
+        if driver.running:
+            if st.button("⏸️ Pause Auto-Play", key="floating_auto_pause"):
+                driver.stop()
+        elif st.button("▶️ Start Auto-Play", key="floating_auto_start"):
+            driver.start(runner)
             st.info("Auto-play activated!")
+    elif driver.running:
+        driver.stop()
 
 st.markdown('</div>', unsafe_allow_html=True)
 
-# Add top padding to prevent content from being hidden behind floating controls
-st.markdown("""
-<style>
-.main .block-container {
-    padding-top: 120px !important;
-}
-</style>
-""", unsafe_allow_html=True)
 
 # No sidebar needed - Game controls are now floating at top
 
+# Live panels are fragments: while auto-play runs they refresh on their own timer
+# instead of re-executing the whole script (chart, expanders, discussion, etc.). The
+# status and event feed also refresh while a background narration is pending.
+NARRATION_REFRESH_SECONDS = 0.5
+
+
+def live_refresh_interval(follow_narration: bool = False):
+    driver = st.session_state.autoplay_driver
+    if driver.running:
+        return driver.interval
+    if follow_narration and st.session_state.engine.pending_narration_count():
+        # Replace the "⏳" placeholder as soon as the narration lands
+        return NARRATION_REFRESH_SECONDS
+    return None
+
+
+def render_status_metrics():
+    """Turn, tension and phase metrics"""
+    game_state = st.session_state.engine.get_game_state()
+    if not game_state:
+        return
+    driver = st.session_state.autoplay_driver
+    if driver.finished and st.session_state.game_active:
+        # Auto-play reached a game over - redraw the full page once
+        st.session_state.game_active = False
+        st.session_state.auto_play = False
+        st.rerun()
+    if driver.error:
+        st.error(f"Auto-play error: {driver.error}")
+    broadcaster = st.session_state.broadcaster
+    if broadcaster:
+        channel = broadcaster.channel
+        st.caption(f"📡 Broadcasting as game **{channel.game_id}** · {channel.subscriber_count} spectator(s) · "
+                   f"share the link with `?spectate={channel.game_id}`")
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Turn", game_state.turn)
+    with col2:
+        st.metric("Tension Level", f"{game_state.tension_level}/10", 
+                 delta=None, delta_color="inverse")
+    with col3:
+        # Determine current phase
+        if game_state.tension_level <= 3:
+            phase = "🟢 Stable"
+        elif game_state.tension_level <= 6:
+            phase = "🟡 Escalating"
+        else:
+            phase = "🔴 Critical"
+        st.metric("Phase", phase)
+
+
+def render_resource_chart():
+    """Resource comparison bar chart"""
+    game_state = st.session_state.engine.get_game_state()
+    if not game_state:
+        return
+    fig = build_resource_figure(resource_snapshot(game_state))
+    st.plotly_chart(fig, use_container_width=True)
+
+
+REGION_INFO = {
+    "Russia": "Largest Arctic coastline; Northern Fleet and icebreaker fleet",
+    "China": "Self-declared near-Arctic state investing in the Polar Silk Road",
+    "United States": "Alaska, Thule Air Base and the Bering approaches",
+    "Canada": "Claims the Northwest Passage as internal waters",
+    "Norway": "Svalbard, Barents Sea energy and NATO's northern flank",
+    "Murmansk Naval Base": "Home of Russia's Northern Fleet",
+    "Thule Air Base": "US early-warning radar and space surveillance",
+    "Northwest Passage": "Contested shipping lane through the Canadian archipelago",
+    "Northern Sea Route": "Russian-controlled route along the Siberian coast",
+    "Bering Strait": "Chokepoint between the Pacific and the Arctic Ocean",
+}
+
+
+def render_live_map():
+    """Live map: fed per-turn diffs, reports region clicks back"""
+    click = arctic_map(st.session_state.engine, st.session_state.map_tracker)
+    if click:
+        st.session_state.selected_region = click["region"]
+    region = st.session_state.selected_region
+    if region:
+        st.caption(f"📍 **{region}** - {REGION_INFO.get(region, 'Strategic location')}")
+
+
+def render_event_feed():
+    """Recent events, intel reports and tension monitor"""
+    game_state = st.session_state.engine.get_game_state()
+    if not game_state:
+        return
+    render_event_panels(game_state)
+
+
 # Main game interface
 if st.session_state.game_active:
     game_state = st.session_state.engine.get_game_state()
     
     if game_state:
         # Game status header
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            st.metric("Turn", game_state.turn)
-        with col2:
-            st.metric("Tension Level", f"{game_state.tension_level}/10", 
-                     delta=None, delta_color="inverse")
-        with col3:
-            # Determine current phase
-            if game_state.tension_level <= 3:
-                phase = "🟢 Stable"
-            elif game_state.tension_level <= 6:
-                phase = "🟡 Escalating"
-            else:
-                phase = "🔴 Critical"
-            st.metric("Phase", phase)
+        st.fragment(run_every=live_refresh_interval(follow_narration=True))(render_status_metrics)()
         
         # Main layout: Left sidebar (Nation Resources), Main column (Situation Room), Right sidebar (events)
         left_sidebar, main_col, right_sidebar = st.columns([1, 2, 1])
@@ -162,37 +560,14 @@ if st.session_state.game_active:
         with left_sidebar:
             st.subheader("🏛️ Nation Resources")
             
-            # Create resource comparison chart
-            resources_data = []
-            for nation, resources in [
-                ("Russia", game_state.russia_resources),
-                ("China", game_state.china_resources),
-                ("United States", game_state.us_resources)
-            ]:
-                for resource_type, value in resources.items():
-                    resources_data.append({
-                        "Nation": nation,
-                        "Resource": resource_type.title(),
-                        "Value": value
-                    })
-            
-            df = pd.DataFrame(resources_data)
-            
-            # Vertical resource comparison chart for sidebar
-            fig = px.bar(df, x="Resource", y="Value", color="Nation",
-                        title="Resource Comparison",
-                        color_discrete_map={
-                            "Russia": "#FF6B6B",
-                            "China": "#FF0000", 
-                            "United States": "#45B7D1"
-                        })
-            fig.update_layout(height=400)
-            st.plotly_chart(fig, use_container_width=True)
+            st.fragment(run_every=live_refresh_interval())(render_resource_chart)()
         
         # Main column - Situation Room moved up
         with main_col:
             st.subheader("🎯 Situation Room")
             
+            st.fragment(run_every=live_refresh_interval())(render_live_map)()
+            
             # Get opening crisis if available
             opening_crisis = st.session_state.engine.get_opening_crisis()
             if opening_crisis:
@@ -251,53 +626,7 @@ if st.session_state.game_active:
         
         # Right sidebar - Recent Events
         with right_sidebar:
-            st.markdown("### 📰 Recent Events")
-            
-            if game_state.recent_events:
-                for i, event in enumerate(reversed(game_state.recent_events[-8:])):
-                    # Add timestamp simulation
-                    time_ago = f"{(i+1)*2}m ago"
-                    
-                    # Style different types of events
-                    if "🚨" in event or "BREAKING" in event:
-                        st.error(f"**{time_ago}**\n{event}")
-                    elif "🧠" in event:
-                        st.info(f"**{time_ago}**\n{event}")
-                    elif "⚡" in event:
-                        st.warning(f"**{time_ago}**\n{event}")
-                    elif "📋" in event:
-                        st.success(f"**{time_ago}**\n{event}")
-                    else:
-                        st.markdown(f"**{time_ago}**\n{event}")
-            else:
-                st.info("No recent events...")
-            
-            st.divider()
-            
-            # Adversary reactions in sidebar
-            st.markdown("### 💬 Intel Reports")
-            
-            if game_state.adversary_reactions:
-                for i, reaction in enumerate(reversed(game_state.adversary_reactions[-5:])):
-                    time_ago = f"{(i+1)*3}m ago"
-                    st.warning(f"**{time_ago}**\n{reaction}")
-            else:
-                st.info("No intercepted communications...")
-            
-            st.divider()
-            
-            # Tension changes in sidebar
-            st.markdown("### 🌡️ Tension Monitor")
-            
-            if game_state.tension_changes:
-                for i, change in enumerate(reversed(game_state.tension_changes[-3:])):
-                    time_ago = f"{(i+1)*4}m ago"
-                    if "rises" in change or "spikes" in change:
-                        st.error(f"**{time_ago}**\n{change}")
-                    else:
-                        st.success(f"**{time_ago}**\n{change}")
-            else:
-                st.info("Tensions stable...")
+            st.fragment(run_every=live_refresh_interval(follow_narration=True))(render_event_feed)()
         
         # Human action selection - now full width below main layout
         if st.session_state.human_action_needed and st.session_state.available_actions:
@@ -307,7 +636,7 @@ if st.session_state.game_active:
             # Show AI advisor suggestions first
             with st.expander("🧠 AI Strategic Advisor Analysis", expanded=True):
                 try:
-                    advisor_analysis = asyncio.run(st.session_state.engine.get_ai_advisor_for_human_player())
+                    advisor_analysis = runner.run(st.session_state.engine.get_ai_advisor_for_human_player())
                     
                     col1, col2 = st.columns([2, 1])
                     
@@ -381,7 +710,7 @@ if st.session_state.game_active:
                     if st.button("🗣️ Start Discussion", disabled=not discussion_input):
                         with st.spinner("AI Advisor responding..."):
                             try:
-                                response = asyncio.run(st.session_state.engine.start_discussion_with_ai(
+                                response = runner.run(st.session_state.engine.start_discussion_with_ai(
                                     discussion_input, st.session_state.discussing_action
                                 ))
                                 st.session_state.current_discussion = {
@@ -398,7 +727,7 @@ if st.session_state.game_active:
                     if st.button("➕ Continue Discussion", disabled=not (st.session_state.current_discussion and discussion_input)):
                         with st.spinner("AI Advisor responding..."):
                             try:
-                                response = asyncio.run(st.session_state.engine.continue_discussion(discussion_input))
+                                response = runner.run(st.session_state.engine.continue_discussion(discussion_input))
                                 # Add to current discussion
                                 if 'followup_questions' not in st.session_state.current_discussion:
                                     st.session_state.current_discussion['followup_questions'] = []
@@ -481,7 +810,7 @@ if st.session_state.game_active:
                                 # Execute the chosen action
                                 with st.spinner("Executing operation..."):
                                     try:
-                                        result = asyncio.run(st.session_state.engine.execute_human_action(action))
+                                        result = runner.run(st.session_state.engine.execute_human_action(action))
                                         st.session_state.human_action_needed = False
                                         # Clear discussion mode when action is executed
                                         st.session_state.discussion_mode = False
@@ -644,19 +973,6 @@ Lighting: Natural + emergency lights
             - 🔴 7-10: Crisis mode, risk of conflict
             """)
         
-        # Auto-play implementation
-        if st.session_state.auto_play:
-            # Auto-advance every few seconds
-            placeholder = st.empty()
-            placeholder.info("Auto-play mode: Next turn in 3 seconds...")
-            time.sleep(3)
-            try:
-                asyncio.run(st.session_state.engine.execute_turn())
-                st.rerun()
-            except Exception as e:
-                st.error(f"Auto-play error: {e}")
-                st.session_state.auto_play = False
-        
     else:
         st.error("Unable to retrieve game state. Please restart the game.")
 
@@ -667,7 +983,15 @@ if st.session_state.final_adjudication:
     
     if st.button("🔄 Start New Game"):
         st.session_state.final_adjudication = None
+        st.session_state.autoplay_driver.stop()
+        if st.session_state.broadcaster:
+            st.session_state.broadcaster.detach()
+            broadcast_hub().close_channel(st.session_state.broadcaster.channel.game_id)
+        st.session_state.broadcaster = None
         st.session_state.engine = ArcticWargameEngine()
+        st.session_state.autoplay_driver = AutoPlayDriver(st.session_state.engine)
+        st.session_state.map_tracker = MapDiffTracker()
+        st.session_state.selected_region = None
         st.session_state.game_active = False
         st.session_state.human_action_needed = False
         st.session_state.available_actions = []
@@ -699,6 +1023,7 @@ elif not st.session_state.game_active:
     - **Resource Management**: Nations must balance military, economic, political, and information assets
     - **Tension System**: Actions affect regional stability (1-10 scale)
     - **Random Events**: Unexpected developments can change the strategic landscape
+    - **Multiplayer**: Open the app with `?table=<name>` to play any nation against other humans with simultaneous, timed moves
     
     Click **"Start New Game"** in the sidebar to begin!
     """)
@@ -713,4 +1038,15 @@ st.markdown("""
 <div style='text-align: center; color: #666; font-size: 0.8em;'>
     Arctic Wargame Simulation | Built with AutoGen + Streamlit | Educational Purposes Only
 </div>
-""", unsafe_allow_html=True)
\ No newline at end of file
+""", unsafe_allow_html=True)
+
+# Rerun timing (server-side script time, excluding fragment-only refreshes)
+rerun_ms = (time.perf_counter() - _rerun_started) * 1000
+st.session_state.rerun_timings = (st.session_state.get("rerun_timings", []) + [rerun_ms])[-20:]
+st.caption(f"⏱️ Rerun {rerun_ms:.0f} ms · median of last {len(st.session_state.rerun_timings)}: "
+           f"{sorted(st.session_state.rerun_timings)[len(st.session_state.rerun_timings) // 2]:.0f} ms · "
+           f"cold-start first paint {first_paint.get('arctic_wargame_app', 0) * 1000:.0f} ms")
+pool_stats = get_engine_pool().get_stats()
+st.caption(f"🏊 Engine pool: {pool_stats['depth']}/{pool_stats['target_depth']} ready · "
+           f"{pool_stats['hits']} hits / {pool_stats['misses']} misses · "
+           f"refill avg {pool_stats['refill_avg_ms']:.0f} ms, p95 {pool_stats['refill_p95_ms']:.0f} ms")
\ No newline at end of file
@@ -0,0 +1,72 @@
+"""
+Background turn driver for auto-play.
+
+Turns advance on the shared background event loop while the user keeps interacting with
+the page; the Streamlit UI redraws only its live panels, as `st.fragment` panels that rerun
+every `interval` seconds while the driver is running, instead of sleeping and re-running the
+whole script.
+"""
+
+import asyncio
+import time
+from typing import Optional
+
+from game_engine import ArcticWargameEngine
+
+
+class AutoPlayDriver:
+    """Advances an engine one turn every `interval` seconds until stopped or the game ends"""
+
+    def __init__(self, engine: ArcticWargameEngine, interval: float = 3.0):
+        self.engine = engine
+        self.interval = interval
+        self.version = 0  # Bumped after every turn, for callers that want to detect new turns
+        self.turns_played = 0
+        self.last_result: Optional[str] = None
+        self.last_turn_seconds = 0.0
+        self.error: Optional[str] = None
+        self.finished = False
+        self._future = None
+        self._stop_requested = False
+
+    @property
+    def running(self) -> bool:
+        return self._future is not None and not self._future.done()
+
+    def start(self, runner) -> None:
+        """Start driving turns on the session's background loop"""
+        if self.running:
+            return
+        self._stop_requested = False
+        self.error = None
+        self._future = runner.submit(self._run())
+
+    def stop(self) -> None:
+        self._stop_requested = True
+        if self._future is not None:
+            self._future.cancel()
+        self._future = None
+
+    def set_interval(self, interval: float) -> None:
+        # Read at the start of each wait, so speed changes apply from the next turn
+        self.interval = max(0.1, interval)
+
+    async def _run(self) -> None:
+        while not self._stop_requested:
+            await asyncio.sleep(self.interval)
+            if self._stop_requested or not self.engine.is_initialized:
+                break
+            start = time.perf_counter()
+            try:
+                result = await self.engine.execute_turn()
+            except Exception as e:
+                self.error = str(e)
+                print(f"Auto-play error: {e}")
+                break
+            self.last_turn_seconds = time.perf_counter() - start
+            self.last_result = result
+            self.turns_played += 1
+            self.version += 1
+            if result == "game_over":
+                self.finished = True
+                break
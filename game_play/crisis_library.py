@@ -0,0 +1,482 @@
+"""
+Indexed library of opening crisis scenarios.
+
+Crises live in a SQLite file, one row per scenario: the JSON payload plus the fields it is
+drawn by - severity (its `tension_increase`), theme and the nations whose resources it
+touches. Opening a library loads only that small index into memory; an alias table is built
+per filter combination on first use, so a weighted draw is O(1) and only the chosen payload
+is read from disk. Scenarios are validated and deduplicated (normalized name + description)
+on insert.
+
+The offline generator fills a library with thousands of scenarios using bounded
+concurrency - from the LLM in model_config.yml, or procedurally when no model is available:
+    python crisis_library.py generate --count 2000 --concurrency 8 [--llm] [--db path]
+    python crisis_library.py stats [--db path]
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import random
+import re
+import sqlite3
+import threading
+import time
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+DEFAULT_LIBRARY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "crisis_library.db")
+MODEL_CONFIG_PATH = "/workspaces/ai-app/agentchat_streamlit/model_config.yml"
+
+NATION_FIELDS = {"russia_resources": "Russia", "china_resources": "China", "us_resources": "United States"}
+RESOURCE_TYPES = ["military", "economic", "political", "information"]
+THEMES = ["environmental", "military", "cyber", "resources", "climate", "diplomatic", "economic"]
+
+BUILTIN_CRISES = [
+    {
+        "theme": "environmental",
+        "name": "Arctic Environmental Disaster",
+        "description": "Chinese oil tanker Shen Zhou carrying Russian Arctic crude oil suffers catastrophic hull breach during severe storm. 150,000 tons of oil spill into pristine Arctic waters, creating environmental crisis spanning three national territories.",
+        "video_prompt": "Massive Chinese oil tanker breaking apart in violent Arctic storm, thick black oil spreading across pristine white ice sheets, emergency helicopters circling overhead, environmental disaster unfolding under dramatic aurora borealis, seabirds covered in oil struggling in freezing waters",
+        "consequences": [
+            "Massive environmental cleanup required across international waters",
+            "Russia denies responsibility - claims Chinese navigation error", 
+            "China demands Russia pay for cleanup - oil was Russian property",
+            "Indigenous communities report contaminated fishing grounds",
+            "International environmental groups demand immediate action"
+        ],
+        "tension_increase": 2,
+        "affected_resources": {
+            "russia_resources": {"political": -1, "economic": -2},
+            "china_resources": {"political": -2, "economic": -1}, 
+            "us_resources": {"political": 1}  # US gains moral authority
+        }
+    },
+    {
+        "theme": "military",
+        "name": "Arctic Submarine Collision",
+        "description": "Russian nuclear submarine Komsomolsk collides with Chinese research vessel during covert Arctic mapping mission. Both crews rescued but classified technology scattered across Arctic seabed in disputed territorial waters.",
+        "video_prompt": "Nuclear submarine surfacing through cracked Arctic ice in emergency, Chinese research vessel listing heavily with massive hull damage, military helicopters from multiple nations converging on scene, underwater footage of classified equipment sinking to ocean floor, tense rescue operations in blizzard conditions",
+        "consequences": [
+            "Classified Russian naval technology exposed on seabed",
+            "China accuses Russia of ramming civilian research vessel",
+            "Russia claims Chinese ship was conducting espionage operations", 
+            "International salvage rights disputed across territorial claims",
+            "NATO monitoring Russian nuclear safety protocols"
+        ],
+        "tension_increase": 3,
+        "affected_resources": {
+            "russia_resources": {"military": -2, "information": -1},
+            "china_resources": {"political": -1, "information": -2},
+            "us_resources": {"information": 2}  # US gains intelligence advantage
+        }
+    },
+    {
+        "theme": "cyber",
+        "name": "Arctic Cyber Infrastructure Attack",
+        "description": "Massive cyber attack cripples Arctic shipping navigation systems during peak transit season. GPS satellites feeding false data, icebreaker fleets stranded, international shipping paralyzed. Attack origin unknown but sophisticated state-level operation suspected.",
+        "video_prompt": "Multiple cargo ships and icebreakers dead in Arctic waters, navigation screens showing error messages, cyber warfare command centers with analysts frantically typing, satellite dishes and communication arrays sparking and going dark, ships' crews using manual navigation by stars over frozen landscape",
+        "consequences": [
+            "International Arctic shipping completely paralyzed",
+            "Russia blames US cyber warfare capabilities",
+            "China accuses Russia of sabotaging Belt and Road shipping",
+            "US denies involvement but offers to investigate",
+            "Emergency international cyber security summit called"
+        ],
+        "tension_increase": 4,
+        "affected_resources": {
+            "russia_resources": {"economic": -2, "information": -1},
+            "china_resources": {"economic": -3},
+            "us_resources": {"information": 1, "political": 1}
+        }
+    },
+    {
+        "theme": "resources",
+        "name": "Arctic Resource Discovery Crisis", 
+        "description": "Massive rare earth element deposit discovered directly on Russia-China-US territorial claim overlap. Geological surveys indicate deposit worth $2 trillion. All three nations immediately dispatch military forces to secure the area.",
+        "video_prompt": "Geological survey teams in hazmat suits extracting mineral samples from pristine Arctic landscape, massive military convoys from three nations racing across frozen terrain toward same location, fighter jets from different countries circling overhead, heated diplomatic meetings with world maps showing territorial claims, military bases being rapidly constructed in harsh conditions",
+        "consequences": [
+            "$2 trillion rare earth deposit spans disputed territorial waters",
+            "Russia immediately begins military base construction", 
+            "China deploys icebreaker fleet with mining equipment",
+            "US sends nuclear submarines to assert territorial claims",
+            "International law experts warn of potential armed conflict"
+        ],
+        "tension_increase": 5,
+        "affected_resources": {
+            "russia_resources": {"military": 1, "economic": 2},
+            "china_resources": {"economic": 2, "political": 1},
+            "us_resources": {"military": 1, "political": 1}
+        }
+    },
+    {
+        "theme": "climate",
+        "name": "Arctic Climate Tipping Point",
+        "description": "Sudden acceleration of Arctic ice sheet collapse triggers unprecedented global climate event. Sea levels rise 2 meters overnight, new shipping lanes open, coastal cities flood. Nations scramble to adapt while exploiting new opportunities.",
+        "video_prompt": "Massive ice sheets cracking and collapsing into ocean with thunderous roars, coastal cities with flood waters rushing through streets, emergency evacuations by helicopter, new open water shipping lanes revealed in previously frozen Arctic, nations' military ships racing toward newly accessible resources, dramatic time-lapse of changing Arctic map",
+        "consequences": [
+            "Unprecedented Arctic shipping lanes suddenly open",
+            "Coastal flooding requires massive international response",
+            "New territorial water boundaries disputed globally", 
+            "Arctic resources become immediately accessible",
+            "Climate refugees create international crisis"
+        ],
+        "tension_increase": 3,
+        "affected_resources": {
+            "russia_resources": {"economic": 3, "political": -1},
+            "china_resources": {"economic": 2, "political": -1},
+            "us_resources": {"political": -2, "military": 1}
+        }
+    }
+]
+
+
+def affected_nations(crisis: Dict) -> List[str]:
+    """Nations whose resources a crisis changes"""
+    return sorted(NATION_FIELDS[field] for field, changes in crisis.get('affected_resources', {}).items()
+                  if field in NATION_FIELDS and changes)
+
+
+def crisis_fingerprint(crisis: Dict) -> str:
+    """Dedupe key: name and description with case, punctuation and spacing normalized"""
+    text = f"{crisis.get('name', '')}|{crisis.get('description', '')}".lower()
+    return hashlib.sha1(re.sub(r"[^a-z0-9]+", " ", text).strip().encode()).hexdigest()
+
+
+def validate_crisis(crisis: Dict) -> List[str]:
+    """Problems that would stop a crisis from being applied by start_game (empty if valid)"""
+    errors = []
+    for key in ("name", "description", "video_prompt"):
+        if not isinstance(crisis.get(key), str) or not crisis[key].strip():
+            errors.append(f"missing {key}")
+    if crisis.get('theme') not in THEMES:
+        errors.append(f"unknown theme {crisis.get('theme')!r}")
+    consequences = crisis.get('consequences')
+    if not isinstance(consequences, list) or len(consequences) < 3 or \
+            not all(isinstance(c, str) and c.strip() for c in consequences):
+        errors.append("needs at least 3 consequences")
+    severity = crisis.get('tension_increase')
+    if not isinstance(severity, int) or isinstance(severity, bool) or not 1 <= severity <= 5:
+        errors.append("tension_increase must be an integer from 1 to 5")
+    affected = crisis.get('affected_resources')
+    if not isinstance(affected, dict) or not affected:
+        errors.append("missing affected_resources")
+    else:
+        for field, changes in affected.items():
+            if field not in NATION_FIELDS or not isinstance(changes, dict):
+                errors.append(f"bad affected_resources entry {field!r}")
+                continue
+            for resource, change in changes.items():
+                if resource not in RESOURCE_TYPES or not isinstance(change, int) or not -3 <= change <= 3:
+                    errors.append(f"bad change {field}.{resource}={change!r}")
+    return errors
+
+
+class AliasTable:
+    """Walker/Vose alias table: O(n) to build, O(1) per weighted draw"""
+
+    def __init__(self, ids: List[int], weights: List[float]):
+        n = len(ids)
+        total = sum(weights)
+        scaled = [w * n / total for w in weights]
+        self.ids = ids
+        self.prob = [0.0] * n
+        self.alias = [0] * n
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            s, l = small.pop(), large.pop()
+            self.prob[s] = scaled[s]
+            self.alias[s] = l
+            scaled[l] -= 1.0 - scaled[s]
+            (small if scaled[l] < 1.0 else large).append(l)
+        for i in small + large:
+            self.prob[i] = 1.0
+
+    def sample(self, rng=random) -> int:
+        i = rng.randrange(len(self.ids))
+        return self.ids[i] if rng.random() < self.prob[i] else self.ids[self.alias[i]]
+
+
+class CrisisLibrary:
+    """SQLite-backed crisis store with in-memory sampling indexes"""
+
+    def __init__(self, path: str = DEFAULT_LIBRARY_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")  # Games keep reading while the generator writes
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS crises (
+                id INTEGER PRIMARY KEY,
+                fingerprint TEXT NOT NULL UNIQUE,
+                name TEXT NOT NULL,
+                theme TEXT NOT NULL,
+                severity INTEGER NOT NULL,
+                nations TEXT NOT NULL,
+                weight REAL NOT NULL DEFAULT 1.0,
+                source TEXT,
+                created_at REAL,
+                payload TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_crises_severity_theme ON crises(severity, theme);
+            -- Nation filters use the in-memory index built from crises.nations
+        """)
+        self._index: Dict[int, Tuple[float, int, str, frozenset]] = {}
+        self._tables: Dict[tuple, Optional[AliasTable]] = {}
+        self.reload()
+
+    def reload(self):
+        """Re-read the sampling index (e.g. after another process added scenarios)"""
+        with self._lock:
+            rows = self._conn.execute("SELECT id, weight, severity, theme, nations FROM crises").fetchall()
+            self._index = {row[0]: (row[1], row[2], row[3], frozenset(filter(None, row[4].split(","))))
+                           for row in rows}
+            self._tables = {}
+
+    def count(self) -> int:
+        return len(self._index)
+
+    def fingerprints(self) -> set:
+        with self._lock:
+            return {row[0] for row in self._conn.execute("SELECT fingerprint FROM crises")}
+
+    def add_many(self, crises: List[Dict], source: str = "manual", weight: float = 1.0) -> int:
+        """Insert valid crises in one transaction, skipping duplicates; returns how many were added"""
+        added = 0
+        with self._lock:
+            with self._conn:
+                for crisis in crises:
+                    errors = validate_crisis(crisis)
+                    if errors:
+                        raise ValueError(f"Invalid crisis '{crisis.get('name')}': {'; '.join(errors)}")
+                    nations = affected_nations(crisis)
+                    cursor = self._conn.execute(
+                        "INSERT OR IGNORE INTO crises (fingerprint, name, theme, severity, nations, weight, source, "
+                        "created_at, payload) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        (crisis_fingerprint(crisis), crisis['name'], crisis['theme'], crisis['tension_increase'],
+                         ",".join(nations), weight, source, time.time(), json.dumps(crisis)))
+                    if cursor.rowcount == 0:
+                        continue  # Duplicate
+                    crisis_id = cursor.lastrowid
+                    self._index[crisis_id] = (weight, crisis['tension_increase'], crisis['theme'], frozenset(nations))
+                    added += 1
+            if added:
+                self._tables = {}
+        return added
+
+    def add(self, crisis: Dict, source: str = "manual", weight: float = 1.0) -> bool:
+        return self.add_many([crisis], source, weight) == 1
+
+    def seed_builtins(self) -> int:
+        """Add the hand-written scenarios the engine ships with"""
+        return self.add_many(BUILTIN_CRISES, source="builtin")
+
+    def _alias_table(self, key: tuple) -> Optional[AliasTable]:
+        with self._lock:
+            if key not in self._tables:
+                severity, theme, nation = key
+                matches = [(crisis_id, entry[0]) for crisis_id, entry in self._index.items()
+                           if (severity is None or entry[1] == severity)
+                           and (theme is None or entry[2] == theme)
+                           and (nation is None or nation in entry[3])]
+                self._tables[key] = AliasTable(*map(list, zip(*matches))) if matches else None
+            return self._tables[key]
+
+    def sample(self, severity: Optional[int] = None, theme: Optional[str] = None,
+               nation: Optional[str] = None, rng=random) -> Optional[Dict]:
+        """Weighted random crisis matching the filters, or None if nothing matches"""
+        table = self._alias_table((severity, theme, nation))
+        if table is None:
+            return None
+        crisis_id = table.sample(rng)
+        with self._lock:
+            row = self._conn.execute("SELECT payload FROM crises WHERE id = ?", (crisis_id,)).fetchone()
+        return json.loads(row[0])
+
+    def get_stats(self) -> Dict:
+        """Scenario counts by severity, theme and affected nation"""
+        by_severity, by_theme, by_nation = {}, {}, {}
+        for _, severity, theme, nations in list(self._index.values()):
+            by_severity[severity] = by_severity.get(severity, 0) + 1
+            by_theme[theme] = by_theme.get(theme, 0) + 1
+            for nation in nations:
+                by_nation[nation] = by_nation.get(nation, 0) + 1
+        return {'total': len(self._index), 'by_severity': dict(sorted(by_severity.items())),
+                'by_theme': by_theme, 'by_nation': by_nation}
+
+    def close(self):
+        self._conn.close()
+
+
+# Procedural generation: combinatorial scenarios for offline use without a model
+
+LOCATIONS = ["Svalbard", "the Bering Strait", "the Northern Sea Route", "the Northwest Passage",
+             "the Lomonosov Ridge", "the Barents Sea", "Greenland's east coast", "Franz Josef Land",
+             "the Beaufort Sea", "the Kara Sea", "Wrangel Island", "the Chukchi Sea"]
+NATION_ASSETS = {
+    "Russia": "Northern Fleet", "China": "Xue Long icebreaker group", "United States": "Coast Guard cutter Healy"}
+SEVERITY_WORDS = {1: "minor", 2: "serious", 3: "major", 4: "severe", 5: "catastrophic"}
+THEME_RESOURCES = {"environmental": "political", "military": "military", "cyber": "information",
+                   "resources": "economic", "climate": "economic", "diplomatic": "political", "economic": "economic"}
+THEME_INCIDENTS = {
+    "environmental": [("{Severity} Spill off {location}", "A {severity} fuel spill from a vessel linked to {a} spreads across {location}. {b} demands compensation while monitoring stations report damage to fisheries."),
+                      ("{Severity} Methane Release at {location}", "A {severity} methane release near {location} is blamed on {a} drilling. {b} calls for an international inquiry.")],
+    "military": [("{Severity} Naval Standoff at {location}", "The {a_asset} and the {b_asset} lock fire-control radars in a {severity} standoff near {location}. Both sides refuse to withdraw."),
+                 ("{Severity} Airspace Incident over {location}", "{a} long-range bombers trigger a {severity} intercept by {b} fighters over {location}, with aircraft passing metres apart.")],
+    "cyber": [("{Severity} Navigation Hack near {location}", "A {severity} GPS spoofing campaign attributed to {a} strands shipping near {location}. {b} traces the intrusion to state servers."),
+              ("{Severity} Cable Sabotage at {location}", "A {severity} cut to undersea data cables near {location} isolates {b} research stations. Suspicion falls on {a}.")],
+    "resources": [("{Severity} Mineral Claim at {location}", "{a} announces a {severity} rare earth discovery at {location} and moves survey teams in. {b} disputes the claim."),
+                  ("{Severity} Oil Find at {location}", "A {severity} offshore oil find at {location} prompts {a} to fast-track drilling permits, defying objections from {b}.")],
+    "climate": [("{Severity} Ice Collapse at {location}", "A {severity} ice shelf collapse opens new water at {location}. {a} rushes vessels in while {b} warns of unsafe navigation."),
+                ("{Severity} Early Thaw at {location}", "A {severity} early thaw at {location} opens a shipping window weeks ahead of schedule, and {a} convoys race {b} for the route.")],
+    "diplomatic": [("{Severity} Treaty Walkout over {location}", "{a} walks out of Arctic Council talks over {location} in a {severity} diplomatic rupture, accusing {b} of bad faith."),
+                   ("{Severity} Envoy Expulsion over {location}", "{a} expels {b} diplomats in a {severity} escalation over survey rights at {location}.")],
+    "economic": [("{Severity} Port Blockade at {location}", "{a} customs authorities impose a {severity} inspection blockade at {location}, stranding {b} cargo for days."),
+                 ("{Severity} Sanctions over {location}", "{a} announces {severity} sanctions on firms operating at {location}, targeting {b} shipping and insurers.")],
+}
+CONSEQUENCE_TEMPLATES = [
+    "{b} demands an emergency Arctic Council session on {location}",
+    "{a} state media frames the incident as defending national interests",
+    "Insurers raise premiums for all traffic through {location}",
+    "Indigenous communities near {location} call for international protection",
+    "NATO and partner militaries increase surveillance around {location}",
+    "Commodity markets react sharply to uncertainty at {location}",
+]
+
+
+def procedural_crisis(theme: str, severity: int, rng=random) -> Dict:
+    """Compose a valid crisis from templates (no model needed)"""
+    a, b = rng.sample(list(NATION_ASSETS), 2)
+    location = rng.choice(LOCATIONS)
+    name_template, description_template = rng.choice(THEME_INCIDENTS[theme])
+    words = {"a": a, "b": b, "location": location, "a_asset": f"{a} {NATION_ASSETS[a]}",
+             "b_asset": f"{b} {NATION_ASSETS[b]}", "severity": SEVERITY_WORDS[severity],
+             "Severity": SEVERITY_WORDS[severity].title()}
+    resource = THEME_RESOURCES[theme]
+    fields = {nation: field for field, nation in NATION_FIELDS.items()}
+    loss = min(3, severity // 2 + 1)
+    return {
+        "theme": theme,
+        "name": name_template.format(**words),
+        "description": description_template.format(**words),
+        "video_prompt": f"Cinematic Arctic footage at {location}: {description_template.format(**words).split('.')[0].lower()}, "
+                        f"harsh polar light, drones and ships converging",
+        "consequences": [c.format(**words) for c in rng.sample(CONSEQUENCE_TEMPLATES, 4)],
+        "tension_increase": severity,
+        "affected_resources": {
+            fields[a]: {resource: -loss, "political": -1} if resource != "political" else {resource: -loss},
+            fields[b]: {resource: 1},
+        },
+    }
+
+
+def llm_crisis_maker(model_client) -> Callable[[str, int], Awaitable[Dict]]:
+    """Crisis generator backed by a chat model; the result still goes through validate_crisis"""
+    from autogen_core.models import SystemMessage, UserMessage
+
+    async def make(theme: str, severity: int) -> Dict:
+        prompt = f"""Invent a new opening crisis for an Arctic geopolitical wargame between Russia, China and the United States.
+Theme: {theme}. Severity: {severity} on a 1-5 scale (this is the tension increase).
+
+Respond with JSON only:
+{{
+    "name": "short headline",
+    "description": "2-3 dramatic sentences",
+    "video_prompt": "detailed visual prompt",
+    "consequences": ["consequence 1", "consequence 2", "consequence 3", "consequence 4"],
+    "affected_resources": {{"russia_resources": {{"military": -1}}, "china_resources": {{}}, "us_resources": {{}}}}
+}}
+Resource changes must be integers from -3 to 3 on military, economic, political or information."""
+        response = await model_client.create(messages=[
+            SystemMessage(source="system", content="You are a wargame scenario designer. Output strict JSON."),
+            UserMessage(source="user", content=prompt),
+        ])
+        crisis = json.loads(response.content)
+        crisis['affected_resources'] = {k: v for k, v in crisis.get('affected_resources', {}).items() if v}
+        crisis.update(theme=theme, tension_increase=severity)
+        return crisis
+
+    return make
+
+
+async def generate_library(library: CrisisLibrary, count: int, make_crisis: Callable[[str, int], Awaitable[Dict]],
+                           concurrency: int = 8, batch_size: int = 100, source: str = "generated",
+                           max_attempts: Optional[int] = None) -> Dict[str, int]:
+    """Add `count` new validated, deduplicated crises, running at most `concurrency` generations at once"""
+    semaphore = asyncio.Semaphore(concurrency)
+    seen = library.fingerprints()
+    batch: List[Dict] = []
+    stats = {'attempts': 0, 'added': 0, 'invalid': 0, 'duplicates': 0, 'errors': 0}
+    max_attempts = max_attempts or count * 5
+    # Cycle themes and severities so every index bucket gets scenarios
+    combos = [(theme, severity) for theme in THEMES for severity in range(1, 6)]
+
+    def flush():
+        if batch:
+            stats['added'] += library.add_many(batch, source=source)
+            batch.clear()
+
+    async def attempt(n: int):
+        theme, severity = combos[n % len(combos)]
+        async with semaphore:
+            try:
+                crisis = await make_crisis(theme, severity)
+            except Exception as e:
+                stats['errors'] += 1
+                print(f"Crisis generation failed: {e}")
+                return
+        if validate_crisis(crisis):
+            stats['invalid'] += 1
+            return
+        fingerprint = crisis_fingerprint(crisis)
+        if fingerprint in seen:
+            stats['duplicates'] += 1
+            return
+        seen.add(fingerprint)
+        batch.append(crisis)
+        if len(batch) >= batch_size:
+            flush()
+
+    while stats['added'] + len(batch) < count and stats['attempts'] < max_attempts:
+        wave = min(count - stats['added'] - len(batch), max_attempts - stats['attempts'])
+        await asyncio.gather(*(attempt(stats['attempts'] + i) for i in range(wave)))
+        stats['attempts'] += wave
+    flush()
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build and inspect the opening crisis library")
+    parser.add_argument("--db", default=DEFAULT_LIBRARY_PATH)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    generate_parser = subparsers.add_parser("generate", help="Add generated scenarios")
+    generate_parser.add_argument("--count", type=int, default=1000)
+    generate_parser.add_argument("--concurrency", type=int, default=8)
+    generate_parser.add_argument("--llm", action="store_true", help="Generate with the configured model")
+    subparsers.add_parser("stats", help="Show library counts")
+    args = parser.parse_args()
+
+    library = CrisisLibrary(args.db)
+    if args.command == "generate":
+        library.seed_builtins()
+        if args.llm:
+            import yaml
+            from autogen_core.models import ChatCompletionClient
+            with open(MODEL_CONFIG_PATH, "r") as f:
+                make_crisis = llm_crisis_maker(ChatCompletionClient.load_component(yaml.safe_load(f)))
+            source = "llm"
+        else:
+            async def make_crisis(theme, severity):
+                return procedural_crisis(theme, severity)
+            source = "procedural"
+        start = time.perf_counter()
+        stats = asyncio.run(generate_library(library, args.count, make_crisis, args.concurrency, source=source))
+        elapsed = time.perf_counter() - start
+        print(f"✅ Added {stats['added']} crises in {elapsed:.1f}s ({stats['attempts'] / elapsed:.0f} attempts/s): {stats}")
+    print(json.dumps(library.get_stats(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+Pool of pre-warmed engines with their opening crises already generated.
+
+Starting a game used to pay for runtime creation, agent registration, model-client loading
+and an LLM round-trip to enhance the opening crisis while the player watched a spinner.
+The pool does that work in the background on the shared event loop and keeps `target_depth`
+engines ready, so "Start New Game" is a constant-time checkout. A checkout from an empty
+pool (a miss) hands out a fresh engine that prepares itself in start_game as before.
+
+Usage:
+    engine = get_engine_pool().checkout()
+    await engine.start_game()  # O(1) on a hit
+"""
+
+import asyncio
+import os
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict, List, Optional
+
+from game_engine import ArcticWargameEngine
+
+DEFAULT_TARGET_DEPTH = 2
+
+
+class EnginePool:
+    """Keeps `target_depth` prepared engines ready for checkout"""
+
+    def __init__(self, background_loop, target_depth: int = DEFAULT_TARGET_DEPTH,
+                 factory: Callable[[], ArcticWargameEngine] = ArcticWargameEngine):
+        self.background_loop = background_loop
+        self.target_depth = target_depth
+        self.factory = factory
+        self._ready: deque = deque()
+        self._refilling = 0
+        self._lock = threading.Lock()
+        self.stats = {'hits': 0, 'misses': 0, 'refills': 0, 'refill_failures': 0}
+        self.refill_seconds: List[float] = []  # Recent prepare_game() durations
+
+    @property
+    def depth(self) -> int:
+        return len(self._ready)
+
+    def checkout(self) -> ArcticWargameEngine:
+        """Take a prepared engine if one is ready, otherwise a fresh one; then top the pool up"""
+        with self._lock:
+            if self._ready:
+                engine = self._ready.popleft()
+                self.stats['hits'] += 1
+            else:
+                engine = self.factory()
+                self.stats['misses'] += 1
+        self.fill()
+        return engine
+
+    def fill(self) -> int:
+        """Schedule enough background preparations to reach the target depth"""
+        with self._lock:
+            needed = self.target_depth - len(self._ready) - self._refilling
+            self._refilling += max(0, needed)
+        for _ in range(needed):
+            self.background_loop.submit(self._prepare_one())
+        return max(0, needed)
+
+    async def _prepare_one(self):
+        start = time.perf_counter()
+        engine = self.factory()
+        try:
+            await engine.prepare_game()
+        except Exception as e:
+            print(f"Engine pool refill failed: {e}")
+            with self._lock:
+                self._refilling -= 1
+                self.stats['refill_failures'] += 1
+            return
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            self._refilling -= 1
+            self._ready.append(engine)
+            self.stats['refills'] += 1
+            self.refill_seconds = (self.refill_seconds + [elapsed])[-50:]
+
+    async def wait_until_full(self, timeout: Optional[float] = None):
+        """Wait (on any loop) until the pool reaches its target depth"""
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        while self.depth < self.target_depth:
+            if deadline is not None and time.monotonic() > deadline:
+                break
+            await asyncio.sleep(0.01)
+
+    def get_stats(self) -> Dict:
+        """Hit/miss counts, current depth and refill latency"""
+        with self._lock:
+            checkouts = self.stats['hits'] + self.stats['misses']
+            refill = sorted(self.refill_seconds)
+            return dict(
+                self.stats,
+                depth=len(self._ready),
+                target_depth=self.target_depth,
+                refilling=self._refilling,
+                hit_rate=self.stats['hits'] / checkouts if checkouts else 0.0,
+                refill_avg_ms=sum(refill) / len(refill) * 1000 if refill else 0.0,
+                refill_p95_ms=refill[min(len(refill) - 1, int(len(refill) * 0.95))] * 1000 if refill else 0.0,
+            )
+
+
+_engine_pool: Optional[EnginePool] = None
+_engine_pool_lock = threading.Lock()
+
+
+def get_engine_pool(target_depth: int = DEFAULT_TARGET_DEPTH) -> EnginePool:
+    """Process-wide engine pool on the shared background loop, filled on first use"""
+    global _engine_pool
+    with _engine_pool_lock:
+        if _engine_pool is None:
+            from crisis_library import DEFAULT_LIBRARY_PATH, CrisisLibrary
+            from streamlit_loop import get_background_loop
+            # Pooled engines share one library connection; opening crises need no LLM call
+            library = CrisisLibrary(DEFAULT_LIBRARY_PATH) if os.path.exists(DEFAULT_LIBRARY_PATH) else None
+            # Exporting played games is opt-in, and every pooled engine shares one buffered writer
+            export_dir = os.environ.get("WARGAME_EXPORT_DIR")
+
+            def factory():
+                engine = ArcticWargameEngine()
+                engine.crisis_library = library
+                if export_dir:
+                    engine.enable_game_export(export_dir)
+                return engine
+            _engine_pool = EnginePool(get_background_loop(), target_depth, factory)
+            _engine_pool.fill()
+        return _engine_pool
@@ -1,6 +1,10 @@
 import asyncio
+import copy
+import datetime
 import random
-from typing import Dict, List, Optional
+import time
+import uuid
+from typing import TYPE_CHECKING, Dict, List, Optional
 import yaml
 from autogen_core import SingleThreadedAgentRuntime, AgentId
 from autogen_core.models import ChatCompletionClient
@@ -14,6 +18,11 @@ from arctic_agents import (
     ActionResultMessage,
     ActionType
 )
+from crisis_library import BUILTIN_CRISES
+from game_events import GameEvent
+
+if TYPE_CHECKING:
+    from policy_distill import DecisionLogger, DistilledPolicy
 
 class ArcticWargameEngine:
     def __init__(self):
@@ -26,6 +35,31 @@ class ArcticWargameEngine:
         self.human_player_mode = True  # Enable human control of United States
         self.discussion_history: List[Dict] = []  # Track discussion between human and AI
         self.current_suggestion: Optional[Dict] = None  # Current AI suggestion being discussed
+        self.model_client: Optional[ChatCompletionClient] = None  # Loaded by initialize() unless set before
+        self.decision_logger: Optional["DecisionLogger"] = None  # Logs successful LLM nation decisions for distillation
+        self.distilled_policies: Dict[str, "DistilledPolicy"] = {}  # Nation -> DistilledPolicy mimicking its LLM
+        self.pipelined_mode = False  # Speculatively plan next turn's alliance moves during human deliberation
+        self.speculate_narrations = True  # Also start narrations for the most likely speculated branches
+        self.speculation_width = 2  # Number of most likely speculated branches to narrate in the background
+        self._speculated_plans: Dict[tuple, List[Dict]] = {}
+        self.speculation_stats = {'hits': 0, 'misses': 0, 'branches': 0, 'narrations': 0, 'narrations_used': 0}
+        self.background_narration = True  # Resolve the human's action immediately and narrate it in the background
+        self.resolved_actions: List[Dict] = []  # Compact log of recently resolved actions for live views
+        self.resolved_action_count = 0  # Total resolved actions, so views can ask for "everything since N"
+        self._narration_tasks: List[asyncio.Task] = []
+        self._narration_listeners: List = []
+        self._state_listeners: List = []  # callback(result) after every state change, e.g. spectator broadcast
+        self.prepared_crisis: Optional[Dict] = None  # Opening crisis generated ahead of time (see engine_pool.py)
+        self.crisis_library = None  # Indexed CrisisLibrary to draw opening crises from (see crisis_library.py)
+        self.enhance_library_crises = False  # Also run the start-time LLM enhancement on library crises
+        self.game_exporter = None  # Receives per-turn rows for analytics (see game_export.py)
+        self.game_id: Optional[str] = None
+        self.game_result: Optional[str] = None  # The victory (or turn-limit) result that ended the game
+        self.game_started_at: Optional[datetime.datetime] = None
+        self._turn_moves: Dict[str, tuple] = {}  # Nation -> (action, success) resolved this turn
+        self._turn_llm_seconds = 0.0
+        self._turn_llm_calls = 0
+        self._turn_discussions = 0
         
     async def initialize(self):
         """Initialize the game engine with agents"""
@@ -33,22 +67,25 @@ class ArcticWargameEngine:
             return
             
         # Load model configuration
-        try:
-            with open("/workspaces/ai-app/agentchat_streamlit/model_config.yml", "r") as f:
-                model_config = yaml.safe_load(f)
-            model_client = ChatCompletionClient.load_component(model_config)
-        except Exception as e:
-            # Fallback to mock client for testing
-            model_client = None
-            print(f"Warning: Could not load model client: {e}")
+        if self.model_client is None:
+            try:
+                with open("/workspaces/ai-app/agentchat_streamlit/model_config.yml", "r") as f:
+                    model_config = yaml.safe_load(f)
+                self.model_client = ChatCompletionClient.load_component(model_config)
+            except Exception as e:
+                # Fallback to mock client for testing
+                print(f"Warning: Could not load model client: {e}")
+        model_client = self.model_client
         
         # Create runtime
         self.runtime = SingleThreadedAgentRuntime()
         
         # Register agents with runtime using factory functions
         await ArcticGameMaster.register(self.runtime, "game_master", lambda: ArcticGameMaster(model_client))
-        await RussianAgent.register(self.runtime, "russia", lambda: RussianAgent(model_client))
-        await ChineseAgent.register(self.runtime, "china", lambda: ChineseAgent(model_client))
+        await RussianAgent.register(self.runtime, "russia", lambda: RussianAgent(
+            model_client, self.decision_logger, self.distilled_policies.get("Russia")))
+        await ChineseAgent.register(self.runtime, "china", lambda: ChineseAgent(
+            model_client, self.decision_logger, self.distilled_policies.get("China")))
         await USAgent.register(self.runtime, "usa", lambda: USAgent(model_client))
         
         # Create a separate game master instance for direct access to game state
@@ -56,104 +93,47 @@ class ArcticWargameEngine:
         self.game_master = ArcticGameMaster(model_client)
         
         self.is_initialized = True
-        
-    async def generate_opening_crisis(self) -> Dict:
+    
+    async def prepare_game(self):
+        """Do the slow part of start_game ahead of time: initialize and generate the opening crisis"""
+        await self.initialize()
+        if self.prepared_crisis is None:
+            self.prepared_crisis = await self.generate_opening_crisis()
+    
+    def use_crisis_library(self, library_path: str) -> int:
+        """Draw opening crises from a crisis library built with crisis_library.py; returns its size"""
+        from crisis_library import CrisisLibrary
+        self.crisis_library = CrisisLibrary(library_path)
+        return self.crisis_library.count()
+    
+    def enable_decision_logging(self, log_path: str):
+        """Log successful LLM nation decisions to a JSONL file (call before initialize). While
+        logging, live alliance moves are decided by the nation agents, which call the model."""
+        from policy_distill import DecisionLogger
+        self.decision_logger = DecisionLogger(log_path)
+    
+    def enable_game_export(self, export_dir: str):
+        """Export a row per nation per turn to partitioned Parquet under export_dir"""
+        from game_export import get_game_exporter
+        self.game_exporter = get_game_exporter(export_dir)
+    
+    def load_distilled_policies(self, policy_path: str) -> List[str]:
+        """Load distilled nation policies trained with policy_distill.py"""
+        from policy_distill import load_policies
+        self.distilled_policies = load_policies(policy_path)
+        return list(self.distilled_policies)
+        
+    async def generate_opening_crisis(self, severity: Optional[int] = None, theme: Optional[str] = None,
+                                      nation: Optional[str] = None) -> Dict:
         """Generate a dramatic opening crisis event"""
-        crisis_scenarios = [
-            {
-                "name": "Arctic Environmental Disaster",
-                "description": "Chinese oil tanker Shen Zhou carrying Russian Arctic crude oil suffers catastrophic hull breach during severe storm. 150,000 tons of oil spill into pristine Arctic waters, creating environmental crisis spanning three national territories.",
-                "video_prompt": "Massive Chinese oil tanker breaking apart in violent Arctic storm, thick black oil spreading across pristine white ice sheets, emergency helicopters circling overhead, environmental disaster unfolding under dramatic aurora borealis, seabirds covered in oil struggling in freezing waters",
-                "consequences": [
-                    "Massive environmental cleanup required across international waters",
-                    "Russia denies responsibility - claims Chinese navigation error", 
-                    "China demands Russia pay for cleanup - oil was Russian property",
-                    "Indigenous communities report contaminated fishing grounds",
-                    "International environmental groups demand immediate action"
-                ],
-                "tension_increase": 2,
-                "affected_resources": {
-                    "russia_resources": {"political": -1, "economic": -2},
-                    "china_resources": {"political": -2, "economic": -1}, 
-                    "us_resources": {"political": 1}  # US gains moral authority
-                }
-            },
-            {
-                "name": "Arctic Submarine Collision",
-                "description": "Russian nuclear submarine Komsomolsk collides with Chinese research vessel during covert Arctic mapping mission. Both crews rescued but classified technology scattered across Arctic seabed in disputed territorial waters.",
-                "video_prompt": "Nuclear submarine surfacing through cracked Arctic ice in emergency, Chinese research vessel listing heavily with massive hull damage, military helicopters from multiple nations converging on scene, underwater footage of classified equipment sinking to ocean floor, tense rescue operations in blizzard conditions",
-                "consequences": [
-                    "Classified Russian naval technology exposed on seabed",
-                    "China accuses Russia of ramming civilian research vessel",
-                    "Russia claims Chinese ship was conducting espionage operations", 
-                    "International salvage rights disputed across territorial claims",
-                    "NATO monitoring Russian nuclear safety protocols"
-                ],
-                "tension_increase": 3,
-                "affected_resources": {
-                    "russia_resources": {"military": -2, "information": -1},
-                    "china_resources": {"political": -1, "information": -2},
-                    "us_resources": {"information": 2}  # US gains intelligence advantage
-                }
-            },
-            {
-                "name": "Arctic Cyber Infrastructure Attack",
-                "description": "Massive cyber attack cripples Arctic shipping navigation systems during peak transit season. GPS satellites feeding false data, icebreaker fleets stranded, international shipping paralyzed. Attack origin unknown but sophisticated state-level operation suspected.",
-                "video_prompt": "Multiple cargo ships and icebreakers dead in Arctic waters, navigation screens showing error messages, cyber warfare command centers with analysts frantically typing, satellite dishes and communication arrays sparking and going dark, ships' crews using manual navigation by stars over frozen landscape",
-                "consequences": [
-                    "International Arctic shipping completely paralyzed",
-                    "Russia blames US cyber warfare capabilities",
-                    "China accuses Russia of sabotaging Belt and Road shipping",
-                    "US denies involvement but offers to investigate",
-                    "Emergency international cyber security summit called"
-                ],
-                "tension_increase": 4,
-                "affected_resources": {
-                    "russia_resources": {"economic": -2, "information": -1},
-                    "china_resources": {"economic": -3},
-                    "us_resources": {"information": 1, "political": 1}
-                }
-            },
-            {
-                "name": "Arctic Resource Discovery Crisis", 
-                "description": "Massive rare earth element deposit discovered directly on Russia-China-US territorial claim overlap. Geological surveys indicate deposit worth $2 trillion. All three nations immediately dispatch military forces to secure the area.",
-                "video_prompt": "Geological survey teams in hazmat suits extracting mineral samples from pristine Arctic landscape, massive military convoys from three nations racing across frozen terrain toward same location, fighter jets from different countries circling overhead, heated diplomatic meetings with world maps showing territorial claims, military bases being rapidly constructed in harsh conditions",
-                "consequences": [
-                    "$2 trillion rare earth deposit spans disputed territorial waters",
-                    "Russia immediately begins military base construction", 
-                    "China deploys icebreaker fleet with mining equipment",
-                    "US sends nuclear submarines to assert territorial claims",
-                    "International law experts warn of potential armed conflict"
-                ],
-                "tension_increase": 5,
-                "affected_resources": {
-                    "russia_resources": {"military": 1, "economic": 2},
-                    "china_resources": {"economic": 2, "political": 1},
-                    "us_resources": {"military": 1, "political": 1}
-                }
-            },
-            {
-                "name": "Arctic Climate Tipping Point",
-                "description": "Sudden acceleration of Arctic ice sheet collapse triggers unprecedented global climate event. Sea levels rise 2 meters overnight, new shipping lanes open, coastal cities flood. Nations scramble to adapt while exploiting new opportunities.",
-                "video_prompt": "Massive ice sheets cracking and collapsing into ocean with thunderous roars, coastal cities with flood waters rushing through streets, emergency evacuations by helicopter, new open water shipping lanes revealed in previously frozen Arctic, nations' military ships racing toward newly accessible resources, dramatic time-lapse of changing Arctic map",
-                "consequences": [
-                    "Unprecedented Arctic shipping lanes suddenly open",
-                    "Coastal flooding requires massive international response",
-                    "New territorial water boundaries disputed globally", 
-                    "Arctic resources become immediately accessible",
-                    "Climate refugees create international crisis"
-                ],
-                "tension_increase": 3,
-                "affected_resources": {
-                    "russia_resources": {"economic": 3, "political": -1},
-                    "china_resources": {"economic": 2, "political": -1},
-                    "us_resources": {"political": -2, "military": 1}
-                }
-            }
-        ]
+        # Sample the indexed crisis library if one is loaded (filters: tension increase, theme, affected nation)
+        selected_crisis = self.crisis_library.sample(severity, theme, nation) if self.crisis_library else None
+        if selected_crisis is not None and not self.enhance_library_crises:
+            return selected_crisis  # Library scenarios were written offline - no start-time LLM call
         
-        # Select random crisis or specific one if requested
-        selected_crisis = random.choice(crisis_scenarios)
+        if selected_crisis is None:
+            # Select random crisis or specific one if requested
+            selected_crisis = copy.deepcopy(random.choice(BUILTIN_CRISES))
         
         # Try to enhance with AI if available
         try:
@@ -208,7 +188,7 @@ Respond in JSON:
                 UserMessage(source="user", content=user_prompt)
             ]
             
-            response = await model_client.create(messages=messages)
+            response = await self._timed_create(model_client, messages)
             response_text = response.content if hasattr(response, 'content') else str(response)
             
             import json
@@ -231,9 +211,14 @@ Respond in JSON:
             await self.initialize()
             
         self.game_history = []
-        
-        # Generate and apply opening crisis
-        opening_crisis = await self.generate_opening_crisis()
+        self.game_id = uuid.uuid4().hex
+        self.game_result = None
+        self.game_started_at = datetime.datetime.now(datetime.timezone.utc)
+        self._reset_turn_stats()
+        
+        # Generate and apply opening crisis (already attached if this engine came from the pool)
+        opening_crisis = self.prepared_crisis or await self.generate_opening_crisis()
+        self.prepared_crisis = None
         self.opening_crisis = opening_crisis
         
         # Apply crisis effects to game state
@@ -255,14 +240,16 @@ Respond in JSON:
                 resources[resource_type] = max(0, min(10, resources[resource_type] + change))
         
         # Add crisis to recent events
-        self.game_master._game_state.recent_events.append(f"🚨 BREAKING: {opening_crisis['name']}")
-        self.game_master._game_state.recent_events.append(f"📰 {opening_crisis['description']}")
+        self.game_master._game_state.recent_events.append(GameEvent("crisis.breaking", detail=opening_crisis['name']))
+        self.game_master._game_state.recent_events.append(
+            GameEvent("crisis.description", detail=opening_crisis['description']))
         
         # Add consequences
         for consequence in opening_crisis['consequences'][:3]:  # Limit to first 3 consequences
-            self.game_master._game_state.recent_events.append(f"⚡ {consequence}")
+            self.game_master._game_state.recent_events.append(GameEvent("crisis.consequence", detail=consequence))
         
         self.game_master._game_state.turn = 1
+        self._notify_state_listeners("game_started")
         
     async def execute_turn(self):
         """Execute one turn of the game"""
@@ -273,7 +260,9 @@ Respond in JSON:
         self.game_master._game_state.turn += 1
         
         # Simulate agent actions and return result
-        return await self._simulate_agent_actions()
+        result = await self._simulate_agent_actions()
+        self._notify_state_listeners(result)
+        return result
         
     def get_game_state(self) -> Optional[GameState]:
         """Get current game state"""
@@ -293,19 +282,7 @@ Respond in JSON:
         if turn > 2 and self.previous_actions:
             self._add_turn_reflections()
         
-        # Add random events occasionally
-        if random.random() < 0.25:
-            events = [
-                "Massive oil deposit discovered in disputed Arctic waters",
-                "Climate change accelerates Arctic ice melting", 
-                "International Arctic Council calls emergency meeting",
-                "Commercial shipping vessel reports harassment by military patrol",
-                "Environmental activists protest Arctic drilling operations",
-                "New shipping route opens through melting ice",
-                "Submarine incident reported near North Pole",
-                "Arctic research station establishes new base"
-            ]
-            self.game_master._game_state.recent_events.append(random.choice(events))
+        self._add_random_event()
         
         # Track this turn's actions
         current_turn_actions = []
@@ -321,52 +298,34 @@ Respond in JSON:
         ai_nations = [("Russia", self.game_master._game_state.russia_resources),
                      ("China", self.game_master._game_state.china_resources)]
         
-        # Make Russia and China coordinate their actions (alliance behavior)
-        for nation, resources in ai_nations:
-            if random.random() < 0.8:  # 80% chance AI nations act (more aggressive)
-                # Get action with alliance coordination
-                action_with_reasoning = self._get_alliance_action(nation, resources, current_turn_actions)
-                if action_with_reasoning:
-                    action, reasoning = action_with_reasoning
-                    
-                    # Show reasoning
-                    self.game_master._game_state.recent_events.append(
-                        f"🧠 {nation} strategic thinking: {reasoning}"
-                    )
-                    
-                    # Apply action effects
-                    success = random.random() < 0.8  # Higher success rate for AI alliance
-                    outcome = "succeeds" if success else "fails"
-                    
-                    # Generate dramatic description for AI action
-                    dramatic_content = await self.generate_dramatic_action_description(action, success, nation)
-                    
-                    # Add dramatic action result
-                    event_msg = f"⚡ {dramatic_content['dramatic_description']}"
-                    self.game_master._game_state.recent_events.append(event_msg)
-                    
-                    # Store video prompt for potential use
-                    action['generated_video_prompt'] = dramatic_content['video_prompt']
-                    action['tactical_details'] = dramatic_content['tactical_details']
-                    
-                    # Track action for future reactions
-                    current_turn_actions.append({
-                        'nation': nation,
-                        'action': action,
-                        'success': success,
-                        'turn': turn
-                    })
-                    
-                    # Update resources
-                    self._apply_action_effects(resources, action, success)
-                    
-                    # Update tension
-                    self._update_tension(action, success, nation)
+        # Use alliance moves speculated while the human was deliberating, if the actual outcome matches
+        # (speculation plans with the strategic rules, so it is off while the agents decide)
+        speculate = self.pipelined_mode and not self._agents_decide_alliance()
+        speculated_plans = self._take_speculated_plans() if speculate else None
+        if speculated_plans is not None:
+            resources_by_nation = dict(ai_nations)
+            for plan in speculated_plans:
+                resources = resources_by_nation[plan['nation']]
+                if all(resources.get(r, 0) >= c for r, c in plan['action']['cost'].items()):
+                    await self._resolve_alliance_action(plan['nation'], resources, plan['action'], plan['reasoning'],
+                                                        plan['success'], current_turn_actions, turn, plan.get('narration_task'))
+        else:
+            # Make Russia and China coordinate their actions (alliance behavior)
+            for nation, resources in ai_nations:
+                if random.random() < 0.8:  # 80% chance AI nations act (more aggressive)
+                    # Get action with alliance coordination
+                    action_with_reasoning = await self._decide_alliance_action(nation, resources, current_turn_actions)
+                    if action_with_reasoning:
+                        action, reasoning = action_with_reasoning
+                        success = random.random() < 0.8  # Higher success rate for AI alliance
+                        await self._resolve_alliance_action(nation, resources, action, reasoning, success, current_turn_actions, turn)
         
         # Check if human player (US) should act
         if self.human_player_mode:
             # Store current turn actions for human to see AI moves
             self.current_turn_actions = current_turn_actions
+            if speculate:
+                self._start_speculation()
             return "human_action_needed"
         else:
             # AI mode - US acts automatically
@@ -375,14 +334,20 @@ Respond in JSON:
                 action_with_reasoning = self._get_strategic_action("United States", us_resources, current_turn_actions)
                 if action_with_reasoning:
                     action, reasoning = action_with_reasoning
-                    self.game_master._game_state.recent_events.append(f"🧠 United States strategic thinking: {reasoning}")
+                    self.game_master._game_state.recent_events.append(
+                        GameEvent("reasoning", "United States", detail=reasoning))
                     success = random.random() < 0.75
                     outcome = "succeeds" if success else "fails"
-                    event_msg = f"⚡ United States {action['name']} {outcome}: {action['description']}"
-                    self.game_master._game_state.recent_events.append(event_msg)
+                    self._record_resolved_action("United States", action, success)
+                    self.game_master._game_state.recent_events.append(
+                        GameEvent(f"action.{outcome}", "United States", action['name'], detail=action['description']))
                     self._apply_action_effects(us_resources, action, success)
                     self._update_tension(action, success, "United States")
         
+        return self._finish_turn(current_turn_actions)
+    
+    def _finish_turn(self, current_turn_actions: List[Dict]) -> Optional[str]:
+        """End-of-turn bookkeeping shared by the sequential and simultaneous turn paths"""
         # Store actions for next turn's reflections
         self.previous_actions = current_turn_actions
         
@@ -395,22 +360,390 @@ Respond in JSON:
         
         # Check for victory conditions
         victory_result = self._check_victory_conditions()
+        self._export_turn(victory_result)
         if victory_result:
-            self.game_master._game_state.recent_events.append(f"🏆 GAME OVER: {victory_result}")
+            self.game_master._game_state.recent_events.append(GameEvent("game_over", detail=victory_result))
+            self.game_result = victory_result
             return "game_over"
         
         # Generate situation briefing
         briefing = self._generate_situation_briefing()
         if briefing:
-            self.game_master._game_state.recent_events.append(f"📋 SITUATION BRIEFING: {briefing}")
+            self.game_master._game_state.recent_events.append(briefing)
         
         return None  # Normal turn completion
     
-    def _get_strategic_action(self, nation: str, resources: Dict[str, int], current_turn_actions: List[Dict]) -> Optional[tuple]:
-        """Get strategic action with reasoning based on current situation"""
+    async def execute_simultaneous_turn(self, moves: Dict[str, Optional[Dict]],
+                                        reasons: Optional[Dict[str, str]] = None) -> Optional[str]:
+        """Resolve one turn where every nation committed its move against the same state.
+        
+        `moves` maps nation -> chosen action (from get_nation_actions) or None, in which case
+        the AI picks for that nation. Narrations for all moves are generated concurrently.
+        """
+        if not self.is_initialized:
+            return None
+        reasons = reasons or {}
+        self.game_master._game_state.turn += 1
+        turn = self.game_master._game_state.turn
+        if turn > 2 and self.previous_actions:
+            self._add_turn_reflections()
+        self._add_random_event()
+        
+        resources_by_nation = {
+            "Russia": self.game_master._game_state.russia_resources,
+            "China": self.game_master._game_state.china_resources,
+            "United States": self.game_master._game_state.us_resources
+        }
+        
+        # Everyone decides against the pre-turn state - no nation sees another's move first
+        decisions = []
+        for nation, resources in resources_by_nation.items():
+            action = moves.get(nation)
+            if action is not None:
+                reasoning = reasons.get(nation, f"{nation} commander orders {action['name']}")
+            else:
+                if nation == "United States":
+                    choice = self._get_strategic_action(nation, resources, [])
+                else:
+                    choice = await self._decide_alliance_action(nation, resources, [])
+                if not choice:
+                    continue
+                action, reasoning = choice
+            success = random.random() < (0.75 if nation == "United States" else 0.8)
+            decisions.append((nation, resources, action, reasoning, success))
+        
+        loop = asyncio.get_running_loop()
+        narrations = [loop.create_task(self.generate_dramatic_action_description(action, success, nation))
+                      for nation, _, action, _, success in decisions]
+        
+        current_turn_actions = []
+        for (nation, resources, action, reasoning, success), narration in zip(decisions, narrations):
+            # Each move only spends its own nation's resources, so a fixed resolution order is fair
+            await self._resolve_alliance_action(nation, resources, action, reasoning, success,
+                                                current_turn_actions, turn, narration)
+        self.current_turn_actions = current_turn_actions
+        
+        result = self._finish_turn(current_turn_actions)
+        self._notify_state_listeners(result)
+        return result
+    
+    def get_nation_actions(self, nation: str) -> List[Dict]:
+        """Affordable actions a human commander of any nation can choose from"""
+        if nation == "United States":
+            return self.get_human_actions()
+        resources = {
+            "Russia": self.game_master._game_state.russia_resources,
+            "China": self.game_master._game_state.china_resources
+        }[nation]
+        return [a for a in self._nation_action_options(nation)
+                if all(resources.get(r, 0) >= c for r, c in a['cost'].items())]
+    
+    def _add_random_event(self):
+        """Add random events occasionally"""
+        if random.random() < 0.25:
+            events = [
+                "Massive oil deposit discovered in disputed Arctic waters",
+                "Climate change accelerates Arctic ice melting", 
+                "International Arctic Council calls emergency meeting",
+                "Commercial shipping vessel reports harassment by military patrol",
+                "Environmental activists protest Arctic drilling operations",
+                "New shipping route opens through melting ice",
+                "Submarine incident reported near North Pole",
+                "Arctic research station establishes new base"
+            ]
+            self.game_master._game_state.recent_events.append(random.choice(events))
+    
+    async def _resolve_alliance_action(self, nation: str, resources: Dict[str, int], action: Dict, reasoning: str,
+                                       success: bool, current_turn_actions: List[Dict], turn: int, narration_task=None):
+        """Narrate and apply one alliance nation's chosen action"""
+        # Show reasoning
+        self.game_master._game_state.recent_events.append(GameEvent("reasoning", nation, detail=reasoning))
+        
+        # Generate dramatic description for AI action (possibly already running speculatively)
+        dramatic_content = await self._await_narration(narration_task, action, success, nation)
+        
+        # Add dramatic action result
+        event_msg = f"⚡ {dramatic_content['dramatic_description']}"
+        self.game_master._game_state.recent_events.append(event_msg)
+        
+        # Store video prompt for potential use
+        action['generated_video_prompt'] = dramatic_content['video_prompt']
+        action['tactical_details'] = dramatic_content['tactical_details']
+        
+        self._record_resolved_action(nation, action, success)
+        
+        # Track action for future reactions
+        current_turn_actions.append({
+            'nation': nation,
+            'action': action,
+            'success': success,
+            'turn': turn
+        })
+        
+        # Update resources
+        self._apply_action_effects(resources, action, success)
+        
+        # Update tension
+        self._update_tension(action, success, nation)
+    
+    async def _await_narration(self, narration_task, action: Dict, success: bool, nation: str) -> Dict:
+        """Use a speculative narration if it survived, otherwise generate one now"""
+        if narration_task is not None:
+            try:
+                same_loop = narration_task.get_loop() is asyncio.get_running_loop()
+                if narration_task.done() or same_loop:
+                    return await narration_task
+            except (asyncio.CancelledError, Exception) as e:
+                print(f"Speculative narration unavailable, regenerating: {e!r}")
+        return await self.generate_dramatic_action_description(action, success, nation)
+    
+    def _record_resolved_action(self, nation: str, action: Dict, success: bool):
+        """Keep a short, compact record of resolved actions for the map and other live views"""
+        self.resolved_action_count += 1
+        self.resolved_actions.append({
+            'seq': self.resolved_action_count,
+            'turn': self.game_master._game_state.turn,
+            'nation': nation,
+            'name': action['name'],
+            'type': action['type'].value,
+            'success': success
+        })
+        self.resolved_actions = self.resolved_actions[-20:]
+        if self.game_exporter is not None:
+            self._turn_moves[nation] = (action, success)
+    
+    async def _timed_create(self, model_client, messages):
+        """model_client.create, counting its latency towards the current turn's export rows"""
+        start = time.perf_counter()
+        try:
+            return await model_client.create(messages=messages)
+        finally:
+            self._turn_llm_seconds += time.perf_counter() - start
+            self._turn_llm_calls += 1
+    
+    def _reset_turn_stats(self):
+        self._turn_moves = {}
+        self._turn_llm_seconds = 0.0
+        self._turn_llm_calls = 0
+        self._turn_discussions = 0
+    
+    def _export_turn(self, victory_result: Optional[str]):
+        """Hand the exporter one row per nation for the turn that just ended"""
+        if self.game_exporter is None:
+            return
         game_state = self.game_master._game_state
+        if self.game_id is None:
+            # Engines driven without start_game() still get an identity per game
+            self.game_id = uuid.uuid4().hex
+            self.game_started_at = datetime.datetime.now(datetime.timezone.utc)
+        victory_checks = {
+            "Russia": (game_state.russia_resources, self._check_russia_victory),
+            "China": (game_state.china_resources, self._check_china_victory),
+            "United States": (game_state.us_resources, self._check_us_victory)
+        }
+        rows = []
+        for nation, (resources, check_victory) in victory_checks.items():
+            action, success = self._turn_moves.get(nation, (None, None))
+            rows.append({
+                'game_id': self.game_id,
+                'started_at': self.game_started_at,
+                'turn': game_state.turn,
+                'nation': nation,
+                'action': action['name'] if action else None,
+                'action_type': action['type'].value if action else None,
+                'success': success,
+                'military': resources.get('military', 0),
+                'economic': resources.get('economic', 0),
+                'political': resources.get('political', 0),
+                'information': resources.get('information', 0),
+                'tension': game_state.tension_level,
+                'victory_condition': check_victory(),
+                'game_over': victory_result is not None,
+                'outcome': victory_result,
+                'llm_ms': self._turn_llm_seconds * 1000,
+                'llm_calls': self._turn_llm_calls,
+                'discussions': self._turn_discussions
+            })
+        self._reset_turn_stats()
+        try:
+            self.game_exporter.add_rows(rows)
+        except Exception as e:
+            print(f"Warning: Could not export turn: {e}")
+    
+    def get_resolved_actions_since(self, seq: int) -> List[Dict]:
+        """Resolved actions with a sequence number greater than seq"""
+        return [a for a in self.resolved_actions if a['seq'] > seq]
+    
+    def _speculation_key(self, tension: int, us_resources: Dict[str, int]) -> tuple:
+        """What the alliance's rule-based moves depend on after the human's action: the tension
+        level (the reasoning thresholds) and whether Russia out-resources China and the US
+        together. A distilled policy also reads the exact US resources."""
+        game_state = self.game_master._game_state
+        russia_leads = (sum(game_state.russia_resources.values())
+                        > sum(game_state.china_resources.values()) + sum(us_resources.values()))
+        if self.distilled_policies:
+            return (tension, russia_leads, tuple(sorted(us_resources.items())))
+        return (tension, russia_leads)
+    
+    def _predict_tension(self, action: Dict, success: bool, tension: int) -> int:
+        """Most likely tension after _update_tension (random side effects assumed not to fire)"""
+        if action['type'] == ActionType.CYBER:
+            return min(10, tension + (3 if success else 2))
+        if action['type'] in (ActionType.MILITARY, ActionType.HYBRID):
+            return min(10, tension + (2 if success else 1))
+        if action['type'] == ActionType.DIPLOMATIC and success:
+            return max(1, tension - 1)
+        return tension
+    
+    def _tension_outcomes(self, action: Dict, success: bool, tension: int) -> List[tuple]:
+        """Every (tension, probability) _update_tension can produce, including its random side effects"""
+        side_effect = {ActionType.INFORMATION: 0.3 if not success else 0.0,
+                       ActionType.INTELLIGENCE: 0.4 if success else 0.0}.get(action['type'], 0.0)
+        if not side_effect:
+            return [(self._predict_tension(action, success, tension), 1.0)]
+        return [(tension, 1.0 - side_effect), (min(10, tension + 1), side_effect)]
+    
+    def _resource_outcomes(self, resources: Dict[str, int], action: Dict, success: bool) -> List[tuple]:
+        """Every (resources, probability) _apply_action_effects can produce"""
+        outcomes = [({**resources}, 1.0)]
+        for resource, cost in action['cost'].items():
+            if resource not in resources:
+                continue
+            branches = []
+            for after, p in outcomes:
+                paid = max(0, after[resource] - cost)
+                if success:
+                    branches.append(({**after, resource: min(10, paid + 1)}, p * 0.3))
+                    branches.append(({**after, resource: paid}, p * 0.7))
+                else:
+                    branches.append(({**after, resource: paid}, p))
+            outcomes = branches
+        return outcomes
+    
+    def _plan_alliance_turn(self, tension: int, us_resources: Dict[str, int]) -> List[Dict]:
+        """Decide next turn's alliance moves against a hypothetical post-human-action state"""
+        state = self.game_master._game_state.model_copy(deep=True)
+        state.tension_level = tension
+        state.us_resources = dict(us_resources)
+        
+        plans = []
+        planned_actions = []
+        for nation, resources in [("Russia", state.russia_resources), ("China", state.china_resources)]:
+            if random.random() >= 0.8:  # Same 80% activity rate as the live path
+                continue
+            action_with_reasoning = self._get_alliance_action(nation, resources, planned_actions, state)
+            if not action_with_reasoning:
+                continue
+            action, reasoning = action_with_reasoning
+            success = random.random() < 0.8
+            plans.append({
+                'nation': nation,
+                'action': action,
+                'reasoning': reasoning,
+                'success': success,
+                'tension': state.tension_level,
+                'narration_task': None
+            })
+            planned_actions.append({'nation': nation, 'action': action, 'success': success, 'turn': state.turn + 1})
+            state.tension_level = self._predict_tension(action, success, state.tension_level)
+        return plans
+    
+    def _start_speculation(self):
+        """Plan next turn's alliance moves for each likely human outcome while the human deliberates"""
+        self._cancel_speculation()
+        game_state = self.game_master._game_state
+        
+        # Weigh every state the human's action can lead to (any action equally likely, 75% success)
+        # and merge the states the alliance would answer alike
+        actions = self.get_human_actions()
+        candidates: Dict[tuple, list] = {}
+        for action in actions:
+            for success, p_success in ((True, 0.75), (False, 0.25)):
+                for us_resources, p_resources in self._resource_outcomes(game_state.us_resources, action, success):
+                    for tension, p_tension in self._tension_outcomes(action, success, game_state.tension_level):
+                        key = self._speculation_key(tension, us_resources)
+                        candidate = candidates.setdefault(key, [0.0, tension, us_resources])
+                        candidate[0] += p_success * p_resources * p_tension / len(actions)
+        
+        # Most likely branches first, so narrations go to the ones that will probably be played
+        for key, (_, tension, us_resources) in sorted(candidates.items(), key=lambda c: -c[1][0]):
+            self._speculated_plans[key] = self._plan_alliance_turn(tension, us_resources)
+        self.speculation_stats['branches'] += len(self._speculated_plans)
+        
+        # Narrate the most likely branches in the background if an event loop is running
+        if not self.speculate_narrations:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        for plans in list(self._speculated_plans.values())[:self.speculation_width]:
+            for plan in plans:
+                plan['narration_task'] = loop.create_task(self.generate_dramatic_action_description(
+                    plan['action'], plan['success'], plan['nation'], tension=plan['tension']))
+                self.speculation_stats['narrations'] += 1
+    
+    def _take_speculated_plans(self) -> Optional[List[Dict]]:
+        """Return the speculated branch matching the actual state and discard the rest"""
+        if not self._speculated_plans:
+            return None
+        game_state = self.game_master._game_state
+        key = self._speculation_key(game_state.tension_level, game_state.us_resources)
+        plans = self._speculated_plans.pop(key, None)
+        self._cancel_speculation()
+        if plans is None:
+            self.speculation_stats['misses'] += 1
+        else:
+            self.speculation_stats['hits'] += 1
+            self.speculation_stats['narrations_used'] += sum(1 for plan in plans if plan['narration_task'])
+        return plans
+    
+    def _cancel_speculation(self):
+        """Discard speculated branches and cancel their pending narrations"""
+        for plans in self._speculated_plans.values():
+            for plan in plans:
+                task = plan.get('narration_task')
+                if task is not None and not task.done():
+                    task.cancel()
+        self._speculated_plans = {}
+    
+    def get_speculation_stats(self) -> Dict[str, float]:
+        """Speculation hit/miss counters for pipelined mode, with the hit rate and the share of
+        speculative narrations (model calls) that were used"""
+        stats = dict(self.speculation_stats)
+        consulted = stats['hits'] + stats['misses']
+        stats['hit_rate'] = stats['hits'] / consulted if consulted else 0.0
+        stats['narration_use_rate'] = stats['narrations_used'] / stats['narrations'] if stats['narrations'] else 0.0
+        return stats
+    
+    def _get_strategic_action(self, nation: str, resources: Dict[str, int], current_turn_actions: List[Dict], game_state: Optional[GameState] = None) -> Optional[tuple]:
+        """Get strategic action with reasoning based on current situation"""
+        game_state = game_state or self.game_master._game_state
         tension = game_state.tension_level
         
+        actions = self._nation_action_options(nation)
+        
+        # Filter affordable actions
+        affordable_actions = [a for a in actions if all(resources.get(r, 0) >= c for r, c in a['cost'].items())]
+        if not affordable_actions:
+            return None
+        
+        # Generate strategic reasoning and select action
+        reasoning, selected_action = self._generate_strategic_reasoning(nation, affordable_actions, current_turn_actions, tension, game_state)
+        
+        # Steer towards the action type the nation's LLM would pick, if a distilled policy is loaded
+        policy = self.distilled_policies.get(nation)
+        if policy:
+            choice = policy.choose(game_state, resources)
+            if choice:
+                matching_actions = [a for a in affordable_actions if a['type'] == choice[0]]
+                if matching_actions and selected_action not in matching_actions:
+                    selected_action = random.choice(matching_actions)
+        
+        return (selected_action, reasoning)
+    
+    def _nation_action_options(self, nation: str) -> List[Dict]:
+        """Strategic action catalog used by AI-controlled nations"""
         # Define nation-specific actions
         if nation == "Russia":
             actions = [
@@ -433,20 +766,11 @@ Respond in JSON:
                 {"type": ActionType.ECONOMIC, "name": "invests in Arctic technology", "description": "Funds research into Arctic navigation and extraction", "cost": {"economic": 2, "information": 1}, "priority": "technological_edge"},
                 {"type": ActionType.INFORMATION, "name": "promotes freedom of navigation", "description": "Challenges territorial claims through media", "cost": {"information": 2}, "priority": "legal_framework"}
             ]
-        
-        # Filter affordable actions
-        affordable_actions = [a for a in actions if all(resources.get(r, 0) >= c for r, c in a['cost'].items())]
-        if not affordable_actions:
-            return None
-        
-        # Generate strategic reasoning and select action
-        reasoning, selected_action = self._generate_strategic_reasoning(nation, affordable_actions, current_turn_actions, tension)
-        
-        return (selected_action, reasoning)
+        return actions
     
-    def _generate_strategic_reasoning(self, nation: str, available_actions: List[Dict], current_turn_actions: List[Dict], tension: int) -> tuple:
+    def _generate_strategic_reasoning(self, nation: str, available_actions: List[Dict], current_turn_actions: List[Dict], tension: int, game_state: Optional[GameState] = None) -> tuple:
         """Generate strategic reasoning for action selection"""
-        game_state = self.game_master._game_state
+        game_state = game_state or self.game_master._game_state
         
         # Analyze what others have done this turn
         reactions = []
@@ -550,34 +874,21 @@ Respond in JSON:
         
         if successes:
             for action_info in successes[:2]:  # Limit to 2 reflections
-                nation = action_info['nation']
                 action = action_info['action']
-                
-                success_reflections = [
-                    f"💭 {nation} reflects: Our {action['type'].value} strategy proved effective",
-                    f"💭 {nation} analysis: Successful {action['name']} strengthens our position",
-                    f"💭 {nation} assessment: {action['name']} achieved strategic objectives"
-                ]
-                reflections.append(random.choice(success_reflections))
+                reflections.append(GameEvent(f"reflection.success.{random.randrange(3)}", action_info['nation'],
+                                             action['name'], action['type'].value))
         
         if failures:
             for action_info in failures[:1]:  # Limit to 1 failure reflection
-                nation = action_info['nation']
                 action = action_info['action']
-                
-                failure_reflections = [
-                    f"💭 {nation} review: Failed {action['name']} requires strategic adjustment",
-                    f"💭 {nation} lesson learned: {action['type'].value} approach needs refinement",
-                    f"💭 {nation} adaptation: Reconsidering tactics after {action['name']} setback"
-                ]
-                reflections.append(random.choice(failure_reflections))
+                reflections.append(GameEvent(f"reflection.failure.{random.randrange(3)}", action_info['nation'],
+                                             action['name'], action['type'].value))
         
         # Add reflections to events
-        for reflection in reflections:
-            self.game_master._game_state.recent_events.append(reflection)
+        self.game_master._game_state.recent_events.extend(reflections)
     
-    def _generate_situation_briefing(self) -> str:
-        """Generate a strategic situation briefing"""
+    def _generate_situation_briefing(self) -> Optional[GameEvent]:
+        """Pick a strategic situation briefing for this turn, if any"""
         game_state = self.game_master._game_state
         turn = game_state.turn
         tension = game_state.tension_level
@@ -596,38 +907,22 @@ Respond in JSON:
         briefings = []
         
         # Turn-based briefings
-        if turn == 2:
-            briefings.append("Initial positioning phase complete. Nations are establishing their Arctic strategies.")
-        elif turn == 5:
-            briefings.append("Early competition intensifying as nations stake territorial and economic claims.")
-        elif turn == 10:
-            briefings.append("Mid-game dynamics emerging. Resource investments beginning to show strategic impact.")
+        if turn in (2, 5, 10):
+            briefings.append(GameEvent(f"briefing.turn_{turn}"))
         elif turn % 7 == 0:  # Every 7 turns
-            briefings.append(f"{leading_nation} maintains strategic advantage with total resources of {leading_score}.")
+            briefings.append(GameEvent("briefing.leader", leading_nation, new=leading_score))
         
         # Tension-based briefings
         if tension >= 8:
-            briefings.extend([
-                "CRISIS ALERT: Arctic tensions reaching dangerous levels. Risk of armed confrontation increasing.",
-                "International observers warn of potential for military escalation in disputed waters.",
-                "Emergency diplomatic channels activated as nations seek to prevent Arctic conflict."
-            ])
+            briefings.extend(GameEvent(f"briefing.crisis.{i}") for i in range(3))
         elif tension >= 6:
-            briefings.extend([
-                "Rising tensions creating instability in Arctic region. Military posturing increasing.",
-                "Arctic Council calls for restraint as territorial disputes intensify.",
-                "Commercial shipping companies report concerns over safety in contested waters."
-            ])
+            briefings.extend(GameEvent(f"briefing.rising.{i}") for i in range(3))
         elif tension <= 2:
-            briefings.extend([
-                "Diplomatic efforts showing positive results. Arctic cooperation improving.",
-                "Peaceful competition fostering regional stability and economic development.",
-                "International community praises collaborative approach to Arctic governance."
-            ])
+            briefings.extend(GameEvent(f"briefing.calm.{i}") for i in range(3))
         
         # Resource-based briefings
         if any(sum(resources.values()) < 15 for resources in [game_state.russia_resources, game_state.china_resources, game_state.us_resources]):
-            briefings.append("Resource depletion becoming critical concern. Nations must balance expansion with sustainability.")
+            briefings.append(GameEvent("briefing.depletion"))
         
         # Victory condition briefings
         russia_military = game_state.russia_resources.get('military', 0)
@@ -635,22 +930,23 @@ Respond in JSON:
         us_political = game_state.us_resources.get('political', 0)
         
         if russia_military >= 8:
-            briefings.append("Russia's military dominance in Arctic raising international concerns about territorial control.")
+            briefings.append(GameEvent("briefing.russia_military"))
         if china_economic >= 8:
-            briefings.append("China's economic influence expanding rapidly through Arctic infrastructure investments.")
+            briefings.append(GameEvent("briefing.china_economic"))
         if us_political >= 8:
-            briefings.append("United States successfully maintaining multilateral approach to Arctic governance.")
+            briefings.append(GameEvent("briefing.us_political"))
         
         # Strategic insights
         if turn % 5 == 0:  # Every 5 turns
-            insights = [
-                f"Current regional balance shows {leading_nation} leading with {leading_score} total resources.",
-                f"Tension level at {tension}/10 indicates {'high instability' if tension >= 7 else 'moderate stability' if tension >= 4 else 'relative calm'}.",
-                f"Turn {turn}: Arctic competition entering {'critical phase' if turn >= 15 else 'intensification period' if turn >= 8 else 'establishment phase'}."
-            ]
-            briefings.extend(insights)
+            stability = 'high instability' if tension >= 7 else 'moderate stability' if tension >= 4 else 'relative calm'
+            phase = 'critical phase' if turn >= 15 else 'intensification period' if turn >= 8 else 'establishment phase'
+            briefings.extend([
+                GameEvent("briefing.insight.leader", leading_nation, new=leading_score),
+                GameEvent("briefing.insight.tension", new=tension, detail=stability),
+                GameEvent("briefing.insight.turn", new=turn, detail=phase),
+            ])
         
-        return random.choice(briefings) if briefings else ""
+        return random.choice(briefings) if briefings else None
     
     def _check_victory_conditions(self) -> Optional[str]:
         """Check if any nation has achieved victory conditions"""
@@ -854,17 +1150,43 @@ Strategic assessment: {self._get_final_strategic_assessment(winner, margin, tens
         
         return assessment
     
-    def _get_alliance_action(self, nation: str, resources: Dict[str, int], current_turn_actions: List[Dict]) -> Optional[tuple]:
+    def _agents_decide_alliance(self) -> bool:
+        return self.decision_logger is not None and self.model_client is not None
+    
+    async def _decide_alliance_action(self, nation: str, resources: Dict[str, int], current_turn_actions: List[Dict]) -> Optional[tuple]:
+        """An alliance nation's move for the live turn. While decisions are being logged, the
+        nation's agent decides (and logs its LLM choices); otherwise the strategic rules do."""
+        if not self._agents_decide_alliance():
+            return self._get_alliance_action(nation, resources, current_turn_actions)
+        agent_type, agent_class = {"Russia": ("russia", RussianAgent), "China": ("china", ChineseAgent)}[nation]
+        agent = await self.runtime.try_get_underlying_agent_instance(AgentId(agent_type, "default"), agent_class)
+        message = await agent.decide_action(self.game_master._game_state)
+        if message is None:
+            return None
+        action = {
+            "type": message.action_type,
+            "name": message.action_name,
+            "description": message.description,
+            "target": message.target,
+            "cost": dict(message.cost)
+        }
+        reasoning = f"{message.action_name} targeting {message.target}"
+        return (action, self._alliance_reasoning(nation, reasoning, current_turn_actions))
+    
+    def _get_alliance_action(self, nation: str, resources: Dict[str, int], current_turn_actions: List[Dict], game_state: Optional[GameState] = None) -> Optional[tuple]:
         """Get action for Russia-China alliance with coordination"""
-        # Check what alliance partner did
-        partner_actions = [a for a in current_turn_actions if a['nation'] in ['Russia', 'China'] and a['nation'] != nation]
-        
         # Get regular strategic action but with alliance reasoning
-        result = self._get_strategic_action(nation, resources, current_turn_actions)
+        result = self._get_strategic_action(nation, resources, current_turn_actions, game_state)
         if not result:
             return None
             
         action, reasoning = result
+        return (action, self._alliance_reasoning(nation, reasoning, current_turn_actions))
+    
+    def _alliance_reasoning(self, nation: str, reasoning: str, current_turn_actions: List[Dict]) -> str:
+        """Frame a nation's reasoning in terms of what its alliance partner did this turn"""
+        # Check what alliance partner did
+        partner_actions = [a for a in current_turn_actions if a['nation'] in ['Russia', 'China'] and a['nation'] != nation]
         
         # Enhance reasoning with alliance coordination
         if partner_actions:
@@ -879,7 +1201,7 @@ Strategic assessment: {self._get_final_strategic_assessment(winner, margin, tens
         else:
             reasoning = f"Leading alliance initiative - {reasoning}"
         
-        return (action, reasoning)
+        return reasoning
     
     def _apply_action_effects(self, resources: Dict[str, int], action: Dict, success: bool):
         """Apply action effects to resources"""
@@ -891,50 +1213,46 @@ Strategic assessment: {self._get_final_strategic_assessment(winner, margin, tens
     
     def _update_tension(self, action: Dict, success: bool, nation: str = ""):
         """Update tension based on action with reasoning"""
-        old_tension = self.game_master._game_state.tension_level
+        game_state = self.game_master._game_state
+        old_tension = game_state.tension_level
+        outcome = "success" if success else "failure"
+        kind = None
         
         if action['type'] == ActionType.MILITARY:
             change = 2 if success else 1
-            self.game_master._game_state.tension_level = min(10, old_tension + change)
-            if self.game_master._game_state.tension_level > old_tension:
-                reason = f"🌡️ Tension rises {old_tension}→{self.game_master._game_state.tension_level}: {nation} military action {'escalates' if success else 'attempts escalation of'} regional competition"
-                self.game_master._game_state.tension_changes.append(reason)
+            game_state.tension_level = min(10, old_tension + change)
+            kind = f"tension.military.{outcome}"
                 
         elif action['type'] == ActionType.CYBER:
             change = 3 if success else 2  # Cyber attacks are highly escalatory
-            self.game_master._game_state.tension_level = min(10, old_tension + change)
-            if self.game_master._game_state.tension_level > old_tension:
-                reason = f"🌡️ Tension spikes {old_tension}→{self.game_master._game_state.tension_level}: {nation} cyber operations {'severely escalate' if success else 'escalate'} regional tensions"
-                self.game_master._game_state.tension_changes.append(reason)
+            game_state.tension_level = min(10, old_tension + change)
+            kind = f"tension.cyber.{outcome}"
                 
         elif action['type'] == ActionType.HYBRID:
             change = 2 if success else 1
-            self.game_master._game_state.tension_level = min(10, old_tension + change)
-            if self.game_master._game_state.tension_level > old_tension:
-                reason = f"🌡️ Tension rises {old_tension}→{self.game_master._game_state.tension_level}: {nation} hybrid operations {'destabilize' if success else 'threaten'} regional stability"
-                self.game_master._game_state.tension_changes.append(reason)
+            game_state.tension_level = min(10, old_tension + change)
+            kind = f"tension.hybrid.{outcome}"
                 
         elif action['type'] == ActionType.DIPLOMATIC and success:
-            self.game_master._game_state.tension_level = max(1, old_tension - 1)
-            if self.game_master._game_state.tension_level < old_tension:
-                reason = f"🌡️ Tension decreases {old_tension}→{self.game_master._game_state.tension_level}: {nation} successful diplomacy reduces regional friction"
-                self.game_master._game_state.tension_changes.append(reason)
+            game_state.tension_level = max(1, old_tension - 1)
+            kind = "tension.diplomatic"
                 
         elif action['type'] == ActionType.INFORMATION:
             # Information warfare can increase tension slightly
             if not success and random.random() < 0.3:
-                self.game_master._game_state.tension_level = min(10, old_tension + 1)
-                if self.game_master._game_state.tension_level > old_tension:
-                    reason = f"🌡️ Tension rises {old_tension}→{self.game_master._game_state.tension_level}: {nation} failed information campaign backfires, causing friction"
-                    self.game_master._game_state.tension_changes.append(reason)
+                game_state.tension_level = min(10, old_tension + 1)
+                kind = "tension.information"
                     
         elif action['type'] == ActionType.INTELLIGENCE:
             # Intelligence operations can cause tension if detected
             if success and random.random() < 0.4:  # 40% chance of detection
-                self.game_master._game_state.tension_level = min(10, old_tension + 1)
-                if self.game_master._game_state.tension_level > old_tension:
-                    reason = f"🌡️ Tension rises {old_tension}→{self.game_master._game_state.tension_level}: {nation} intelligence operations detected, causing diplomatic friction"
-                    self.game_master._game_state.tension_changes.append(reason)
+                game_state.tension_level = min(10, old_tension + 1)
+                kind = "tension.intelligence"
+        
+        # Record the reason only when the level actually moved (it is clamped to 1-10)
+        if kind and game_state.tension_level != old_tension:
+            game_state.tension_changes.append(GameEvent(kind, nation, action['name'], action['type'].value,
+                                                        old_tension, game_state.tension_level))
     
     def get_human_actions(self) -> List[Dict]:
         """Get available actions for human player (United States)"""
@@ -1066,7 +1384,7 @@ Be direct and tactical in your analysis."""
                 UserMessage(source="user", content=user_prompt)
             ]
             
-            response = await model_client.create(messages=messages)
+            response = await self._timed_create(model_client, messages)
             response_text = response.content if hasattr(response, 'content') else str(response)
             
             import json
@@ -1086,7 +1404,7 @@ Be direct and tactical in your analysis."""
                 "urgency_level": "HIGH" if game_state.tension_level >= 7 else "MODERATE"
             }
     
-    async def generate_dramatic_action_description(self, action: Dict, success: bool, nation: str) -> Dict:
+    async def generate_dramatic_action_description(self, action: Dict, success: bool, nation: str, tension: Optional[int] = None) -> Dict:
         """Generate dramatic tactical description for video generation"""
         try:
             # Load model configuration
@@ -1105,7 +1423,8 @@ Be direct and tactical in your analysis."""
             }
         
         outcome = "SUCCESS" if success else "FAILURE"
-        tension = self.game_master._game_state.tension_level
+        if tension is None:
+            tension = self.game_master._game_state.tension_level
         
         system_prompt = f"""You are a military correspondent reporting on Arctic warfare operations. Create dramatic, tactical descriptions suitable for video generation.
 
@@ -1146,7 +1465,7 @@ Respond in JSON:
                 UserMessage(source="user", content=user_prompt)
             ]
             
-            response = await model_client.create(messages=messages)
+            response = await self._timed_create(model_client, messages)
             response_text = response.content if hasattr(response, 'content') else str(response)
             
             import json
@@ -1167,25 +1486,35 @@ Respond in JSON:
         
         # Show human reasoning
         reasoning = self._get_human_action_reasoning(chosen_action)
-        self.game_master._game_state.recent_events.append(f"🧠 United States (YOU) strategic thinking: {reasoning}")
+        self.game_master._game_state.recent_events.append(
+            GameEvent("reasoning.human", "United States", detail=reasoning))
         
         # Apply action effects
         success = random.random() < 0.75  # Same success rate as AI
         outcome = "succeeds" if success else "fails"
         
-        # Generate dramatic description and video prompt
-        dramatic_content = await self.generate_dramatic_action_description(chosen_action, success, "United States")
-        
-        # Add dramatic action result
-        event_msg = f"⚡ {dramatic_content['dramatic_description']}"
-        self.game_master._game_state.recent_events.append(event_msg)
-        
-        # Store video prompt for UI access
-        chosen_action['generated_video_prompt'] = dramatic_content['video_prompt']
-        chosen_action['tactical_details'] = dramatic_content['tactical_details']
+        if self.background_narration:
+            # Commit the outcome now with a placeholder event; the narration replaces it when ready
+            placeholder = f"⚡ United States {chosen_action['name']} {outcome}: {chosen_action['description']} ⏳"
+            self.game_master._game_state.recent_events.append(placeholder)
+            chosen_action['generated_video_prompt'] = chosen_action.get('video_prompt')
+            chosen_action['tactical_details'] = f"Operation {'completed successfully' if success else 'encountered difficulties'}"
+            self._start_background_narration(chosen_action, success, placeholder)
+        else:
+            # Generate dramatic description and video prompt
+            dramatic_content = await self.generate_dramatic_action_description(chosen_action, success, "United States")
+            
+            # Add dramatic action result
+            event_msg = f"⚡ {dramatic_content['dramatic_description']}"
+            self.game_master._game_state.recent_events.append(event_msg)
+            
+            # Store video prompt for UI access
+            chosen_action['generated_video_prompt'] = dramatic_content['video_prompt']
+            chosen_action['tactical_details'] = dramatic_content['tactical_details']
         
         # Store last executed action for UI access
         self.last_executed_action = chosen_action
+        self._record_resolved_action("United States", chosen_action, success)
         
         # Track action
         self.current_turn_actions.append({
@@ -1216,17 +1545,77 @@ Respond in JSON:
         
         # Check for victory conditions
         victory_result = self._check_victory_conditions()
+        self._export_turn(victory_result)
         if victory_result:
-            self.game_master._game_state.recent_events.append(f"🏆 GAME OVER: {victory_result}")
+            self.game_master._game_state.recent_events.append(GameEvent("game_over", detail=victory_result))
+            self.game_result = victory_result
+            self._notify_state_listeners("game_over")
             return "game_over"
         
         # Generate situation briefing
         briefing = self._generate_situation_briefing()
         if briefing:
-            self.game_master._game_state.recent_events.append(f"📋 SITUATION BRIEFING: {briefing}")
+            self.game_master._game_state.recent_events.append(briefing)
         
+        self._notify_state_listeners("action_completed")
         return "action_completed"
     
+    def _start_background_narration(self, action: Dict, success: bool, placeholder: str):
+        """Narrate a resolved action off the critical path, applying results in submission order"""
+        previous = self._narration_tasks[-1] if self._narration_tasks else None
+        task = asyncio.get_running_loop().create_task(
+            self._narrate_in_background(action, success, placeholder, previous))
+        self._narration_tasks.append(task)
+        task.add_done_callback(self._narration_tasks.remove)
+    
+    async def _narrate_in_background(self, action: Dict, success: bool, placeholder: str, previous):
+        """Generate a narration concurrently, then wait for earlier narrations before applying it"""
+        dramatic_content = await self.generate_dramatic_action_description(action, success, "United States")
+        if previous is not None:
+            await asyncio.gather(previous, return_exceptions=True)
+        if not self.game_master:
+            return
+        
+        # Replace the placeholder in place so the event keeps its position in the log.
+        # Identity comparison finds this exact slot even if an identical event text exists.
+        events = self.game_master._game_state.recent_events
+        for i, event in enumerate(events):
+            if event is placeholder:
+                events[i] = f"⚡ {dramatic_content['dramatic_description']}"
+                break
+        action['generated_video_prompt'] = dramatic_content['video_prompt']
+        action['tactical_details'] = dramatic_content['tactical_details']
+        
+        for listener in list(self._narration_listeners):
+            try:
+                listener(action, dramatic_content)
+            except Exception as e:
+                print(f"Narration listener failed: {e}")
+    
+    def add_narration_listener(self, callback):
+        """Register callback(action, dramatic_content) invoked when a background narration lands"""
+        self._narration_listeners.append(callback)
+    
+    def add_state_listener(self, callback):
+        """Register callback(result) invoked after the game starts, each turn and each human action"""
+        self._state_listeners.append(callback)
+    
+    def _notify_state_listeners(self, result: Optional[str]):
+        for listener in list(self._state_listeners):
+            try:
+                listener(result)
+            except Exception as e:
+                print(f"State listener failed: {e}")
+    
+    def pending_narration_count(self) -> int:
+        """Number of background narrations still in flight"""
+        return len(self._narration_tasks)
+    
+    async def flush_narrations(self, timeout: Optional[float] = None):
+        """Wait for all in-flight background narrations to be applied"""
+        if self._narration_tasks:
+            await asyncio.wait(list(self._narration_tasks), timeout=timeout)
+    
     def _get_human_action_reasoning(self, action: Dict) -> str:
         """Generate reasoning for human action based on current situation"""
         tension = self.game_master._game_state.tension_level
@@ -1323,6 +1712,10 @@ Respond in JSON:
         """Generate final adjudication when game is manually ended"""
         return self._adjudicate_final_outcome()
     
+    def get_game_result(self) -> str:
+        """The result that ended the game, or the final adjudication if it was ended manually"""
+        return self.game_result or self.get_final_adjudication()
+    
     def get_last_action_video_prompt(self) -> Optional[str]:
         """Get the video prompt from the last executed action"""
         if hasattr(self, 'last_executed_action') and self.last_executed_action:
@@ -1361,6 +1754,7 @@ Respond in JSON:
 
     async def start_discussion_with_ai(self, human_question: str, suggested_action: str) -> Dict:
         """Start a discussion between human player and AI advisor about a suggested action"""
+        self._turn_discussions += 1
         try:
             # Load model configuration
             with open("/workspaces/ai-app/agentchat_streamlit/model_config.yml", "r") as f:
@@ -1445,7 +1839,7 @@ Respond in JSON format:
                 UserMessage(source="user", content=user_prompt)
             ]
             
-            response = await model_client.create(messages=messages)
+            response = await self._timed_create(model_client, messages)
             response_text = response.content if hasattr(response, 'content') else str(response)
             
             import json
@@ -1482,6 +1876,7 @@ Respond in JSON format:
         
         # Get the last discussion context
         last_discussion = self.discussion_history[-1]
+        self._turn_discussions += 1
         
         try:
             # Load model configuration
@@ -1547,7 +1942,7 @@ Respond in JSON format:
                 UserMessage(source="user", content=user_prompt)
             ]
             
-            response = await model_client.create(messages=messages)
+            response = await self._timed_create(model_client, messages)
             response_text = response.content if hasattr(response, 'content') else str(response)
             
             import json
@@ -1585,6 +1980,9 @@ Respond in JSON format:
         """Shutdown the game engine"""
         # Since we're using a simplified simulation approach without active agents,
         # we just need to clean up the state
+        self._cancel_speculation()
+        for task in list(self._narration_tasks):
+            task.cancel()
         self.runtime = None
         self.game_master = None
         self.agents = {}
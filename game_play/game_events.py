@@ -0,0 +1,156 @@
+"""
+Structured game events, rendered to display text only when something reads them.
+
+Mechanical steps record a GameEvent (kind, nation, action, old/new values) instead of
+formatting a sentence. GameState keeps its event lists as EventLogs, which store records
+as they are and render an entry when it is read - by the UI, an LLM prompt or a test -
+through a cache of rendered templates. A headless simulation that never reads the logs
+never formats any text. Plain strings (LLM narrations, placeholders) are stored and
+returned unchanged.
+"""
+
+from collections.abc import Iterable, MutableSequence
+from functools import lru_cache
+from typing import Any, Iterator, NamedTuple, Optional, Union
+
+from pydantic_core import core_schema
+
+
+class GameEvent(NamedTuple):
+    kind: str  # key into EVENT_TEMPLATES
+    nation: str = ""
+    action: str = ""  # action name, which identifies it within a nation's catalog
+    action_type: str = ""
+    old: Optional[int] = None
+    new: Optional[int] = None
+    detail: str = ""  # free text carried verbatim, e.g. reasoning or a description
+
+
+EVENT_TEMPLATES = {
+    # Opening crisis and game end
+    "crisis.breaking": "🚨 BREAKING: {detail}",
+    "crisis.description": "📰 {detail}",
+    "crisis.consequence": "⚡ {detail}",
+    "game_over": "🏆 GAME OVER: {detail}",
+    # Turn actions
+    "reasoning": "🧠 {nation} strategic thinking: {detail}",
+    "reasoning.human": "🧠 {nation} (YOU) strategic thinking: {detail}",
+    "action.succeeds": "⚡ {nation} {action} succeeds: {detail}",
+    "action.fails": "⚡ {nation} {action} fails: {detail}",
+    # Reflections on the previous turn
+    "reflection.success.0": "💭 {nation} reflects: Our {action_type} strategy proved effective",
+    "reflection.success.1": "💭 {nation} analysis: Successful {action} strengthens our position",
+    "reflection.success.2": "💭 {nation} assessment: {action} achieved strategic objectives",
+    "reflection.failure.0": "💭 {nation} review: Failed {action} requires strategic adjustment",
+    "reflection.failure.1": "💭 {nation} lesson learned: {action_type} approach needs refinement",
+    "reflection.failure.2": "💭 {nation} adaptation: Reconsidering tactics after {action} setback",
+    # Tension changes
+    "tension.military.success": "🌡️ Tension rises {old}→{new}: {nation} military action escalates regional competition",
+    "tension.military.failure": "🌡️ Tension rises {old}→{new}: {nation} military action attempts escalation of regional competition",
+    "tension.cyber.success": "🌡️ Tension spikes {old}→{new}: {nation} cyber operations severely escalate regional tensions",
+    "tension.cyber.failure": "🌡️ Tension spikes {old}→{new}: {nation} cyber operations escalate regional tensions",
+    "tension.hybrid.success": "🌡️ Tension rises {old}→{new}: {nation} hybrid operations destabilize regional stability",
+    "tension.hybrid.failure": "🌡️ Tension rises {old}→{new}: {nation} hybrid operations threaten regional stability",
+    "tension.diplomatic": "🌡️ Tension decreases {old}→{new}: {nation} successful diplomacy reduces regional friction",
+    "tension.information": "🌡️ Tension rises {old}→{new}: {nation} failed information campaign backfires, causing friction",
+    "tension.intelligence": "🌡️ Tension rises {old}→{new}: {nation} intelligence operations detected, causing diplomatic friction",
+    # Situation briefings
+    "briefing.turn_2": "📋 SITUATION BRIEFING: Initial positioning phase complete. Nations are establishing their Arctic strategies.",
+    "briefing.turn_5": "📋 SITUATION BRIEFING: Early competition intensifying as nations stake territorial and economic claims.",
+    "briefing.turn_10": "📋 SITUATION BRIEFING: Mid-game dynamics emerging. Resource investments beginning to show strategic impact.",
+    "briefing.leader": "📋 SITUATION BRIEFING: {nation} maintains strategic advantage with total resources of {new}.",
+    "briefing.crisis.0": "📋 SITUATION BRIEFING: CRISIS ALERT: Arctic tensions reaching dangerous levels. Risk of armed confrontation increasing.",
+    "briefing.crisis.1": "📋 SITUATION BRIEFING: International observers warn of potential for military escalation in disputed waters.",
+    "briefing.crisis.2": "📋 SITUATION BRIEFING: Emergency diplomatic channels activated as nations seek to prevent Arctic conflict.",
+    "briefing.rising.0": "📋 SITUATION BRIEFING: Rising tensions creating instability in Arctic region. Military posturing increasing.",
+    "briefing.rising.1": "📋 SITUATION BRIEFING: Arctic Council calls for restraint as territorial disputes intensify.",
+    "briefing.rising.2": "📋 SITUATION BRIEFING: Commercial shipping companies report concerns over safety in contested waters.",
+    "briefing.calm.0": "📋 SITUATION BRIEFING: Diplomatic efforts showing positive results. Arctic cooperation improving.",
+    "briefing.calm.1": "📋 SITUATION BRIEFING: Peaceful competition fostering regional stability and economic development.",
+    "briefing.calm.2": "📋 SITUATION BRIEFING: International community praises collaborative approach to Arctic governance.",
+    "briefing.depletion": "📋 SITUATION BRIEFING: Resource depletion becoming critical concern. Nations must balance expansion with sustainability.",
+    "briefing.russia_military": "📋 SITUATION BRIEFING: Russia's military dominance in Arctic raising international concerns about territorial control.",
+    "briefing.china_economic": "📋 SITUATION BRIEFING: China's economic influence expanding rapidly through Arctic infrastructure investments.",
+    "briefing.us_political": "📋 SITUATION BRIEFING: United States successfully maintaining multilateral approach to Arctic governance.",
+    "briefing.insight.leader": "📋 SITUATION BRIEFING: Current regional balance shows {nation} leading with {new} total resources.",
+    "briefing.insight.tension": "📋 SITUATION BRIEFING: Tension level at {new}/10 indicates {detail}.",
+    "briefing.insight.turn": "📋 SITUATION BRIEFING: Turn {new}: Arctic competition entering {detail}.",
+}
+
+
+@lru_cache(maxsize=4096)
+def render_event(event: GameEvent) -> str:
+    """Display text for an event. Events repeat a lot (same nation, action and values), so
+    rendered text is cached per event."""
+    return EVENT_TEMPLATES[event.kind].format(
+        nation=event.nation, action=event.action, action_type=event.action_type,
+        old=event.old, new=event.new, detail=event.detail)
+
+
+def render(entry: Union[str, GameEvent]) -> str:
+    return render_event(entry) if isinstance(entry, GameEvent) else entry
+
+
+class EventLog(MutableSequence):
+    """A list of events that renders entries as they are read. Slices are EventLogs, so
+    trimming (`log[-8:]`) keeps the records unrendered; records() gives the raw entries."""
+
+    __slots__ = ("_entries",)
+
+    def __init__(self, entries: Iterable[Union[str, GameEvent]] = ()):
+        self._entries = list(entries)
+
+    def records(self) -> list:
+        return list(self._entries)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return EventLog(self._entries[index])
+        return render(self._entries[index])
+
+    def __setitem__(self, index, value) -> None:
+        self._entries[index] = value
+
+    def __delitem__(self, index) -> None:
+        del self._entries[index]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[str]:
+        return (render(entry) for entry in self._entries)
+
+    def insert(self, index: int, value: Union[str, GameEvent]) -> None:
+        self._entries.insert(index, value)
+
+    def append(self, value: Union[str, GameEvent]) -> None:
+        self._entries.append(value)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (EventLog, list)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"EventLog({list(self)!r})"
+
+    def __copy__(self) -> "EventLog":
+        return EventLog(self._entries)
+
+    def __deepcopy__(self, memo) -> "EventLog":
+        # Entries are immutable (str or NamedTuple of scalars)
+        return EventLog(self._entries)
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: Any, handler: Any) -> core_schema.CoreSchema:
+        # Accepts any list of strings/events; serializes as rendered text
+        return core_schema.no_info_plain_validator_function(
+            cls._validate, serialization=core_schema.plain_serializer_function_ser_schema(list))
+
+    @classmethod
+    def _validate(cls, value: Any) -> "EventLog":
+        if isinstance(value, EventLog):
+            return value
+        if isinstance(value, (str, bytes)) or not isinstance(value, Iterable):
+            raise ValueError("an event log must be a list of strings or GameEvents")
+        return cls(value)
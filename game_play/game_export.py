@@ -0,0 +1,250 @@
+"""
+Export played games to partitioned Parquet for offline analysis.
+
+The engine hands the exporter one row per nation at the end of every turn: the nation's
+move and its outcome, its resources after the turn, the tension level, which victory
+condition it currently meets, and the turn's LLM latency and advisor discussions. Rows are
+buffered and, once `buffer_rows` are waiting, written by a writer thread (so the event loop
+that plays the turn never does Parquet I/O) as one Parquet file under a Hive-style partition
+per day the game started:
+
+    <root>/date=2025-01-31/part-<time>-<id>.parquet
+
+Many engines in one process share a writer (get_game_exporter), so each flush is a bulk
+write rather than a file per game. Part files accumulate; `compact` merges each partition
+into one file sorted by game and turn. The whole directory loads with pandas:
+
+    df = pandas.read_parquet("game_exports")
+
+Usage:
+    engine.enable_game_export("game_exports")
+    python game_export.py compact --root game_exports
+    python game_export.py stats --root game_exports
+"""
+
+import argparse
+import atexit
+import concurrent.futures
+import datetime
+import json
+import os
+import threading
+import time
+import uuid
+from typing import Any, Dict, Iterable, List, Optional
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+DEFAULT_EXPORT_DIR = os.environ.get(
+    "WARGAME_EXPORT_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "game_exports"))
+DEFAULT_BUFFER_ROWS = 5000
+PARTITION_PREFIX = "date="
+
+TURN_SCHEMA = pa.schema([
+    ("game_id", pa.string()),
+    ("started_at", pa.timestamp("ms", tz="UTC")),
+    ("turn", pa.int16()),
+    ("nation", pa.string()),
+    ("action", pa.string()),  # None when the nation did not act this turn
+    ("action_type", pa.string()),
+    ("success", pa.bool_()),
+    ("military", pa.int8()),  # resources after the turn
+    ("economic", pa.int8()),
+    ("political", pa.int8()),
+    ("information", pa.int8()),
+    ("tension", pa.int8()),
+    ("victory_condition", pa.string()),  # the nation's victory condition met after the turn, if any
+    ("game_over", pa.bool_()),
+    ("outcome", pa.string()),  # the game's result on its final turn
+    ("llm_ms", pa.float32()),  # model latency during the turn, shared by its rows
+    ("llm_calls", pa.int16()),
+    ("discussions", pa.int16()),  # advisor discussion exchanges during the turn
+])
+
+
+def _partition(row: Dict[str, Any]) -> str:
+    return PARTITION_PREFIX + row["started_at"].astimezone(datetime.timezone.utc).date().isoformat()
+
+
+def _write_table(table: pa.Table, directory: str, prefix: str = "part") -> str:
+    """Write a table to a new file in `directory`. It is written under a hidden name, which
+    readers skip, and renamed when complete, so a reader never sees a partial file."""
+    os.makedirs(directory, exist_ok=True)
+    name = f"{prefix}-{int(time.time() * 1000)}-{uuid.uuid4().hex[:8]}.parquet"
+    tmp_path = os.path.join(directory, f".{name}.tmp")
+    path = os.path.join(directory, name)
+    try:
+        pq.write_table(table, tmp_path, compression="zstd")
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return path
+
+
+class ParquetGameExporter:
+    """Buffers per-turn rows and bulk-writes them to partitioned Parquet; thread-safe.
+    add_rows() only appends to the buffer; full buffers are flushed on a writer thread."""
+
+    def __init__(self, root: str = DEFAULT_EXPORT_DIR, buffer_rows: int = DEFAULT_BUFFER_ROWS):
+        self.root = root
+        self.buffer_rows = buffer_rows
+        self._lock = threading.Lock()  # guards the buffer and stats
+        self._write_lock = threading.Lock()  # one flush at a time
+        self._buffer: Dict[str, List[Dict[str, Any]]] = {}  # partition -> rows
+        self._buffered = 0
+        self._writer = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="game-export")
+        self._background: Optional[concurrent.futures.Future] = None
+        self.stats = {'rows': 0, 'files': 0, 'flushes': 0, 'bytes': 0, 'write_errors': 0}
+
+    def add_rows(self, rows: Iterable[Dict[str, Any]]) -> None:
+        with self._lock:
+            for row in rows:
+                self._buffer.setdefault(_partition(row), []).append(row)
+                self._buffered += 1
+            if self._buffered < self.buffer_rows or (self._background and not self._background.done()):
+                return
+            self._background = self._writer.submit(self._background_flush)
+
+    def _background_flush(self) -> None:
+        try:
+            self.flush()
+        except Exception as e:
+            print(f"Warning: Could not write game export, keeping rows buffered: {e}")
+
+    def flush(self) -> int:
+        """Write every buffered row, one file per partition; returns how many rows were written.
+        Partitions that fail to write go back into the buffer and the first error is raised."""
+        with self._write_lock:
+            with self._lock:
+                buffer, self._buffer = self._buffer, {}
+                self._buffered = 0
+            written = 0
+            failed: Dict[str, List[Dict[str, Any]]] = {}
+            error: Optional[Exception] = None
+            for partition, rows in buffer.items():
+                try:
+                    table = pa.Table.from_pylist(rows, schema=TURN_SCHEMA)
+                    path = _write_table(table, os.path.join(self.root, partition))
+                except Exception as e:
+                    failed[partition] = rows
+                    error = error or e
+                    continue
+                written += len(rows)
+                with self._lock:
+                    self.stats['files'] += 1
+                    self.stats['bytes'] += os.path.getsize(path)
+            with self._lock:
+                for partition, rows in failed.items():
+                    # Ahead of rows added while we were writing, to keep turn order
+                    self._buffer[partition] = rows + self._buffer.get(partition, [])
+                    self._buffered += len(rows)
+                self.stats['rows'] += written
+                if written:
+                    self.stats['flushes'] += 1
+                if error is not None:
+                    self.stats['write_errors'] += 1
+            if error is not None:
+                raise error
+        return written
+
+    def close(self) -> None:
+        """Finish any background flush, then write what is left"""
+        with self._lock:
+            background = self._background
+        if background is not None:
+            background.result()
+        self.flush()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self.stats, buffered=self._buffered, root=self.root)
+
+
+_exporters: Dict[str, ParquetGameExporter] = {}
+_exporters_lock = threading.Lock()
+
+
+def get_game_exporter(root: str = DEFAULT_EXPORT_DIR) -> ParquetGameExporter:
+    """Process-wide exporter for `root`, flushed when the process exits"""
+    root = os.path.abspath(root)
+    with _exporters_lock:
+        if root not in _exporters:
+            _exporters[root] = ParquetGameExporter(root)
+            atexit.register(_exporters[root].close)
+        return _exporters[root]
+
+
+def _partitions(root: str) -> List[str]:
+    if not os.path.isdir(root):
+        return []
+    return sorted(name for name in os.listdir(root)
+                  if name.startswith(PARTITION_PREFIX) and os.path.isdir(os.path.join(root, name)))
+
+
+def _part_files(directory: str) -> List[str]:
+    return sorted(os.path.join(directory, name) for name in os.listdir(directory)
+                  if name.endswith(".parquet") and not name.startswith((".", "_")))
+
+
+def compact(root: str = DEFAULT_EXPORT_DIR, partitions: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Merge each partition's part files into one file sorted by game and turn. The merged
+    file is in place before the parts are removed, and parts written meanwhile are kept."""
+    stats = {'partitions': 0, 'files_before': 0, 'files_after': 0, 'rows': 0}
+    for partition in partitions or _partitions(root):
+        directory = os.path.join(root, partition)
+        files = _part_files(directory)
+        stats['files_before'] += len(files)
+        if len(files) < 2:
+            stats['files_after'] += len(files)
+            continue
+        # Read the files themselves, so the partition key stays in the path, not the data
+        table = pa.concat_tables(pq.read_table(path, schema=TURN_SCHEMA, partitioning=None) for path in files)
+        table = table.sort_by([("game_id", "ascending"), ("turn", "ascending"), ("nation", "ascending")])
+        _write_table(table, directory, prefix="compacted")
+        for path in files:
+            os.remove(path)
+        stats['partitions'] += 1
+        stats['files_after'] += 1
+        stats['rows'] += table.num_rows
+    return stats
+
+
+def export_stats(root: str = DEFAULT_EXPORT_DIR) -> Dict[str, Any]:
+    """Partition, file, row and game counts, read from Parquet footers and the game_id column"""
+    stats = {'partitions': 0, 'files': 0, 'rows': 0, 'bytes': 0, 'games': 0}
+    for partition in _partitions(root):
+        stats['partitions'] += 1
+        games = set()
+        for path in _part_files(os.path.join(root, partition)):
+            stats['files'] += 1
+            stats['rows'] += pq.ParquetFile(path).metadata.num_rows
+            stats['bytes'] += os.path.getsize(path)
+            games.update(pq.read_table(path, columns=["game_id"], partitioning=None).column(0).unique().to_pylist())
+        stats['games'] += len(games)
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Maintain the Parquet export of played games")
+    root_parser = argparse.ArgumentParser(add_help=False)
+    root_parser.add_argument("--root", default=DEFAULT_EXPORT_DIR)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    compact_parser = subparsers.add_parser("compact", parents=[root_parser],
+                                           help="Merge each partition's part files into one")
+    compact_parser.add_argument("--partition", action="append", help="e.g. date=2025-01-31 (default: all)")
+    subparsers.add_parser("stats", parents=[root_parser], help="Show export counts")
+    args = parser.parse_args()
+
+    if args.command == "compact":
+        start = time.perf_counter()
+        stats = compact(args.root, args.partition)
+        print(f"✅ Compacted {stats['files_before']} files into {stats['files_after']} "
+              f"in {time.perf_counter() - start:.1f}s: {stats}")
+    print(json.dumps(export_stats(args.root), indent=2))
+
+
+if __name__ == "__main__":
+    main()
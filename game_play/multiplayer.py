@@ -0,0 +1,209 @@
+"""
+Server-authoritative simultaneous-move multiplayer.
+
+A MultiplayerTable owns one engine and runs on the shared background event loop. Any
+nation can be claimed by a browser session; each turn opens an asyncio future per seated
+nation and waits for all of them or the move deadline, whichever comes first. Moves are
+then resolved together through ArcticWargameEngine.execute_simultaneous_turn, with the AI
+standing in for empty seats, for players who missed the deadline and for seats released
+mid-turn. Sessions submit moves with `runner.run(table.submit_move(...))`; nothing waits on
+Streamlit reruns. Finished tables are dropped from the shared registry by prune_tables().
+"""
+
+import asyncio
+import threading
+import time
+import uuid
+from typing import Dict, List, Optional
+
+from game_engine import ArcticWargameEngine
+
+NATIONS = ["Russia", "China", "United States"]
+DEFAULT_KEEP_FINISHED = 600.0  # Seconds a finished table stays listed so players can see the result
+
+
+def _hand_to_ai(future: asyncio.Future):
+    if not future.done():
+        future.set_result(None)
+
+
+class MultiplayerTable:
+    """Seats, move collection and turn loop for one shared game"""
+
+    def __init__(self, table_id: str, engine: Optional[ArcticWargameEngine] = None,
+                 move_deadline: float = 60.0, ai_turn_pause: float = 3.0, max_missed_turns: int = 3):
+        self.table_id = table_id
+        self.engine = engine or ArcticWargameEngine()
+        self.move_deadline = move_deadline
+        self.ai_turn_pause = ai_turn_pause  # Pause between turns when no human is seated
+        self.max_missed_turns = max_missed_turns  # Free a seat after this many consecutive timeouts
+        self.seats: Dict[str, str] = {}  # nation -> session token
+        self.missed_turns: Dict[str, int] = {}
+        self.version = 0  # Bumped when a turn resolves so UIs know to redraw
+        self.turn_open = False
+        self.deadline_at: Optional[float] = None
+        self.last_turn: Optional[Dict] = None
+        self.result: Optional[str] = None
+        self.error: Optional[str] = None
+        self.finished_at: Optional[float] = None  # When the turn loop ended (game over, error or stop)
+        self._moves: Dict[str, asyncio.Future] = {}
+        self._seat_lock = threading.Lock()
+        self._started = False
+        self._stop_requested = False
+        self._future = None
+
+    # Seats (called from Streamlit script threads)
+
+    def claim_seat(self, nation: str, token: Optional[str] = None) -> Optional[str]:
+        """Take control of a nation; returns the seat token, or None if it is taken"""
+        with self._seat_lock:
+            if nation not in NATIONS or nation in self.seats:
+                return None
+            token = token or uuid.uuid4().hex
+            self.seats[nation] = token
+            self.missed_turns[nation] = 0
+            return token
+
+    def release_seat(self, nation: str, token: str) -> bool:
+        with self._seat_lock:
+            if self.seats.get(nation) != token:
+                return False
+            del self.seats[nation]
+            self.missed_turns.pop(nation, None)
+            future = self._moves.get(nation)
+        if future is not None:
+            # The AI moves for the nation this turn instead of the table waiting for the deadline
+            future.get_loop().call_soon_threadsafe(_hand_to_ai, future)
+        return True
+
+    def seat_of(self, token: str) -> Optional[str]:
+        for nation, seat_token in list(self.seats.items()):
+            if seat_token == token:
+                return nation
+        return None
+
+    def human_nations(self) -> List[str]:
+        return [nation for nation in NATIONS if nation in self.seats]
+
+    def move_status(self) -> Dict[str, str]:
+        """Per-nation status for the current turn: 'ai', 'next_turn', 'waiting' or 'submitted'"""
+        status = {}
+        for nation in NATIONS:
+            future = self._moves.get(nation)
+            if nation not in self.seats:
+                status[nation] = "ai"
+            elif future is None or not self.turn_open and not future.done():
+                status[nation] = "next_turn"  # Seated after this turn opened
+            elif future.done() and not future.cancelled():
+                status[nation] = "submitted"
+            else:
+                status[nation] = "waiting"
+        return status
+
+    def seconds_left(self) -> Optional[float]:
+        if not self.turn_open or self.deadline_at is None:
+            return None
+        return max(0.0, self.deadline_at - time.monotonic())
+
+    # Coordination (runs on the table's event loop)
+
+    async def submit_move(self, nation: str, token: str, action_name: str) -> bool:
+        """Commit a seated player's move for the open turn"""
+        if self.seats.get(nation) != token or not self.turn_open:
+            return False
+        future = self._moves.get(nation)
+        if future is None or future.done():
+            return False
+        actions = {a['name']: a for a in self.engine.get_nation_actions(nation)}
+        if action_name not in actions:
+            return False
+        future.set_result(actions[action_name])
+        return True
+
+    async def play_turn(self) -> Optional[str]:
+        """Collect moves concurrently until everyone has submitted or the deadline passes"""
+        loop = asyncio.get_running_loop()
+        humans = self.human_nations()
+        self._moves = {nation: loop.create_future() for nation in humans}
+        self.deadline_at = time.monotonic() + self.move_deadline
+        self.turn_open = True
+        try:
+            if self._moves:
+                await asyncio.wait(list(self._moves.values()), timeout=self.move_deadline)
+        finally:
+            self.turn_open = False
+
+        moves: Dict[str, Optional[Dict]] = {}
+        timed_out = []
+        for nation, future in self._moves.items():
+            if future.done() and not future.cancelled():
+                if future.result() is None:
+                    continue  # Seat released during the turn: the AI moves for it
+                moves[nation] = future.result()
+                self.missed_turns[nation] = 0
+            else:
+                future.cancel()
+                timed_out.append(nation)
+                self.missed_turns[nation] = self.missed_turns.get(nation, 0) + 1
+                if self.missed_turns[nation] >= self.max_missed_turns:
+                    with self._seat_lock:
+                        self.seats.pop(nation, None)
+
+        result = await self.engine.execute_simultaneous_turn(moves)
+        self.last_turn = {
+            'turn': self.engine.get_game_state().turn,
+            'human': sorted(moves),
+            'timed_out': timed_out,
+            'ai': [n for n in NATIONS if n not in moves],
+        }
+        self.result = result
+        self.version += 1
+        return result
+
+    async def run(self):
+        """Play turns until the game ends or the table is stopped"""
+        try:
+            if not self._started:
+                await self.engine.start_game()
+                self._started = True
+                self.version += 1
+            while not self._stop_requested:
+                try:
+                    result = await self.play_turn()
+                except Exception as e:
+                    self.error = str(e)
+                    print(f"Multiplayer table {self.table_id} error: {e}")
+                    break
+                if result == "game_over":
+                    break
+                if not self.seats:
+                    await asyncio.sleep(self.ai_turn_pause)
+        finally:
+            self.finished_at = time.monotonic()
+
+    def start(self, background_loop):
+        """Run the table on the shared loop (not tied to whichever session opened it)"""
+        if self._future is None or self._future.done():
+            self._stop_requested = False
+            self._future = background_loop.submit(self.run())
+
+    @property
+    def running(self) -> bool:
+        return self._future is not None and not self._future.done()
+
+    def stop(self):
+        self._stop_requested = True
+        if self._future is not None:
+            self._future.cancel()
+
+
+def prune_tables(tables: Dict[str, MultiplayerTable], keep_finished: float = DEFAULT_KEEP_FINISHED) -> List[str]:
+    """Drop tables whose game ended more than `keep_finished` seconds ago; returns their IDs"""
+    now = time.monotonic()
+    finished = [table_id for table_id, table in list(tables.items())
+                if table.finished_at is not None and now - table.finished_at > keep_finished]
+    for table_id in finished:
+        table = tables.pop(table_id, None)
+        if table is not None:
+            table.stop()
+    return finished
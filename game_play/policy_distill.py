@@ -0,0 +1,240 @@
+"""
+Distill logged LLM nation decisions into a fast local policy.
+
+Every successful RussianAgent/ChineseAgent LLM decision is a (game state -> action type, cost)
+pair. DecisionLogger appends those pairs to a JSONL file, and DistilledPolicy fits a
+multinomial logistic regression over the 12 resources + tension + turn features so the
+nation can be replayed without the model at microsecond latency.
+
+Usage:
+    python policy_distill.py train decisions.jsonl --out policies.npz
+"""
+
+import argparse
+import json
+import os
+import time
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from arctic_agents import ActionMessage, ActionType, GameState
+
+RESOURCE_TYPES = ["military", "economic", "political", "information"]
+NATION_RESOURCE_FIELDS = ["russia_resources", "china_resources", "us_resources"]
+FEATURE_COUNT = len(NATION_RESOURCE_FIELDS) * len(RESOURCE_TYPES) + 2
+MAX_TURNS = 25
+
+
+def extract_features(game_state: GameState) -> np.ndarray:
+    """Encode a game state as 12 resource values + tension + turn, scaled to roughly [0, 1]"""
+    features = np.empty(FEATURE_COUNT, dtype=np.float64)
+    i = 0
+    for field in NATION_RESOURCE_FIELDS:
+        resources = getattr(game_state, field)
+        for resource_type in RESOURCE_TYPES:
+            features[i] = resources.get(resource_type, 0) / 10.0
+            i += 1
+    features[i] = game_state.tension_level / 10.0
+    features[i + 1] = game_state.turn / MAX_TURNS
+    return features
+
+
+class DecisionLogger:
+    """Appends successful LLM nation decisions to a JSONL file for later distillation"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.logged = 0
+
+    def log(self, nation: str, game_state: GameState, action: ActionMessage) -> None:
+        record = {
+            "nation": nation,
+            "features": extract_features(game_state).tolist(),
+            "action_type": action.action_type.value,
+            "action_name": action.action_name,
+            "target": action.target,
+            "description": action.description,
+            "cost": action.cost,
+            "timestamp": time.time(),
+        }
+        try:
+            with open(self.path, "a") as f:
+                f.write(json.dumps(record) + "\n")
+            self.logged += 1
+        except OSError as e:
+            print(f"Warning: Could not log decision: {e}")
+
+
+def load_decisions(path: str) -> Dict[str, List[Dict]]:
+    """Load logged decisions grouped by nation"""
+    by_nation: Dict[str, List[Dict]] = {}
+    with open(path, "r") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            by_nation.setdefault(record["nation"], []).append(record)
+    return by_nation
+
+
+class DistilledPolicy:
+    """Multinomial logistic regression mimicking one nation's LLM action choices"""
+
+    def __init__(self, nation: str):
+        self.nation = nation
+        self.classes: List[ActionType] = []
+        self.weights: Optional[np.ndarray] = None
+        self.bias: Optional[np.ndarray] = None
+        # Per action type: typical cost and the most common name/target/description
+        self.class_costs: Dict[str, Dict[str, int]] = {}
+        self.class_templates: Dict[str, Dict[str, str]] = {}
+
+    def fit(self, records: List[Dict], epochs: int = 500, learning_rate: float = 0.5, l2: float = 1e-3) -> "DistilledPolicy":
+        """Fit softmax weights with full-batch gradient descent"""
+        if not records:
+            raise ValueError(f"No decisions logged for {self.nation}")
+
+        self.classes = sorted({ActionType(r["action_type"]) for r in records}, key=lambda t: t.value)
+        class_index = {t.value: i for i, t in enumerate(self.classes)}
+
+        X = np.array([r["features"] for r in records], dtype=np.float64)
+        y = np.array([class_index[r["action_type"]] for r in records])
+        one_hot = np.eye(len(self.classes))[y]
+
+        self.weights = np.zeros((X.shape[1], len(self.classes)))
+        self.bias = np.zeros(len(self.classes))
+        for _ in range(epochs):
+            probs = self._softmax(X @ self.weights + self.bias)
+            error = (probs - one_hot) / len(X)
+            self.weights -= learning_rate * (X.T @ error + l2 * self.weights)
+            self.bias -= learning_rate * error.sum(axis=0)
+
+        for action_type in self.classes:
+            class_records = [r for r in records if r["action_type"] == action_type.value]
+            resource_names = {res for r in class_records for res in r["cost"]}
+            self.class_costs[action_type.value] = {
+                res: int(round(np.mean([r["cost"].get(res, 0) for r in class_records])))
+                for res in resource_names
+            }
+            self.class_costs[action_type.value] = {res: c for res, c in self.class_costs[action_type.value].items() if c > 0}
+            self.class_templates[action_type.value] = {
+                key: Counter(r.get(key, "") for r in class_records).most_common(1)[0][0]
+                for key in ("action_name", "target", "description")
+            }
+        return self
+
+    @staticmethod
+    def _softmax(logits: np.ndarray) -> np.ndarray:
+        shifted = logits - logits.max(axis=-1, keepdims=True)
+        exp = np.exp(shifted)
+        return exp / exp.sum(axis=-1, keepdims=True)
+
+    def predict_proba(self, features: np.ndarray) -> np.ndarray:
+        """Class probabilities for a single feature vector"""
+        return self._softmax(features @ self.weights + self.bias)
+
+    def accuracy(self, records: List[Dict]) -> float:
+        """Fraction of logged decisions whose action type the policy reproduces"""
+        if not records:
+            return 0.0
+        X = np.array([r["features"] for r in records], dtype=np.float64)
+        predicted = (X @ self.weights + self.bias).argmax(axis=1)
+        actual = [r["action_type"] for r in records]
+        return float(np.mean([self.classes[p].value == a for p, a in zip(predicted, actual)]))
+
+    def choose(self, game_state: GameState, resources: Dict[str, int]) -> Optional[Tuple[ActionType, Dict[str, int]]]:
+        """Most likely affordable (action type, cost) for this state"""
+        probs = self.predict_proba(extract_features(game_state))
+        for index in np.argsort(-probs):
+            action_type = self.classes[index]
+            cost = self.class_costs.get(action_type.value, {})
+            if all(resources.get(res, 0) >= c for res, c in cost.items()):
+                return action_type, cost
+        return None
+
+    def decide(self, game_state: GameState, resources: Dict[str, int]) -> Optional[ActionMessage]:
+        """Drop-in replacement for an agent's LLM decision"""
+        choice = self.choose(game_state, resources)
+        if not choice:
+            return None
+        action_type, cost = choice
+        template = self.class_templates.get(action_type.value, {})
+        return ActionMessage(
+            agent=self.nation,
+            action_type=action_type,
+            action_name=template.get("action_name") or f"{action_type.value.title()} Initiative",
+            target=template.get("target") or "Arctic Region",
+            description=template.get("description") or f"{self.nation} pursues a {action_type.value} initiative",
+            cost=cost,
+        )
+
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        prefix = f"{self.nation}__"
+        return {
+            prefix + "weights": self.weights,
+            prefix + "bias": self.bias,
+            prefix + "classes": np.array([t.value for t in self.classes]),
+            prefix + "meta": np.array(json.dumps({"costs": self.class_costs, "templates": self.class_templates})),
+        }
+
+    @classmethod
+    def from_arrays(cls, nation: str, arrays) -> "DistilledPolicy":
+        prefix = f"{nation}__"
+        policy = cls(nation)
+        policy.weights = arrays[prefix + "weights"]
+        policy.bias = arrays[prefix + "bias"]
+        policy.classes = [ActionType(str(v)) for v in arrays[prefix + "classes"]]
+        meta = json.loads(str(arrays[prefix + "meta"]))
+        policy.class_costs = meta["costs"]
+        policy.class_templates = meta["templates"]
+        return policy
+
+
+def save_policies(policies: Dict[str, DistilledPolicy], path: str) -> None:
+    arrays = {"nations": np.array(list(policies))}
+    for policy in policies.values():
+        arrays.update(policy.to_arrays())
+    np.savez(path, **arrays)
+
+
+def load_policies(path: str) -> Dict[str, DistilledPolicy]:
+    if not os.path.exists(path):
+        return {}
+    with np.load(path, allow_pickle=False) as arrays:
+        return {str(n): DistilledPolicy.from_arrays(str(n), arrays) for n in arrays["nations"]}
+
+
+def train_policies(log_path: str, **fit_kwargs) -> Dict[str, DistilledPolicy]:
+    """Train one policy per nation found in the decision log"""
+    return {
+        nation: DistilledPolicy(nation).fit(records, **fit_kwargs)
+        for nation, records in load_decisions(log_path).items()
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Distill logged LLM nation decisions into NumPy policies")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    train = subparsers.add_parser("train", help="Train policies from a decision log")
+    train.add_argument("log_path")
+    train.add_argument("--out", default="policies.npz")
+    train.add_argument("--epochs", type=int, default=500)
+    args = parser.parse_args()
+
+    decisions = load_decisions(args.log_path)
+    policies = {nation: DistilledPolicy(nation).fit(records, epochs=args.epochs) for nation, records in decisions.items()}
+    for nation, policy in policies.items():
+        print(f"{nation}: {len(decisions[nation])} decisions, {len(policy.classes)} action types, "
+              f"train accuracy {policy.accuracy(decisions[nation]):.1%}")
+    save_policies(policies, args.out)
+    print(f"Saved {len(policies)} policies to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
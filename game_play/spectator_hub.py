@@ -0,0 +1,204 @@
+"""
+Spectator broadcast hub: one authoritative engine, many read-only viewers.
+
+The operator's engine publishes a snapshot to a GameChannel keyed by game ID after every
+state change (game start, turn, human action, narration). Spectator sessions subscribe to
+the channel and render from those snapshots without an engine of their own, so the number
+of viewers never multiplies LLM or CPU cost - a publish is one state copy however many
+people watch. Each subscriber has a bounded queue; when a slow viewer falls behind, its
+backlog is coalesced into a single update holding the newest snapshot and recent actions.
+
+In the Streamlit app the hub is a `st.cache_resource` singleton shared by all sessions.
+"""
+
+import threading
+import time
+import uuid
+from collections import deque
+from typing import Dict, List, Optional
+
+DEFAULT_QUEUE_SIZE = 8
+DEFAULT_IDLE_TIMEOUT = 300.0  # Drop subscribers that have not polled for this many seconds
+MAX_COALESCED_ACTIONS = 10
+
+
+def _merge_updates(updates: List[Dict]) -> Dict:
+    """Collapse queued updates into one: snapshots are complete, so only the newest matters"""
+    merged = dict(updates[-1])
+    actions = [action for update in updates for action in update.get("actions", [])]
+    merged["actions"] = actions[-MAX_COALESCED_ACTIONS:]
+    merged["coalesced"] = sum(update.get("coalesced", 1) for update in updates)
+    return merged
+
+
+class Subscription:
+    """A spectator's bounded view of a channel"""
+
+    def __init__(self, channel: "GameChannel", subscriber_id: str, queue_size: int):
+        self.channel = channel
+        self.subscriber_id = subscriber_id
+        self.queue_size = queue_size
+        self.queue: deque = deque()
+        self.coalesce_count = 0  # How many times this subscriber's backlog was collapsed
+        self.last_poll = time.monotonic()
+
+    def _push(self, update: Dict):
+        # Called with the channel lock held
+        if len(self.queue) >= self.queue_size:
+            self.queue = deque([_merge_updates(list(self.queue) + [update])])
+            self.coalesce_count += 1
+        else:
+            self.queue.append(update)
+
+    def poll(self) -> List[Dict]:
+        """Take every pending update (oldest first)"""
+        with self.channel._lock:
+            updates = list(self.queue)
+            self.queue.clear()
+            self.last_poll = time.monotonic()
+        return updates
+
+    @property
+    def latest(self) -> Optional[Dict]:
+        return self.channel.latest
+
+    @property
+    def active(self) -> bool:
+        return self.subscriber_id in self.channel._subscribers
+
+    def close(self):
+        self.channel.unsubscribe(self.subscriber_id)
+
+
+class GameChannel:
+    """Snapshots of one game, fanned out to its spectators"""
+
+    def __init__(self, game_id: str, queue_size: int = DEFAULT_QUEUE_SIZE,
+                 idle_timeout: float = DEFAULT_IDLE_TIMEOUT):
+        self.game_id = game_id
+        self.queue_size = queue_size
+        self.idle_timeout = idle_timeout
+        self.seq = 0
+        self.latest: Optional[Dict] = None
+        self.closed = False
+        self.publish_count = 0
+        self._subscribers: Dict[str, Subscription] = {}
+        self._lock = threading.Lock()
+
+    def publish(self, snapshot: Dict) -> Dict:
+        """Record a new snapshot and queue it for every subscriber"""
+        with self._lock:
+            self.seq += 1
+            update = dict(snapshot, seq=self.seq)
+            self.latest = update
+            self.publish_count += 1
+            now = time.monotonic()
+            for subscriber_id, subscription in list(self._subscribers.items()):
+                if now - subscription.last_poll > self.idle_timeout:
+                    # Viewer went away without unsubscribing (closed tab)
+                    del self._subscribers[subscriber_id]
+                else:
+                    subscription._push(update)
+            return update
+
+    def subscribe(self, queue_size: Optional[int] = None) -> Subscription:
+        """Join as a spectator; the first poll returns the current snapshot"""
+        with self._lock:
+            subscription = Subscription(self, uuid.uuid4().hex, queue_size or self.queue_size)
+            if self.latest is not None:
+                subscription.queue.append(self.latest)
+            self._subscribers[subscription.subscriber_id] = subscription
+            return subscription
+
+    def unsubscribe(self, subscriber_id: str):
+        with self._lock:
+            self._subscribers.pop(subscriber_id, None)
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def close(self):
+        """Mark the game as finished; spectators keep the final snapshot"""
+        self.closed = True
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            return {
+                'game_id': self.game_id,
+                'seq': self.seq,
+                'publishes': self.publish_count,
+                'subscribers': len(self._subscribers),
+                'coalesced': sum(s.coalesce_count for s in self._subscribers.values()),
+                'closed': self.closed,
+            }
+
+
+class BroadcastHub:
+    """Process-wide registry of game channels, keyed by game ID"""
+
+    def __init__(self, queue_size: int = DEFAULT_QUEUE_SIZE):
+        self.queue_size = queue_size
+        self._channels: Dict[str, GameChannel] = {}
+        self._lock = threading.Lock()
+
+    def open_channel(self, game_id: Optional[str] = None) -> GameChannel:
+        with self._lock:
+            game_id = game_id or uuid.uuid4().hex[:6].upper()
+            channel = GameChannel(game_id, self.queue_size)
+            self._channels[game_id] = channel
+            return channel
+
+    def get_channel(self, game_id: str) -> Optional[GameChannel]:
+        return self._channels.get(game_id)
+
+    def close_channel(self, game_id: str):
+        with self._lock:
+            channel = self._channels.pop(game_id, None)
+        if channel:
+            channel.close()
+
+    def active_games(self) -> List[str]:
+        return [game_id for game_id, channel in self._channels.items() if not channel.closed]
+
+
+class GameBroadcaster:
+    """Publishes an engine's state to a channel whenever the engine reports a change"""
+
+    def __init__(self, engine, channel: GameChannel):
+        self.engine = engine
+        self.channel = channel
+        self.active = True
+        self._action_seq = 0
+        engine.add_state_listener(self._on_state_change)
+        engine.add_narration_listener(lambda action, content: self._on_state_change("narration"))
+
+    def _on_state_change(self, result: Optional[str]):
+        if not self.active:
+            return
+        final = self.engine.get_game_result() if result == "game_over" else None
+        self.publish(result, final)
+
+    def publish(self, result: Optional[str] = None, final_adjudication: Optional[str] = None) -> Optional[Dict]:
+        """Snapshot the engine once and hand it to the channel"""
+        game_state = self.engine.get_game_state()
+        if not game_state:
+            return None
+        actions = self.engine.get_resolved_actions_since(self._action_seq)
+        if actions:
+            self._action_seq = actions[-1]["seq"]
+        update = self.channel.publish({
+            'state': game_state.model_copy(deep=True),
+            'result': result,
+            'actions': actions,
+            'opening_crisis': getattr(self.engine, 'opening_crisis', None),
+            'final_adjudication': final_adjudication,
+            'published_at': time.time(),
+        })
+        if final_adjudication:
+            self.channel.close()
+        return update
+
+    def detach(self):
+        """Stop publishing (the engine keeps the listener but it becomes a no-op)"""
+        self.active = False
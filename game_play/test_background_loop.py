@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Test script for the shared persistent event loop used by the Streamlit apps
+"""
+
+import asyncio
+import gc
+import os
+import sys
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game_engine import ArcticWargameEngine
+from streamlit_loop import SessionRunner, get_background_loop, get_session_runner
+
+def test_background_loop():
+    """Engine calls from separate 'reruns' share one loop and background work survives between them"""
+    print("🔁 Testing Persistent Background Event Loop")
+    print("=" * 60)
+
+    session_state = {}
+    runner = get_session_runner(session_state)
+    assert get_session_runner(session_state) is runner
+    print(f"1. ✅ Session runner created: {runner.session_id[:8]}")
+
+    engine = ArcticWargameEngine()
+    runner.run(engine.start_game())
+
+    # Each call below stands in for a separate Streamlit rerun
+    loops = set()
+    async def current_loop():
+        return id(asyncio.get_running_loop())
+    for _ in range(3):
+        loops.add(runner.run(current_loop()))
+    assert len(loops) == 1, "Every rerun should reuse the same loop"
+    print("2. ✅ All reruns share one event loop")
+
+    # Background narration started in one rerun completes before the next
+    runner.run(engine.execute_turn())
+    actions = engine.get_human_actions()
+    if actions:
+        runner.run(engine.execute_human_action(actions[0]))
+        runner.run(engine.flush_narrations(timeout=30))
+        assert engine.pending_narration_count() == 0
+        assert not any(e.endswith("⏳") for e in engine.get_game_state().recent_events)
+        print("3. ✅ Background narration survived across reruns")
+
+    # Timeouts cancel the underlying task
+    try:
+        runner.run(asyncio.sleep(10), timeout=0.1)
+        raise AssertionError("Expected a timeout")
+    except TimeoutError:
+        print("4. ✅ Timed-out call raised TimeoutError")
+
+    # Ending a session cancels its pending work
+    other = SessionRunner(get_background_loop())
+    future = other.submit(asyncio.sleep(10))
+    time.sleep(0.05)
+    assert other.cancel_all() == 1 and future.cancelled()
+    print("5. ✅ Session end cancelled pending work")
+
+    # Tasks the engine spawned on the loop die with the session that started them
+    session_state = {}
+    dropped = get_session_runner(session_state)
+    slow_engine = ArcticWargameEngine()
+    dropped.run(slow_engine.start_game())
+    dropped.run(slow_engine.execute_turn())
+    narration_started = []
+
+    async def slow_narration(action, success, nation, tension=None):
+        narration_started.append(action['name'])
+        await asyncio.sleep(30)
+    slow_engine.generate_dramatic_action_description = slow_narration
+    dropped.run(slow_engine.execute_human_action(slow_engine.get_human_actions()[0]))
+    narrations = list(slow_engine._narration_tasks)
+    assert narrations and dropped.pending() == 0 and dropped.spawned() == 1
+    del dropped
+    session_state.clear()  # Streamlit drops the session state
+    gc.collect()
+    deadline = time.time() + 5
+    while not all(task.done() for task in narrations) and time.time() < deadline:
+        time.sleep(0.01)
+    assert all(task.cancelled() for task in narrations) and slow_engine.pending_narration_count() == 0
+    print(f"6. ✅ Dropped session cancelled {len(narrations)} engine-spawned narration task(s)")
+
+    runner.run(engine.shutdown())
+    assert runner.spawned() == 0
+    print("\n✅ Background loop test completed!")
+
+if __name__ == "__main__":
+    test_background_loop()
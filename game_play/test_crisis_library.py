@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Test script for the indexed opening crisis library and its offline generator
+"""
+
+import asyncio
+import os
+import random
+import sys
+import tempfile
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from crisis_library import (BUILTIN_CRISES, CrisisLibrary, generate_library, procedural_crisis,
+                            validate_crisis)
+from game_engine import ArcticWargameEngine
+
+async def test_crisis_library():
+    """Generate thousands of scenarios concurrently, then sample them by severity, theme and nation"""
+    print("🧪 Testing Crisis Library")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        library = CrisisLibrary(os.path.join(tmp, "crises.db"))
+        assert library.seed_builtins() == len(BUILTIN_CRISES)
+        assert library.seed_builtins() == 0, "Built-in crises were added twice"
+        print(f"1. ✅ Seeded {library.count()} built-in crises; reseeding adds nothing")
+
+        in_flight = 0
+        peak = 0
+        rng = random.Random(7)
+
+        async def make_crisis(theme, severity):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.001)  # Stand-in for a model call
+            in_flight -= 1
+            crisis = procedural_crisis(theme, severity, rng)
+            if rng.random() < 0.05:
+                crisis['tension_increase'] = 9  # Some generations come back malformed
+            return crisis
+
+        start = time.perf_counter()
+        stats = await generate_library(library, 2000, make_crisis, concurrency=16)
+        elapsed = time.perf_counter() - start
+        assert stats['added'] == 2000 and library.count() == 2000 + len(BUILTIN_CRISES)
+        assert peak <= 16, f"Concurrency limit exceeded: {peak}"
+        assert stats['invalid'] > 0 and stats['duplicates'] > 0
+        print(f"2. ✅ Generated 2000 crises in {elapsed:.2f}s with at most {peak} in flight: {stats}")
+
+        bad = dict(BUILTIN_CRISES[0], tension_increase=0, affected_resources={"mars_resources": {"economic": 1}})
+        assert validate_crisis(bad)
+        try:
+            library.add(bad)
+            assert False, "Invalid crisis was accepted"
+        except ValueError:
+            pass
+        print("3. ✅ Invalid crises are rejected")
+
+        for severity, theme, nation in [(5, None, None), (None, "cyber", None), (2, "military", "China")]:
+            for _ in range(50):
+                crisis = library.sample(severity, theme, nation)
+                assert severity is None or crisis['tension_increase'] == severity
+                assert theme is None or crisis['theme'] == theme
+                assert nation is None or {"China": "china_resources"}[nation] in crisis['affected_resources']
+        assert library.sample(theme="no-such-theme") is None
+        print(f"4. ✅ Filtered sampling honours severity, theme and nation; stats: {library.get_stats()['by_theme']}")
+
+        library.sample()  # Build the unfiltered alias table
+        start = time.perf_counter()
+        for _ in range(5000):
+            library.sample()
+        per_sample = (time.perf_counter() - start) / 5000 * 1e6
+        print(f"5. ✅ Weighted sampling from {library.count()} crises: {per_sample:.1f} µs per draw")
+
+        engine = ArcticWargameEngine()
+        engine.crisis_library = library
+        crisis = await engine.generate_opening_crisis(severity=4, theme="climate")
+        assert crisis['tension_increase'] == 4 and crisis['theme'] == "climate"
+        print(f"6. ✅ Engine drew '{crisis['name']}' from the library without a start-time LLM call")
+
+        library.close()
+
+    print("\n✅ Crisis library test completed!")
+
+if __name__ == "__main__":
+    asyncio.run(test_crisis_library())
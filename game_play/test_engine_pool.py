@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Test script for the pre-warmed engine pool
+"""
+
+import asyncio
+import os
+import sys
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine_pool import EnginePool
+from game_engine import ArcticWargameEngine
+from streamlit_loop import BackgroundLoop
+
+LLM_LATENCY = 0.4
+
+class SlowCrisisEngine(ArcticWargameEngine):
+    """Engine whose crisis generation costs an LLM round-trip"""
+    async def generate_opening_crisis(self):
+        await asyncio.sleep(LLM_LATENCY)
+        return await super().generate_opening_crisis()
+
+async def timed_start(engine: ArcticWargameEngine) -> float:
+    start = time.perf_counter()
+    await engine.start_game()
+    return time.perf_counter() - start
+
+async def test_engine_pool():
+    """Hits start in O(1), misses pay the full start, refills happen in the background"""
+    print("🧪 Testing Pre-Warmed Engine Pool")
+    print("=" * 60)
+
+    background_loop = BackgroundLoop()
+    pool = EnginePool(background_loop, target_depth=2, factory=SlowCrisisEngine)
+    pool.fill()
+    await pool.wait_until_full(timeout=10)
+    assert pool.depth == 2
+    print(f"1. ✅ Pool filled to depth {pool.depth} in the background")
+
+    engine = pool.checkout()
+    assert engine.is_initialized and engine.prepared_crisis
+    hit_seconds = await timed_start(engine)
+    assert hit_seconds < LLM_LATENCY / 4, f"Pool hit should not wait for the LLM ({hit_seconds:.3f}s)"
+    assert engine.get_opening_crisis() and engine.prepared_crisis is None
+    print(f"2. ✅ Pool hit: start_game took {hit_seconds * 1000:.1f} ms ('{engine.get_opening_crisis()['name']}')")
+
+    # Drain the pool faster than it refills to force a miss
+    pool.checkout()
+    pool.checkout()
+    missed = pool.checkout()
+    miss_seconds = await timed_start(missed)
+    assert miss_seconds >= LLM_LATENCY
+    print(f"3. ✅ Pool miss: start_game took {miss_seconds * 1000:.0f} ms (full initialize + crisis)")
+
+    await pool.wait_until_full(timeout=10)
+    stats = pool.get_stats()
+    assert stats['depth'] == stats['target_depth'] and stats['refills'] >= 4
+    assert stats['hits'] >= 1 and stats['misses'] >= 1
+    print(f"4. ✅ Refilled to depth {stats['depth']}: {stats}")
+
+    background_loop.stop()
+    print("\n✅ Engine pool test completed!")
+
+if __name__ == "__main__":
+    asyncio.run(test_engine_pool())
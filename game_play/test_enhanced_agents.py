@@ -41,7 +41,7 @@ async def test_enhanced_agents():
     # Test Chinese agent fallback (without LLM)
     print("🇨🇳 Testing Chinese Agent (Fallback Mode)")
     chinese_agent = ChineseAgent(None)  # No model client
-    chinese_action = await chinese_agent._decide_action(game_state)
+    chinese_action = await chinese_agent.decide_action(game_state)
     
     if chinese_action:
         print(f"✅ Chinese Action: {chinese_action.action_name}")
@@ -56,7 +56,7 @@ async def test_enhanced_agents():
     # Test Russian agent fallback (without LLM)
     print("🇷🇺 Testing Russian Agent (Fallback Mode)")  
     russian_agent = RussianAgent(None)  # No model client
-    russian_action = await russian_agent._decide_action(game_state)
+    russian_action = await russian_agent.decide_action(game_state)
     
     if russian_action:
         print(f"✅ Russian Action: {russian_action.action_name}")
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Test script for structured game events rendered on demand
+"""
+
+import asyncio
+import copy
+import os
+import random
+import sys
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from arctic_agents import ActionType, GameState
+from game_engine import ArcticWargameEngine
+from game_events import EventLog, GameEvent, render_event
+
+async def test_game_events():
+    """Events are stored as records and only formatted when read"""
+    print("🗂️ Testing Structured Game Events")
+    print("=" * 60)
+
+    # 1. Records render to the same text the engine used to format
+    assert render_event(GameEvent("tension.cyber.success", "Russia", "Cyber Strike", "cyber", 4, 7)) == \
+        "🌡️ Tension spikes 4→7: Russia cyber operations severely escalate regional tensions"
+    assert render_event(GameEvent("reflection.success.0", "China", "Polar Silk Road", "economic")) == \
+        "💭 China reflects: Our economic strategy proved effective"
+    assert render_event(GameEvent("briefing.insight.tension", new=8, detail="high instability")) == \
+        "📋 SITUATION BRIEFING: Tension level at 8/10 indicates high instability."
+    print("1. ✅ Templates reproduce the original event text")
+
+    # 2. EventLog behaves like the list of strings it replaces
+    log = EventLog(["plain narration ⏳", GameEvent("game_over", detail="Russia wins")])
+    log.append(GameEvent("reasoning", "China", detail="Economic leverage"))
+    trimmed = log[-2:]
+    assert isinstance(trimmed, EventLog) and isinstance(trimmed.records()[0], GameEvent)
+    assert "\n".join(trimmed) == "🏆 GAME OVER: Russia wins\n🧠 China strategic thinking: Economic leverage"
+    assert log[0].endswith("⏳") and log == list(log)
+    state = GameState(recent_events=["a", "b"])
+    state.recent_events.append(GameEvent("crisis.breaking", detail="Oil spill"))
+    clone = state.model_copy(deep=True)
+    clone.recent_events.append("only in the copy")
+    assert len(state.recent_events) == 3 and state.model_dump()["recent_events"][-1] == "🚨 BREAKING: Oil spill"
+    print("2. ✅ Slicing, joining, str methods, validation, deep copies and model_dump work as before")
+
+    # 3. A headless game formats nothing until someone reads the log
+    random.seed(5)
+    engine = ArcticWargameEngine()
+    engine.human_player_mode = False
+    await engine.initialize()
+    await engine.start_game()
+    render_event.cache_clear()
+    start = time.perf_counter()
+    turns = 0
+    for _ in range(30):
+        turns += 1
+        if await engine.execute_turn() == "game_over":
+            break
+    elapsed = time.perf_counter() - start
+    game_state = engine.get_game_state()
+    records = [e for log in (game_state.recent_events, game_state.tension_changes) for e in log.records()
+               if isinstance(e, GameEvent)]
+    assert records and render_event.cache_info().misses == 0, render_event.cache_info()
+    print(f"3. ✅ {turns} headless turns in {elapsed * 1000:.0f} ms left {len(records)} records unrendered")
+
+    text = list(game_state.recent_events) + list(game_state.tension_changes)
+    assert render_event.cache_info().misses > 0 and not any(isinstance(t, GameEvent) for t in text)
+    print(f"4. ✅ Reading the logs rendered them on demand: {render_event.cache_info()}")
+    print(f"   e.g. {text[-1]}")
+    await engine.shutdown()
+
+    # 5. Rendering cost: cached renders vs formatting every event
+    events = [GameEvent(f"tension.military.{o}", n, "Arctic Patrol", ActionType.MILITARY.value, t, t + 1)
+              for n in ("Russia", "China", "United States") for o in ("success", "failure") for t in range(1, 10)]
+    render_event.cache_clear()
+    start = time.perf_counter()
+    for _ in range(200):
+        for event in events:
+            render_event(event)
+    cached = time.perf_counter() - start
+    start = time.perf_counter()
+    for _ in range(200):
+        for event in events:
+            render_event.__wrapped__(event)
+    uncached = time.perf_counter() - start
+    print(f"5. ✅ {len(events) * 200} renders: {cached * 1000:.1f} ms cached vs {uncached * 1000:.1f} ms formatting each")
+
+    print("\n✅ Structured game events test completed!")
+
+if __name__ == "__main__":
+    asyncio.run(test_game_events())
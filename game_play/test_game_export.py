@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Test script for exporting played games to partitioned Parquet
+"""
+
+import asyncio
+import os
+import random
+import shutil
+import sys
+import tempfile
+import threading
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import pandas as pd
+
+import game_export
+from game_engine import ArcticWargameEngine
+from game_export import ParquetGameExporter, compact, export_stats
+
+
+class SlowModelClient:
+    """Answers after a fixed delay, to check that model latency reaches the export"""
+
+    async def create(self, messages):
+        await asyncio.sleep(0.05)
+        return "{}"
+
+
+async def play_headless_game(exporter: ParquetGameExporter) -> int:
+    engine = ArcticWargameEngine()
+    engine.human_player_mode = False
+    engine.game_exporter = exporter
+    await engine.initialize()
+    await engine.start_game()
+    turns = 0
+    while turns < 30:
+        turns += 1
+        if await engine.execute_turn() == "game_over":
+            break
+    await engine.shutdown()
+    return turns
+
+
+async def test_game_export():
+    """Every turn of every game lands in Parquet that pandas can load"""
+    print("📊 Testing Parquet Game Export")
+    print("=" * 60)
+    root = tempfile.mkdtemp(prefix="game_exports_")
+    try:
+        # 1. Headless games buffer rows and write them in bulk
+        random.seed(11)
+        exporter = ParquetGameExporter(root, buffer_rows=300)
+        start = time.perf_counter()
+        games = 40
+        turns = [await play_headless_game(exporter) for _ in range(games)]
+        exporter.close()
+        elapsed = time.perf_counter() - start
+        stats = exporter.get_stats()
+        assert stats['rows'] == 3 * sum(turns) and stats['buffered'] == 0, stats
+        assert 1 < stats['files'] < games, stats
+        print(f"1. ✅ {games} games, {stats['rows']} rows written as {stats['files']} files "
+              f"({stats['bytes'] / 1024:.0f} KB) in {elapsed:.1f}s")
+
+        # 2. pandas loads the partitioned directory
+        df = pd.read_parquet(root)
+        assert len(df) == stats['rows'] and df['game_id'].nunique() == games
+        assert set(df['nation']) == {"Russia", "China", "United States"}
+        assert df['date'].astype(str).str.match(r"\d{4}-\d{2}-\d{2}").all()
+        finals = df[df['game_over']]
+        assert finals['game_id'].nunique() == games and finals['outcome'].notna().all()
+        acted = df[df['action'].notna()]
+        assert len(acted) and acted['success'].notna().all() and df['tension'].between(0, 10).all()
+        win_rates = acted.groupby('action_type')['success'].mean()
+        print(f"2. ✅ pandas read {len(df)} rows; success rate by action type: "
+              f"{', '.join(f'{t} {r:.0%}' for t, r in win_rates.items())}")
+
+        # 3. Model latency and advisor discussions are counted per turn
+        exporter = ParquetGameExporter(root, buffer_rows=10)
+        engine = ArcticWargameEngine()
+        engine.game_exporter = exporter
+        await engine.initialize()
+        await engine.start_game()
+        assert await engine.execute_turn() == "human_action_needed"
+        await engine._timed_create(SlowModelClient(), [])
+        await engine.start_discussion_with_ai("Is this too risky?", "Arctic Council Diplomacy")
+        await engine.execute_human_action(engine.get_human_actions()[0])
+        exporter.flush()
+        await engine.shutdown()
+        turn = pd.read_parquet(root, filters=[("game_id", "==", engine.game_id)])
+        assert len(turn) == 3 and (turn['discussions'] == 1).all(), turn
+        assert (turn['llm_calls'] >= 1).all() and (turn['llm_ms'] >= 50).all(), turn
+        us = turn[turn['nation'] == "United States"].iloc[0]
+        assert us['action'] == engine.last_executed_action['name']
+        print(f"3. ✅ Human turn exported with {us['llm_ms']:.0f} ms of model time and "
+              f"{us['discussions']} discussion")
+
+        # 4. Compaction merges each partition into one sorted file without losing rows
+        before = export_stats(root)
+        result = compact(root)
+        after = export_stats(root)
+        assert after['files'] == after['partitions'] == result['partitions'], (result, after)
+        assert after['rows'] == before['rows'] and after['games'] == before['games'] == games + 1
+        compacted = pd.read_parquet(root)
+        assert len(compacted) == before['rows']
+        assert compacted.sort_values(['game_id', 'turn', 'nation']).index.equals(compacted.index)
+        print(f"4. ✅ Compacted {before['files']} files into {after['files']} "
+              f"({before['bytes'] / 1024:.0f} KB -> {after['bytes'] / 1024:.0f} KB)")
+
+        # 5. Full buffers are written off the caller's thread, and failed writes keep their rows
+        writers = []
+        write_table = game_export._write_table
+
+        def recording_write(table, directory, prefix="part"):
+            writers.append(threading.current_thread().name)
+            return write_table(table, directory, prefix)
+
+        game_export._write_table = recording_write
+        try:
+            blocked = os.path.join(root, "not_a_directory")
+            open(blocked, "w").close()
+            exporter = ParquetGameExporter(blocked, buffer_rows=30)
+            await play_headless_game(exporter)
+            exporter._background.result()
+            assert writers and all(name.startswith("game-export") for name in writers), writers
+            background_writers = sorted(set(writers))
+            buffered = exporter.get_stats()['buffered']
+            assert buffered >= 30 and exporter.get_stats()['write_errors'] >= 1
+            try:
+                exporter.flush()
+                assert False, "flush into a file path should fail"
+            except OSError:
+                pass
+            assert exporter.get_stats()['buffered'] == buffered
+            exporter.root = os.path.join(root, "recovered")
+            exporter.close()
+            assert exporter.get_stats()['rows'] == buffered and len(pd.read_parquet(exporter.root)) == buffered
+        finally:
+            game_export._write_table = write_table
+        print(f"5. ✅ Full buffers were written on {background_writers}; {buffered} rows survived failed writes "
+              f"and were written once the directory was fixed")
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+    print("\n🎉 Game export tests completed!")
+
+
+if __name__ == "__main__":
+    asyncio.run(test_game_export())
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Test script for simultaneous-move multiplayer with human-controlled nations
+"""
+
+import asyncio
+import os
+import sys
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from multiplayer import NATIONS, MultiplayerTable, prune_tables
+
+async def player(table: MultiplayerTable, nation: str, token: str, think_seconds: float):
+    """A player who picks their first affordable action after thinking for a while"""
+    while not table.turn_open:
+        await asyncio.sleep(0.01)
+    await asyncio.sleep(think_seconds)
+    action = table.engine.get_nation_actions(nation)[0]
+    return await table.submit_move(nation, token, action['name'])
+
+async def test_multiplayer():
+    """Three seats: two players submit, one times out and the AI stands in"""
+    print("🧪 Testing Simultaneous-Move Multiplayer")
+    print("=" * 60)
+
+    table = MultiplayerTable("TEST", move_deadline=0.5)
+    await table.engine.start_game()
+    tokens = {nation: table.claim_seat(nation) for nation in NATIONS}
+    assert all(tokens.values())
+    assert table.claim_seat("Russia") is None, "Seat should not be claimable twice"
+    print(f"1. ✅ Seats claimed: {table.human_nations()}")
+
+    # Everyone submits quickly: the turn resolves as soon as the last move lands
+    start = time.perf_counter()
+    turn = asyncio.create_task(table.play_turn())
+    submitted = await asyncio.gather(*(player(table, n, tokens[n], 0.05) for n in NATIONS))
+    await turn
+    elapsed = time.perf_counter() - start
+    assert all(submitted) and table.last_turn['human'] == sorted(NATIONS)
+    assert elapsed < table.move_deadline, f"Turn waited for the deadline ({elapsed:.2f}s)"
+    print(f"2. ✅ All three moves collected and resolved in {elapsed * 1000:.0f} ms (deadline {table.move_deadline}s)")
+
+    # China's player goes idle: the deadline passes and the AI moves for China
+    start = time.perf_counter()
+    turn = asyncio.create_task(table.play_turn())
+    await asyncio.gather(player(table, "Russia", tokens["Russia"], 0.05),
+                         player(table, "United States", tokens["United States"], 0.1))
+    await turn
+    elapsed = time.perf_counter() - start
+    assert table.last_turn['timed_out'] == ["China"] and "China" in table.last_turn['ai']
+    print(f"3. ✅ China timed out after {elapsed:.2f}s and was played by the AI: {table.last_turn}")
+
+    # Late or foreign submissions are rejected
+    assert not await table.submit_move("Russia", tokens["Russia"], "deploys Arctic fleet"), "Turn is closed"
+    assert not await table.submit_move("China", tokens["Russia"], "invests in Arctic ports"), "Wrong seat token"
+    print("4. ✅ Moves outside an open turn or from the wrong seat are rejected")
+
+    # Repeated timeouts free the seat so the table keeps its pace
+    for _ in range(table.max_missed_turns):
+        await table.play_turn()
+        if table.result == "game_over":
+            break
+    assert table.seats == {} or table.result == "game_over"
+    print(f"5. ✅ Idle seats released after {table.max_missed_turns} missed turns: {table.human_nations()}")
+
+    # Load: many tables of three players each resolving a turn concurrently on one loop
+    tables = [MultiplayerTable(f"T{i}", move_deadline=2.0) for i in range(20)]
+    for t in tables:
+        await t.engine.start_game()
+        for nation in NATIONS:
+            t.claim_seat(nation, f"{t.table_id}-{nation}")
+    start = time.perf_counter()
+    await asyncio.gather(*(t.play_turn() for t in tables),
+                         *(player(t, n, f"{t.table_id}-{n}", 0.05) for t in tables for n in NATIONS))
+    elapsed = time.perf_counter() - start
+    assert all(t.last_turn['human'] == sorted(NATIONS) for t in tables)
+    print(f"6. ✅ {len(tables)} tables x 3 players resolved a turn in {elapsed * 1000:.0f} ms total")
+
+    # A player leaving mid-turn hands their nation to the AI without waiting for the deadline
+    leaving = tables[0]
+    leaving.move_deadline = 5.0
+    start = time.perf_counter()
+    turn = asyncio.create_task(leaving.play_turn())
+    await asyncio.gather(player(leaving, "Russia", "T0-Russia", 0.05), player(leaving, "China", "T0-China", 0.05))
+    assert leaving.release_seat("United States", "T0-United States")
+    await turn
+    elapsed = time.perf_counter() - start
+    assert elapsed < 1.0 and leaving.last_turn['timed_out'] == [] and "United States" in leaving.last_turn['ai']
+    print(f"7. ✅ Released seat played by the AI; the turn resolved in {elapsed * 1000:.0f} ms (deadline 5s)")
+
+    # Finished tables leave the registry once their result has been on show long enough
+    registry = {t.table_id: t for t in tables[:3]}
+    tables[0].finished_at = time.monotonic() - 700
+    tables[1].finished_at = time.monotonic()
+    assert prune_tables(registry, keep_finished=600) == ["T0"] and sorted(registry) == ["T1", "T2"]
+    print(f"8. ✅ Finished table pruned; still listed: {sorted(registry)}")
+
+    for t in [table] + tables:
+        await t.engine.shutdown()
+    print("\n✅ Multiplayer test completed!")
+
+if __name__ == "__main__":
+    asyncio.run(test_multiplayer())
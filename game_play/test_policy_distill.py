@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Test script for distilling logged LLM nation decisions into a local NumPy policy
+"""
+
+import asyncio
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from arctic_agents import ActionMessage, ActionType, GameState
+from game_engine import ArcticWargameEngine
+from policy_distill import DecisionLogger, load_policies, save_policies, train_policies
+
+def random_game_state() -> GameState:
+    """Build a random mid-game state"""
+    def resources():
+        return {r: random.randint(2, 10) for r in ["military", "economic", "political", "information"]}
+    return GameState(
+        turn=random.randint(1, 25),
+        tension_level=random.randint(1, 10),
+        russia_resources=resources(),
+        china_resources=resources(),
+        us_resources=resources(),
+    )
+
+def fake_llm_decision(nation: str, game_state: GameState) -> ActionMessage:
+    """Stand-in for the LLM: militarise at high tension, otherwise play to national strengths"""
+    if game_state.tension_level >= 7:
+        return ActionMessage(agent=nation, action_type=ActionType.MILITARY, action_name="Arctic Show of Force",
+                             target="Northern Sea Route", description="Surges naval patrols", cost={"military": 2})
+    if nation == "China" or game_state.us_resources["economic"] > 6:
+        return ActionMessage(agent=nation, action_type=ActionType.ECONOMIC, action_name="Polar Silk Road Investment",
+                             target="Arctic Ports", description="Funds port infrastructure", cost={"economic": 2})
+    return ActionMessage(agent=nation, action_type=ActionType.DIPLOMATIC, action_name="Arctic Treaty Proposal",
+                         target="Arctic Council", description="Proposes a territorial framework", cost={"political": 2})
+
+class FakeModelClient:
+    """Answers every nation prompt with fake_llm_decision, as JSON"""
+
+    async def create(self, messages):
+        nation = "China" if "Xi Jinping" in messages[0].content else "Russia"
+        tension = int(messages[1].content.split("Tension Level: ")[1].split("/")[0])
+        decision = fake_llm_decision(nation, random_game_state().model_copy(update={"tension_level": tension}))
+        cost = {resource: 1 for resource in decision.cost}  # affordable in any game
+        return json.dumps(dict(decision.model_dump(mode="json", exclude={"agent"}), cost=cost,
+                               reasoning="Fake model"))
+
+async def test_policy_distill():
+    """Log synthetic decisions, train policies and use them as a drop-in opponent"""
+    print("🧪 Testing LLM Decision Distillation")
+    print("=" * 60)
+    random.seed(7)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        log_path = os.path.join(tmp, "decisions.jsonl")
+        logger = DecisionLogger(log_path)
+        for _ in range(400):
+            game_state = random_game_state()
+            for nation in ["Russia", "China"]:
+                logger.log(nation, game_state, fake_llm_decision(nation, game_state))
+        print(f"1. ✅ Logged {logger.logged} decisions")
+
+        policies = train_policies(log_path)
+        assert set(policies) == {"Russia", "China"}
+        from policy_distill import load_decisions
+        decisions = load_decisions(log_path)
+        for nation, policy in policies.items():
+            accuracy = policy.accuracy(decisions[nation])
+            print(f"2. ✅ {nation} policy trained: {accuracy:.1%} agreement with logged LLM choices")
+            assert accuracy > 0.85, f"{nation} policy accuracy too low: {accuracy:.1%}"
+
+        policy_path = os.path.join(tmp, "policies.npz")
+        save_policies(policies, policy_path)
+        reloaded = load_policies(policy_path)
+        assert set(reloaded) == set(policies)
+        print("3. ✅ Policies saved and reloaded")
+
+        # Latency of a drop-in decision
+        game_state = random_game_state()
+        russia = reloaded["Russia"]
+        iterations = 2000
+        start = time.perf_counter()
+        for _ in range(iterations):
+            action = russia.decide(game_state, game_state.russia_resources)
+        per_call_us = (time.perf_counter() - start) / iterations * 1e6
+        print(f"4. ✅ Russia decides '{action.action_name}' in {per_call_us:.1f} µs per call")
+
+        # Engine steered by distilled policies
+        engine = ArcticWargameEngine()
+        engine.human_player_mode = False
+        await engine.initialize()
+        print(f"5. ✅ Loaded policies into engine: {engine.load_distilled_policies(policy_path)}")
+        await engine.start_game()
+        for _ in range(5):
+            if await engine.execute_turn() == "game_over":
+                break
+        print(f"   Turn {engine.get_game_state().turn} reached with distilled opponents")
+        await engine.shutdown()
+
+        # Real turns log the agents' model decisions
+        game_log_path = os.path.join(tmp, "game_decisions.jsonl")
+        engine = ArcticWargameEngine()
+        engine.human_player_mode = False
+        engine.model_client = FakeModelClient()
+        engine.enable_decision_logging(game_log_path)
+        await engine.initialize()
+        await engine.start_game()
+        for _ in range(5):
+            if await engine.execute_turn() == "game_over":
+                break
+        played = [a for a in engine.resolved_actions if a['nation'] in ("Russia", "China")]
+        await engine.shutdown()
+        logged = load_decisions(game_log_path)
+        assert played and sum(len(records) for records in logged.values()) >= len(played)
+        assert {a['name'] for a in played} <= {r['action_name'] for records in logged.values() for r in records}
+        print(f"6. ✅ {len(played)} alliance moves played through the agents; "
+              f"{engine.decision_logger.logged} model decisions logged from real turns")
+
+    print("\n✅ Policy distillation test completed!")
+
+if __name__ == "__main__":
+    asyncio.run(test_policy_distill())
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Test script for broadcasting one authoritative game to many read-only spectators
+"""
+
+import asyncio
+import os
+import sys
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from game_engine import ArcticWargameEngine
+from spectator_hub import BroadcastHub, GameBroadcaster
+
+async def test_spectator_hub():
+    """One engine publishes; fast spectators see every update, a slow one gets a coalesced backlog"""
+    print("🧪 Testing Spectator Broadcast Hub")
+    print("=" * 60)
+
+    hub = BroadcastHub(queue_size=4)
+    engine = ArcticWargameEngine()
+    engine.human_player_mode = False
+    await engine.initialize()
+
+    channel = hub.open_channel()
+    broadcaster = GameBroadcaster(engine, channel)
+    print(f"1. ✅ Opened channel {channel.game_id}; live games: {hub.active_games()}")
+
+    spectators = [channel.subscribe() for _ in range(50)]
+    slow_spectator = channel.subscribe(queue_size=3)
+    seen = [[] for _ in spectators]
+
+    await engine.start_game()
+    publish_seconds = 0.0
+    turns = 0
+    for _ in range(10):
+        start = time.perf_counter()
+        result = await engine.execute_turn()
+        publish_seconds += time.perf_counter() - start
+        turns += 1
+        for i, spectator in enumerate(spectators):
+            seen[i].extend(update['seq'] for update in spectator.poll())
+        if result == "game_over":
+            break
+
+    expected = list(range(1, channel.seq + 1))
+    assert all(s == expected for s in seen), "Fast spectators missed updates"
+    print(f"2. ✅ {len(spectators)} spectators each received all {channel.seq} updates over {turns} turns")
+
+    # The slow spectator never polled: its backlog was collapsed instead of growing
+    backlog = slow_spectator.poll()
+    assert len(backlog) <= 3, f"Slow spectator queue exceeded its bound: {len(backlog)}"
+    assert backlog[-1]['seq'] == channel.seq, "Slow spectator did not get the newest snapshot"
+    assert slow_spectator.coalesce_count > 0
+    print(f"3. ✅ Slow spectator holds {len(backlog)} updates (coalesced {slow_spectator.coalesce_count}x), "
+          f"newest seq {backlog[-1]['seq']}")
+
+    # Snapshots are copies: later engine changes do not leak into what spectators already hold
+    snapshot_turn = channel.latest['state'].turn
+    await engine.execute_turn()
+    assert channel.latest['state'].turn == snapshot_turn + 1
+    assert backlog[-1]['state'].turn == snapshot_turn
+    print("4. ✅ Published snapshots are independent of the live engine state")
+
+    late_spectator = channel.subscribe()
+    first = late_spectator.poll()
+    assert first and first[0]['seq'] == channel.seq
+    print(f"5. ✅ Late joiner starts from the current snapshot (seq {first[0]['seq']})")
+
+    print(f"   Stats: {channel.get_stats()}")
+    print(f"   Turn + publish time: {publish_seconds / turns * 1000:.2f} ms per turn for 51 spectators")
+
+    broadcaster.publish("game_over", engine.get_final_adjudication())
+    assert channel.closed and channel.game_id not in hub.active_games()
+    print("6. ✅ Final adjudication published and channel closed")
+
+    await engine.shutdown()
+
+    # A victory-condition ending is published as that victory, not the score-based adjudication
+    engine = ArcticWargameEngine()
+    engine.human_player_mode = False
+    await engine.initialize()
+    channel = hub.open_channel()
+    GameBroadcaster(engine, channel)
+    spectator = channel.subscribe()
+    await engine.start_game()
+    state = engine.get_game_state()
+    state.us_resources = {k: 10 for k in state.us_resources}  # the score leader...
+    victory = "Russia achieves decisive victory through Arctic Military Dominance!"
+    engine._check_victory_conditions = lambda: victory  # ...but Russia meets its victory condition
+    assert await engine.execute_turn() == "game_over"
+    final = spectator.poll()[-1]
+    assert final['result'] == "game_over" and final['final_adjudication'] == victory, final['final_adjudication']
+    assert "United States" in engine.get_final_adjudication().split("!")[0] and channel.closed
+    print("7. ✅ Spectators received the victory that ended the game, not the score adjudication")
+    await engine.shutdown()
+
+    print("\n✅ Spectator hub test completed!")
+
+if __name__ == "__main__":
+    asyncio.run(test_spectator_hub())
@@ -0,0 +1,15 @@
+"""
+Warm-up hook for the wargame app, run at server boot by `python cold_start.py serve` or in a
+background thread on the first script run. Each step is timed by cold_start.
+"""
+
+import importlib
+
+
+def warm_up(step):
+    step("import chart libraries", lambda: [importlib.import_module(m) for m in ("pandas", "plotly.express")])
+    step("import game modules", lambda: [importlib.import_module(m) for m in (
+        "game_engine", "engine_pool", "autoplay", "arctic_map_component", "spectator_hub", "multiplayer")])
+    step("start background loop", lambda: importlib.import_module("streamlit_loop").get_background_loop())
+    # Engines initialized with their opening crises attached, so the first Start New Game is a pool hit
+    step("fill engine pool", lambda: importlib.import_module("engine_pool").get_engine_pool())
@@ -0,0 +1,174 @@
+"""
+Many scheduling conversations on one SingleThreadedAgentRuntime.
+
+Each conversation publishes on its own topic (source = conversation ID), so the runtime
+creates a User and a SchedulingAssistant per conversation the first time one of its messages
+arrives; the agents load their saved state lazily. Conversations left waiting for the user
+longer than `idle_seconds` are evicted: their agents' state goes to the persister in one
+batched flush and the instances are dropped, so only active conversations cost memory.
+
+Usage:
+    host = ConversationHost(model_client)
+    await host.start()
+    question = await host.send("alice")                 # opening turn
+    question = await host.send("alice", "Book lunch with Bob")
+    await host.stop()
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+from autogen_core import AgentId, DefaultInterventionHandler, MessageContext, SingleThreadedAgentRuntime
+from autogen_core.models import ChatCompletionClient
+
+import main as humanloop
+from main import (
+    AGENT_TYPES,
+    CONVERSATION_TOPIC,
+    INITIAL_ASSISTANT_MESSAGE,
+    GetSlowUserMessage,
+    TerminateMessage,
+    UserTextMessage,
+    conversation_topic,
+    register_agents,
+)
+from telemetry import TelemetryHandler
+
+DEFAULT_IDLE_SECONDS = 300.0
+
+
+@dataclass
+class Conversation:
+    """A conversation whose agents are in memory"""
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    waiter: Optional[asyncio.Future] = None  # resolved when the turn ends
+    last_active: float = field(default_factory=time.monotonic)
+
+
+class TurnRouter(DefaultInterventionHandler):
+    """Ends a conversation's turn when its agents ask the user something or terminate"""
+
+    def __init__(self, host: "ConversationHost"):
+        self.host = host
+
+    async def on_publish(self, message: Any, *, message_context: MessageContext) -> Any:
+        self.host.stats['messages'] += 1
+        if isinstance(message, (GetSlowUserMessage, TerminateMessage)):
+            self.host._end_turn(message_context.topic_id.source, message)
+        return message
+
+
+class ConversationHost:
+    """Hosts any number of conversations on one runtime, sharing one model client"""
+
+    def __init__(self, model_client: ChatCompletionClient, idle_seconds: float = DEFAULT_IDLE_SECONDS,
+                 sweep_interval: float = 30.0, turn_timeout: float = 120.0,
+                 report_interval: Optional[float] = None):
+        self.model_client = model_client
+        self.idle_seconds = idle_seconds
+        self.sweep_interval = sweep_interval
+        self.turn_timeout = turn_timeout
+        self.report_interval = report_interval  # seconds between telemetry log lines; None for none
+        self.telemetry = TelemetryHandler()
+        self.runtime = SingleThreadedAgentRuntime(intervention_handlers=[TurnRouter(self), self.telemetry])
+        self.telemetry.attach(self.runtime)
+        self.conversations: Dict[str, Conversation] = {}
+        self.stats = {'messages': 0, 'turns': 0, 'evictions': 0, 'terminated': 0}
+        self._sweeper: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        await register_agents(self.runtime, self.model_client)
+        self.runtime.start()
+        self._sweeper = asyncio.create_task(self._sweep())
+        if self.report_interval:
+            self.telemetry.start_reporting(self.report_interval)
+
+    async def stop(self) -> None:
+        if self._sweeper is not None:
+            self._sweeper.cancel()
+        self.telemetry.stop_reporting()
+        await self.runtime.stop_when_idle()
+        await self.evict_idle(0)
+
+    async def send(self, conversation_id: str, text: Optional[str] = None) -> Optional[str]:
+        """Run one turn: the user's reply (None opens the conversation). Returns the next
+        question for the user, or None when the conversation has ended."""
+        while True:
+            conversation = self.conversations.setdefault(conversation_id, Conversation())
+            async with conversation.lock:
+                if self.conversations.get(conversation_id) is conversation:
+                    return await self._turn(conversation_id, conversation, text)
+            # Evicted while we waited for the lock; start again with fresh agents
+
+    async def _turn(self, conversation_id: str, conversation: Conversation, text: Optional[str]) -> Optional[str]:
+        conversation.waiter = asyncio.get_running_loop().create_future()
+        message = INITIAL_ASSISTANT_MESSAGE if text is None else UserTextMessage(content=text, source="User")
+        await self.runtime.publish_message(message, conversation_topic(conversation_id))
+        try:
+            result = await asyncio.wait_for(conversation.waiter, self.turn_timeout)
+        finally:
+            conversation.waiter = None
+            conversation.last_active = time.monotonic()
+        self.stats['turns'] += 1
+        if isinstance(result, TerminateMessage):
+            self.stats['terminated'] += 1
+            self._forget(conversation_id)
+            humanloop.state_persister.delete_conversation(conversation_id)
+            del self.conversations[conversation_id]
+            return None
+        return result.content
+
+    def _end_turn(self, conversation_id: str, message: Any) -> None:
+        conversation = self.conversations.get(conversation_id)
+        if conversation is not None and conversation.waiter is not None and not conversation.waiter.done():
+            conversation.waiter.set_result(message)
+
+    async def evict_idle(self, idle_seconds: Optional[float] = None) -> int:
+        """Save and unload every conversation idle for longer than idle_seconds"""
+        idle_seconds = self.idle_seconds if idle_seconds is None else idle_seconds
+        cutoff = time.monotonic() - idle_seconds
+        evicted = 0
+        for conversation_id, conversation in list(self.conversations.items()):
+            if conversation.lock.locked() or conversation.last_active > cutoff:
+                continue
+            async with conversation.lock:
+                for agent_type in AGENT_TYPES:
+                    agent_id = AgentId(agent_type, conversation_id)
+                    if agent_id in self.runtime._instantiated_agents:
+                        state = await self.runtime.agent_save_state(agent_id)
+                        humanloop.state_persister.save_agent_state(conversation_id, agent_type, state)
+                # Its agents reload from the persister when the user comes back
+                self._forget(conversation_id)
+                del self.conversations[conversation_id]
+            evicted += 1
+        humanloop.state_persister.flush()
+        self.stats['evictions'] += evicted
+        return evicted
+
+    def _forget(self, conversation_id: str) -> None:
+        # The runtime has no public way to unload an agent; drop the instances and the
+        # topic's cached recipients so nothing about the conversation stays in memory
+        for agent_type in AGENT_TYPES:
+            self.runtime._instantiated_agents.pop(AgentId(agent_type, conversation_id), None)
+        subscriptions = self.runtime._subscription_manager
+        topic = conversation_topic(conversation_id)
+        subscriptions._seen_topics.discard(topic)
+        subscriptions._subscribed_recipients.pop(topic, None)
+
+    async def _sweep(self) -> None:
+        while True:
+            await asyncio.sleep(self.sweep_interval)
+            try:
+                await self.evict_idle()
+            except Exception as e:
+                print(f"Evicting idle conversations failed: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        return dict(
+            self.stats,
+            active=len(self.conversations),
+            instantiated_agents=len(self.runtime._instantiated_agents),
+            topic=CONVERSATION_TOPIC,
+        )
@@ -1,17 +1,20 @@
 import asyncio
 import datetime
 import json
+from abc import abstractmethod
 from concurrent.futures import ThreadPoolExecutor
-from typing import Any, Dict, List, Optional
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Optional, Sequence, TypeVar
 
 from autogen_core import (
+    AgentId,
     CancellationToken,
     DefaultInterventionHandler,
-    DefaultTopicId,
     FunctionCall,
     MessageContext,
     RoutedAgent,
     SingleThreadedAgentRuntime,
+    TopicId,
     message_handler,
     type_subscription,
 )
@@ -21,6 +24,8 @@ from autogen_core.model_context import BufferedChatCompletionContext
 from autogen_core.models import (
     AssistantMessage,
     ChatCompletionClient,
+    FunctionExecutionResult,
+    FunctionExecutionResultMessage,
     SystemMessage,
     UserMessage,        
 )
@@ -29,6 +34,9 @@ from autogen_core.tools import BaseTool
 from pydantic import BaseModel, Field
 import yaml
 
+from persistence import SqliteStatePersister
+from telemetry import TelemetryHandler
+
 @dataclass
 class TextMessage:
     source: str
@@ -44,26 +52,42 @@ class AssistantTextMessage(TextMessage):
 
 @dataclass
 class GetSlowUserMessage:
-    pass
+    content: str
 
 @dataclass
 class TerminateMessage:
     content: str
 
-class MockPersistence:
-    def __init__(self):
-        self._content: Mapping[str, Any] = {}
+CONVERSATION_TOPIC = "scheduling_assistant_conversation"
+
+def conversation_topic(conversation_id: str) -> TopicId:
+    """Each conversation has its own topic; its source is the conversation ID, which the
+    type subscriptions map to the agent key, so every conversation gets its own agents"""
+    return TopicId(CONVERSATION_TOPIC, source=conversation_id)
+
+# Timings across every main() call in this process; see telemetry.get_stats()
+telemetry = TelemetryHandler()
+
+# Agent state per conversation, on disk; agents load theirs when their first message arrives
+state_persister = SqliteStatePersister()
 
-    def load_content(self) -> Mapping[str, Any]:
-        return self._content
 
-    def save_content(self, content: Mapping[str, Any]) -> None:
-        self._content = content
+class PersistentStateMixin:
+    """Loads the agent's saved state lazily, on the first message it handles (or the first
+    save, for an agent that was instantiated but handled nothing)"""
 
-state_persister = MockPersistence()
+    _state_loaded = False
 
-@type_subscription("scheduling_assistant_conversation")
-class SlowUserProxyAgent(RoutedAgent):
+    async def ensure_state_loaded(self) -> None:
+        if self._state_loaded:
+            return
+        self._state_loaded = True
+        state = state_persister.load_agent_state(self.id.key, self.id.type)
+        if state:
+            await self.load_state(state)
+
+@type_subscription(CONVERSATION_TOPIC)
+class SlowUserProxyAgent(PersistentStateMixin, RoutedAgent):
     def __init__(
         self, 
         name: str, 
@@ -81,15 +105,17 @@ class SlowUserProxyAgent(RoutedAgent):
         message: AssistantTextMessage,
         context: MessageContext,
     ) -> None:
+        await self.ensure_state_loaded()
         await self._model_context.add_message(AssistantMessage(
             content=message.content,
             source=message.source
         ))
         await self.publish_message(
-            GetSlowUserMessage(content=message.content), topic_id=DefaultTopicId("scheduling_assistant_conversation")
+            GetSlowUserMessage(content=message.content), topic_id=conversation_topic(self.id.key)
         )
 
     async def save_state(self) -> Mapping[str, Any]:
+        await self.ensure_state_loaded()  # never save a fresh context over the stored history
         state_to_save = {
             "memory": await self._model_context.save_state(),
         }
@@ -97,6 +123,7 @@ class SlowUserProxyAgent(RoutedAgent):
 
     async def load_state(self, state: Mapping[str, Any]) -> None:
         await self._model_context.load_state(state["memory"])
+        self._state_loaded = True  # e.g. restored from a snapshot; don't reload from the persister
 
 class ScheduleMeetingInput(BaseModel):
     recipient: str = Field(description="Name of recipient")
@@ -104,9 +131,30 @@ class ScheduleMeetingInput(BaseModel):
     time: str = Field(description="Time of the meeting")
 
 class ScheduleMeetingOutput(BaseModel):
-    pass
+    confirmation: str = Field(description="Confirmation of the booked meeting")
+
+ArgsT = TypeVar("ArgsT", bound=BaseModel)
+ReturnT = TypeVar("ReturnT", bound=BaseModel)
+
+# Blocking tool work runs on this bounded pool, never on the runtime's event loop
+TOOL_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="humanloop-tool")
+DEFAULT_TOOL_TIMEOUT = 30.0
+
+class BlockingTool(BaseTool[ArgsT, ReturnT]):
+    """A tool whose work blocks (sync HTTP clients, file I/O): implement run_blocking()
+    and run() hands it to the tool thread pool"""
+
+    @abstractmethod
+    def run_blocking(self, args: ArgsT, cancellation_token: CancellationToken) -> ReturnT:
+        ...
+
+    async def run(self, args: ArgsT, cancellation_token: CancellationToken) -> ReturnT:
+        future = asyncio.get_running_loop().run_in_executor(
+            TOOL_EXECUTOR, self.run_blocking, args, cancellation_token)
+        cancellation_token.link_future(future)
+        return await future
 
-class ScheduleMeetingTool(BaseTool[ScheduleMeetingInput, ScheduleMeetingOutput]):
+class ScheduleMeetingTool(BlockingTool[ScheduleMeetingInput, ScheduleMeetingOutput]):
     def __init__(self):
         super().__init__(
             ScheduleMeetingInput,
@@ -115,29 +163,33 @@ class ScheduleMeetingTool(BaseTool[ScheduleMeetingInput, ScheduleMeetingOutput])
             "Schedules a meeting with the recipient at the specified date and time",    
         )
 
-    async def execute(self, args: ScheduleMeetingInput, cancellation_token: CancellationToken) -> ScheduleMeetingOutput:
-        # Simulate scheduling logic
+    def run_blocking(self, args: ScheduleMeetingInput, cancellation_token: CancellationToken) -> ScheduleMeetingOutput:
+        # Simulate scheduling logic (a calendar API call)
         print(f"Meeting scheduled with {args.recipient} on {args.date} at {args.time}.")
-        return ScheduleMeetingOutput()
+        return ScheduleMeetingOutput(confirmation=f"Meeting with {args.recipient} on {args.date} at {args.time}")
     
-@type_subscription("scheduling_assistant_conversation")
-class SchedulingAssistant(RoutedAgent):
+@type_subscription(CONVERSATION_TOPIC)
+class SchedulingAssistant(PersistentStateMixin, RoutedAgent):
     def __init__(
         self, 
         name: str, 
         description: str,
         model_client: ChatCompletionClient,
         initial_message: AssistantMessage | None = None,        
+        tools: Sequence[BaseTool[Any, Any]] | None = None,
+        tool_timeout: float = DEFAULT_TOOL_TIMEOUT,
     ) -> None:
         super().__init__(description)
         self._model_context = BufferedChatCompletionContext(
             buffer_size=5,
-            initial_message=[UserMessage(
+            initial_messages=[UserMessage(
                 content=initial_message.content, source=initial_message.source)]
             if initial_message else None,
         )
         self._name = name
         self._model_client = model_client
+        self._tools = list(tools) if tools is not None else [ScheduleMeetingTool()]
+        self._tool_timeout = tool_timeout
         self._system_message = [
             SystemMessage(
                 content=f"""
@@ -155,18 +207,189 @@ Today's date is {datetime.datetime.now().strftime("%Y-%m-%d")}
         message: UserTextMessage,
         context: MessageContext,
     ) -> None:
+        await self.ensure_state_loaded()
         await self._model_context.add_message(UserMessage(
             content=message.content,
             source=message.source
         ))
 
-        tools = [ScheduleMeetingTool()]
         response = await self._model_client.create(
             self._system_message + (await self._model_context.get_messages()),
-            tools=tools,
+            tools=self._tools,
         )
         
         if isinstance(response.content, list) and all(isinstance(item, FunctionCall) for item in response.content):
-            
-        
-      
\ No newline at end of file
+            await self._model_context.add_message(AssistantMessage(
+                content=response.content,
+                source=self.metadata["type"]
+            ))
+            results = await self._execute_tool_calls(response.content, context.cancellation_token)
+            await self._model_context.add_message(FunctionExecutionResultMessage(content=results))
+            # One follow-up request with every result, rather than one per call
+            response = await self._model_client.create(
+                self._system_message + (await self._model_context.get_messages()),
+            )
+            assert isinstance(response.content, str)
+            if not any(result.is_error for result in results):
+                await self._model_context.add_message(AssistantMessage(
+                    content=response.content,
+                    source=self.metadata["type"]
+                ))
+                await self.publish_message(
+                    TerminateMessage(content=response.content),
+                    topic_id=conversation_topic(self.id.key),
+                )
+                return
+
+        assert isinstance(response.content, str)
+        await self._model_context.add_message(AssistantMessage(
+            content=response.content,
+            source=self.metadata["type"]
+        ))
+        await self.publish_message(
+            AssistantTextMessage(content=response.content, source=self.metadata["type"]),
+            topic_id=conversation_topic(self.id.key),
+        )
+
+    async def _execute_tool_calls(
+        self, calls: List[FunctionCall], cancellation_token: CancellationToken
+    ) -> List[FunctionExecutionResult]:
+        """Run every call concurrently, so several calls cost the slowest one, not their sum"""
+        return list(await asyncio.gather(*(self._execute_tool_call(call, cancellation_token) for call in calls)))
+
+    async def _execute_tool_call(self, call: FunctionCall, cancellation_token: CancellationToken) -> FunctionExecutionResult:
+        tool = next((tool for tool in self._tools if tool.name == call.name), None)
+        try:
+            if tool is None:
+                raise ValueError(f"Tool not found: {call.name}")
+            arguments = json.loads(call.arguments)
+            # A timed-out blocking tool keeps its thread until it returns; the result is discarded
+            result = await asyncio.wait_for(tool.run_json(arguments, cancellation_token, call_id=call.id),
+                                            self._tool_timeout)
+            return FunctionExecutionResult(content=tool.return_value_as_string(result), name=call.name,
+                                           call_id=call.id, is_error=False)
+        except asyncio.TimeoutError:
+            content = f"Error: {call.name} timed out after {self._tool_timeout}s"
+        except Exception as e:
+            content = f"Error: {e}"
+        return FunctionExecutionResult(content=content, name=call.name, call_id=call.id, is_error=True)
+
+    async def save_state(self) -> Mapping[str, Any]:
+        await self.ensure_state_loaded()  # never save a fresh context over the stored history
+        return {
+            "memory": await self._model_context.save_state(),
+        }
+
+    async def load_state(self, state: Mapping[str, Any]) -> None:
+        await self._model_context.load_state(state["memory"])
+        self._state_loaded = True  # e.g. restored from a snapshot; don't reload from the persister
+
+class NeedsUserInputHandler(DefaultInterventionHandler):
+    def __init__(self):
+        self.question_for_user: GetSlowUserMessage | None = None
+
+    async def on_publish(self, message: Any, *, message_context: MessageContext) -> Any:
+        if isinstance(message, GetSlowUserMessage):
+            self.question_for_user = message
+        return message
+
+    @property
+    def needs_user_input(self) -> bool:
+        return self.question_for_user is not None
+
+    @property
+    def user_input_content(self) -> str | None:
+        if self.question_for_user is None:
+            return None
+        return self.question_for_user.content
+
+class TerminationHandler(DefaultInterventionHandler):
+    def __init__(self):
+        self.terminate_message: TerminateMessage | None = None
+
+    async def on_publish(self, message: Any, *, message_context: MessageContext) -> Any:
+        if isinstance(message, TerminateMessage):
+            self.terminate_message = message
+        return message
+
+    @property
+    def is_terminated(self) -> bool:
+        return self.terminate_message is not None
+
+    @property
+    def termination_msg(self) -> str | None:
+        if self.terminate_message is None:
+            return None
+        return self.terminate_message.content
+
+AGENT_TYPES = ["User", "SchedulingAssistant"]
+INITIAL_ASSISTANT_MESSAGE = AssistantTextMessage(
+    content="Hi! How can I help you? I can help schedule meetings", source="User"
+)
+
+async def register_agents(runtime: SingleThreadedAgentRuntime, model_client: ChatCompletionClient) -> None:
+    """Register both agent types; instances are created per conversation as messages arrive"""
+    await SlowUserProxyAgent.register(runtime, "User", lambda: SlowUserProxyAgent("User", "I am a user"))
+    await SchedulingAssistant.register(
+        runtime,
+        "SchedulingAssistant",
+        lambda: SchedulingAssistant(
+            "SchedulingAssistant",
+            description="AI that helps you schedule meetings",
+            model_client=model_client,
+            initial_message=INITIAL_ASSISTANT_MESSAGE,
+        ),
+    )
+
+async def main(model_config: Dict[str, Any], latest_user_input: Optional[str] = None,
+               conversation_id: str = "default") -> None | str:
+    """Run the conversation until the slow user must answer; returns the question for them"""
+    model_client = ChatCompletionClient.load_component(model_config)
+
+    termination_handler = TerminationHandler()
+    needs_user_input_handler = NeedsUserInputHandler()
+    runtime = SingleThreadedAgentRuntime(
+        intervention_handlers=[needs_user_input_handler, termination_handler, telemetry])
+    telemetry.attach(runtime)
+
+    await register_agents(runtime, model_client)
+
+    runtime_initiation_message: UserTextMessage | AssistantTextMessage
+    if latest_user_input is not None:
+        runtime_initiation_message = UserTextMessage(content=latest_user_input, source="User")
+    else:
+        runtime_initiation_message = INITIAL_ASSISTANT_MESSAGE
+
+    # No runtime.load_state: each agent reads its own state on its first message
+    await runtime.publish_message(runtime_initiation_message, conversation_topic(conversation_id))
+
+    runtime.start()
+    await runtime.stop_when(lambda: termination_handler.is_terminated or needs_user_input_handler.needs_user_input)
+    await model_client.close()
+
+    if needs_user_input_handler.needs_user_input:
+        for agent_type in AGENT_TYPES:
+            agent_id = AgentId(agent_type, conversation_id)
+            state_persister.save_agent_state(conversation_id, agent_type, await runtime.agent_save_state(agent_id))
+        state_persister.flush()
+    elif termination_handler.is_terminated:
+        state_persister.delete_conversation(conversation_id)
+        print(f"Conversation ended: {termination_handler.termination_msg}")
+
+    return needs_user_input_handler.user_input_content
+
+if __name__ == "__main__":
+    with open("model_config.yml", "r") as f:
+        config = yaml.safe_load(f)
+
+    async def run_cli():
+        # Each call is a fresh runtime; the conversation survives in between (and across restarts)
+        user_input = None
+        while True:
+            question = await main(config, user_input)
+            if question is None:
+                break
+            print(f"Assistant: {question}")
+            user_input = input("User: ")
+
+    asyncio.run(run_cli())
@@ -0,0 +1,171 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+DEFAULT_STATE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "humanloop_state.db")
+
+
+def _split_messages(state: Mapping[str, Any]) -> Tuple[Dict[str, Any], List[Any]]:
+    """Separate an agent's growing message list from the rest of its state"""
+    memory = state.get("memory")
+    if not isinstance(memory, Mapping) or "messages" not in memory:
+        return dict(state), []
+    rest = dict(state)
+    rest["memory"] = {k: v for k, v in memory.items() if k != "messages"}
+    return rest, list(memory["messages"])
+
+
+def _digest(message: Any) -> str:
+    return hashlib.sha1(json.dumps(message, sort_keys=True).encode()).hexdigest()
+
+
+def _join_messages(rest: Mapping[str, Any], messages: List[Any]) -> Dict[str, Any]:
+    state = dict(rest)
+    if isinstance(state.get("memory"), Mapping):
+        state["memory"] = dict(state["memory"], messages=messages)
+    return state
+
+
+class SqliteStatePersister:
+    """Durable agent state per conversation, in SQLite.
+
+    An agent's state is stored as its message list (one row per message, append-only) plus
+    the rest of its state as one small row. A save writes only messages added since the last
+    save; if the history was rewritten, the agent's messages are replaced. Saves are buffered
+    and written `batch_size` agents at a time in one transaction (call flush() to force it),
+    and state is read on demand, so parked conversations cost disk rather than memory."""
+
+    def __init__(self, path: str = DEFAULT_STATE_PATH, batch_size: int = 64):
+        self.path = path
+        self.batch_size = batch_size
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS agent_state (
+                conversation_id TEXT NOT NULL,
+                agent_type TEXT NOT NULL,
+                state TEXT NOT NULL,
+                message_count INTEGER NOT NULL,
+                last_digest TEXT,
+                updated_at REAL NOT NULL,
+                PRIMARY KEY (conversation_id, agent_type)
+            );
+            CREATE TABLE IF NOT EXISTS agent_messages (
+                conversation_id TEXT NOT NULL,
+                agent_type TEXT NOT NULL,
+                idx INTEGER NOT NULL,
+                message TEXT NOT NULL,
+                PRIMARY KEY (conversation_id, agent_type, idx)
+            );
+        """)
+        self._pending: Dict[Tuple[str, str], Mapping[str, Any]] = {}  # latest unsaved state per agent
+        # what is on disk per agent: message count and digest of the last message
+        self._saved: Dict[Tuple[str, str], Tuple[int, Optional[str]]] = {}
+        self.stats = {'saves': 0, 'flushes': 0, 'messages_written': 0, 'full_rewrites': 0, 'loads': 0}
+
+    def save_agent_state(self, conversation_id: str, agent_type: str, state: Mapping[str, Any]) -> None:
+        """Buffer an agent's latest state; written on the next flush"""
+        with self._lock:
+            self._pending[(conversation_id, agent_type)] = state
+            self.stats['saves'] += 1
+            full = len(self._pending) >= self.batch_size
+        if full:
+            self.flush()
+
+    def load_agent_state(self, conversation_id: str, agent_type: str) -> Optional[Dict[str, Any]]:
+        """An agent's saved state, or None for a new conversation"""
+        key = (conversation_id, agent_type)
+        with self._lock:
+            if key in self._pending:
+                return dict(self._pending[key])
+            self.stats['loads'] += 1
+            row = self._conn.execute(
+                "SELECT state, message_count, last_digest FROM agent_state "
+                "WHERE conversation_id = ? AND agent_type = ?", key).fetchone()
+            if row is None:
+                return None
+            messages = [json.loads(m) for (m,) in self._conn.execute(
+                "SELECT message FROM agent_messages WHERE conversation_id = ? AND agent_type = ? "
+                "AND idx < ? ORDER BY idx", key + (row[1],))]
+            self._saved[key] = (row[1], row[2])
+        return _join_messages(json.loads(row[0]), messages)
+
+    def flush(self) -> int:
+        """Write every buffered save in one transaction; returns how many agents were written"""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            if not pending:
+                return 0
+            now = time.time()
+            with self._conn:
+                for key, state in pending.items():
+                    rest, messages = _split_messages(state)
+                    last_digest = _digest(messages[-1]) if messages else None
+                    saved = self._saved.get(key)
+                    if saved is None:
+                        row = self._conn.execute(
+                            "SELECT message_count, last_digest FROM agent_state "
+                            "WHERE conversation_id = ? AND agent_type = ?", key).fetchone()
+                        saved = tuple(row) if row else (0, None)
+                    count, last = saved
+                    if count <= len(messages) and (count == 0 or _digest(messages[count - 1]) == last):
+                        start = count  # Append only what is new
+                    else:
+                        start = 0  # History was rewritten or truncated
+                        self.stats['full_rewrites'] += 1
+                    self._conn.execute(
+                        "DELETE FROM agent_messages WHERE conversation_id = ? AND agent_type = ? AND idx >= ?",
+                        key + (start,))
+                    self._conn.executemany(
+                        "INSERT INTO agent_messages (conversation_id, agent_type, idx, message) VALUES (?, ?, ?, ?)",
+                        [key + (i, json.dumps(messages[i])) for i in range(start, len(messages))])
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO agent_state "
+                        "(conversation_id, agent_type, state, message_count, last_digest, updated_at) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        key + (json.dumps(rest), len(messages), last_digest, now))
+                    self._saved[key] = (len(messages), last_digest)
+                    self.stats['messages_written'] += len(messages) - start
+            self.stats['flushes'] += 1
+            return len(pending)
+
+    # Whole-runtime state, as SingleThreadedAgentRuntime.save_state()/load_state() use it
+
+    def save_content(self, content: Mapping[str, Any], conversation_id: str = "default") -> None:
+        for agent_id, state in content.items():
+            self.save_agent_state(conversation_id, agent_id, state)
+        self.flush()
+
+    def load_content(self, conversation_id: str = "default") -> Mapping[str, Any]:
+        with self._lock:
+            agent_types = [t for (t,) in self._conn.execute(
+                "SELECT agent_type FROM agent_state WHERE conversation_id = ?", (conversation_id,))]
+            agent_types += [t for (c, t) in self._pending if c == conversation_id and t not in agent_types]
+        return {t: self.load_agent_state(conversation_id, t) for t in agent_types}
+
+    def conversations(self) -> List[str]:
+        with self._lock:
+            return [c for (c,) in self._conn.execute("SELECT DISTINCT conversation_id FROM agent_state")]
+
+    def delete_conversation(self, conversation_id: str) -> None:
+        with self._lock:
+            for key in [k for k in self._pending if k[0] == conversation_id]:
+                del self._pending[key]
+            for key in [k for k in self._saved if k[0] == conversation_id]:
+                del self._saved[key]
+            with self._conn:
+                self._conn.execute("DELETE FROM agent_state WHERE conversation_id = ?", (conversation_id,))
+                self._conn.execute("DELETE FROM agent_messages WHERE conversation_id = ?", (conversation_id,))
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self.stats, pending=len(self._pending))
+
+    def close(self) -> None:
+        self.flush()
+        self._conn.close()
@@ -0,0 +1,182 @@
+"""
+Where a humanloop conversation spends its time.
+
+TelemetryHandler is an intervention handler; attach() also wraps the runtime so every
+publish/send is timestamped when it is queued and when its handlers finish. It aggregates
+per message type:
+    queue delay       queued -> taken off the runtime's queue
+    handler duration  taken off the queue -> every recipient's handler returned
+and per conversation (the topic source):
+    turn time         UserTextMessage published -> AssistantTextMessage published
+A conversation whose turn started but has not reached the user again (GetSlowUserMessage)
+or ended (TerminateMessage) within `stuck_after` seconds is reported as stuck.
+
+Usage:
+    telemetry = TelemetryHandler()
+    runtime = SingleThreadedAgentRuntime(intervention_handlers=[telemetry])
+    telemetry.attach(runtime)
+    telemetry.start_reporting(interval=60)   # periodic log lines
+    telemetry.get_stats()
+"""
+
+import asyncio
+import time
+import uuid
+from collections import deque
+from typing import Any, Dict, List, Optional
+
+from autogen_core import AgentId, DefaultInterventionHandler, MessageContext, SingleThreadedAgentRuntime
+
+DEFAULT_STUCK_AFTER = 120.0
+
+
+class Timings:
+    """Count, mean, p95 and max of a stream of durations (p95 over the latest samples)"""
+
+    def __init__(self, window: int = 1000):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.samples: deque = deque(maxlen=window)
+
+    def add(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        self.samples.append(seconds)
+
+    def summary(self) -> Dict[str, float]:
+        recent = sorted(self.samples)
+        return {
+            'count': self.count,
+            'avg_ms': self.total / self.count * 1000 if self.count else 0.0,
+            'p95_ms': recent[min(len(recent) - 1, int(len(recent) * 0.95))] * 1000 if recent else 0.0,
+            'max_ms': self.max * 1000,
+        }
+
+
+class TelemetryHandler(DefaultInterventionHandler):
+    """Queue delay and handler time per message type, turn time per conversation"""
+
+    def __init__(self, stuck_after: float = DEFAULT_STUCK_AFTER):
+        self.stuck_after = stuck_after
+        self.queue_delay: Dict[str, Timings] = {}
+        self.handler_time: Dict[str, Timings] = {}
+        self.turn_time = Timings()
+        self._queued_at: Dict[str, float] = {}  # message_id -> when it was published/sent
+        self._turn_started: Dict[str, float] = {}  # conversation -> when the user's message arrived
+        self._awaiting_agents: Dict[str, float] = {}  # conversation -> turn start, until the user is asked
+        self._reporter: Optional[asyncio.Task] = None
+
+    def attach(self, runtime: SingleThreadedAgentRuntime) -> None:
+        """Timestamp messages as they are queued and when their delivery finishes. Intervention
+        handlers only run when a message is taken off the queue, so the runtime's publish/send
+        and delivery coroutines are wrapped for the other two timestamps."""
+        publish_message, send_message = runtime.publish_message, runtime.send_message
+        process_publish, process_send = runtime._process_publish, runtime._process_send
+
+        async def timed_publish(message: Any, topic_id, *, message_id: str | None = None, **kwargs) -> None:
+            message_id = message_id or str(uuid.uuid4())
+            self._queued(message, message_id, topic_id.source)
+            await publish_message(message, topic_id, message_id=message_id, **kwargs)
+
+        async def timed_send(message: Any, recipient: AgentId, *, message_id: str | None = None, **kwargs) -> Any:
+            message_id = message_id or str(uuid.uuid4())
+            self._queued(message, message_id, recipient.key)
+            return await send_message(message, recipient, message_id=message_id, **kwargs)
+
+        async def timed_process(process, envelope) -> None:
+            start = time.perf_counter()
+            try:
+                await process(envelope)
+            finally:
+                self._timings(self.handler_time, envelope.message).add(time.perf_counter() - start)
+
+        runtime.publish_message = timed_publish
+        runtime.send_message = timed_send
+        runtime._process_publish = lambda envelope: timed_process(process_publish, envelope)
+        runtime._process_send = lambda envelope: timed_process(process_send, envelope)
+
+    def _timings(self, table: Dict[str, Timings], message: Any) -> Timings:
+        # Message types are matched by name, so main.py can install this without an import cycle
+        name = type(message).__name__
+        if name not in table:
+            table[name] = Timings()
+        return table[name]
+
+    def _queued(self, message: Any, message_id: str, conversation_id: str) -> None:
+        now = time.perf_counter()
+        self._queued_at[message_id] = now
+        kind = type(message).__name__
+        if kind in ("UserTextMessage", "AssistantTextMessage"):
+            # The agents owe the user an answer until GetSlowUserMessage or TerminateMessage
+            self._awaiting_agents.setdefault(conversation_id, now)
+        if kind == "UserTextMessage":
+            self._turn_started[conversation_id] = now
+
+    def _dequeued(self, message: Any, message_id: str, conversation_id: str) -> None:
+        now = time.perf_counter()
+        queued_at = self._queued_at.pop(message_id, None)
+        if queued_at is not None:
+            self._timings(self.queue_delay, message).add(now - queued_at)
+        kind = type(message).__name__
+        if kind == "AssistantTextMessage":
+            started = self._turn_started.pop(conversation_id, None)
+            if started is not None:
+                self.turn_time.add(now - started)
+        elif kind in ("GetSlowUserMessage", "TerminateMessage"):
+            self._awaiting_agents.pop(conversation_id, None)
+            self._turn_started.pop(conversation_id, None)
+
+    async def on_publish(self, message: Any, *, message_context: MessageContext) -> Any:
+        self._dequeued(message, message_context.message_id, message_context.topic_id.source)
+        return message
+
+    async def on_send(self, message: Any, *, message_context: MessageContext, recipient: AgentId) -> Any:
+        self._dequeued(message, message_context.message_id, recipient.key)
+        return message
+
+    def stuck_conversations(self, stuck_after: Optional[float] = None) -> Dict[str, float]:
+        """Conversations waiting on their agents for longer than stuck_after: id -> seconds waiting"""
+        stuck_after = self.stuck_after if stuck_after is None else stuck_after
+        now = time.perf_counter()
+        return {conversation_id: now - started for conversation_id, started in self._awaiting_agents.items()
+                if now - started > stuck_after}
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'queue_delay': {name: t.summary() for name, t in self.queue_delay.items()},
+            'handler_time': {name: t.summary() for name, t in self.handler_time.items()},
+            'turn_time': self.turn_time.summary(),
+            'in_flight_turns': len(self._awaiting_agents),
+            'stuck': self.stuck_conversations(),
+        }
+
+    def report_lines(self) -> List[str]:
+        stats = self.get_stats()
+        lines = [f"[telemetry] turns: {stats['turn_time']['count']}, avg {stats['turn_time']['avg_ms']:.0f} ms, "
+                 f"p95 {stats['turn_time']['p95_ms']:.0f} ms; {stats['in_flight_turns']} in flight, "
+                 f"{len(stats['stuck'])} stuck"]
+        for name, handler in sorted(stats['handler_time'].items()):
+            queue = stats['queue_delay'].get(name, Timings().summary())
+            lines.append(f"[telemetry] {name}: {handler['count']} handled, queue avg {queue['avg_ms']:.1f} ms "
+                         f"(p95 {queue['p95_ms']:.1f}), handler avg {handler['avg_ms']:.1f} ms "
+                         f"(p95 {handler['p95_ms']:.1f}, max {handler['max_ms']:.1f})")
+        for conversation_id, waiting in sorted(stats['stuck'].items(), key=lambda item: -item[1])[:5]:
+            lines.append(f"[telemetry] stuck: {conversation_id} waiting {waiting:.0f}s for the assistant")
+        return lines
+
+    def start_reporting(self, interval: float = 60.0) -> None:
+        """Print the aggregates every `interval` seconds on the running loop"""
+        async def report():
+            while True:
+                await asyncio.sleep(interval)
+                for line in self.report_lines():
+                    print(line)
+
+        if self._reporter is None or self._reporter.done():
+            self._reporter = asyncio.create_task(report())
+
+    def stop_reporting(self) -> None:
+        if self._reporter is not None:
+            self._reporter.cancel()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Load test for many scheduling conversations multiplexed on one runtime
+"""
+
+import asyncio
+import gc
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from autogen_core.models import CreateResult, RequestUsage
+from autogen_ext.models.replay import ReplayChatCompletionClient
+
+import main as humanloop
+from conversations import ConversationHost
+from persistence import SqliteStatePersister
+
+
+class AskingClient(ReplayChatCompletionClient):
+    """Asks a follow-up question that quotes the user's last message"""
+
+    def __init__(self, latency: float = 0.01):
+        super().__init__([])
+        self.latency = latency
+
+    async def create(self, messages, **kwargs):
+        await asyncio.sleep(self.latency)
+        reply = f"When should I book '{messages[-1].content}'?"
+        return CreateResult(finish_reason="stop", content=reply, cached=False,
+                            usage=RequestUsage(prompt_tokens=0, completion_tokens=0))
+
+
+async def test_conversations():
+    """Thousands of conversations share one runtime; idle ones are evicted to disk"""
+    print("🧵 Testing Multiplexed Conversations")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        humanloop.state_persister = SqliteStatePersister(os.path.join(tmp, "state.db"), batch_size=500)
+        host = ConversationHost(AskingClient(), idle_seconds=3600)
+        await host.start()
+
+        # Two conversations interleaved: each keeps its own history
+        await asyncio.gather(host.send("alice"), host.send("bob"))
+        alice, bob = await asyncio.gather(host.send("alice", "lunch with Carol"), host.send("bob", "call with Dan"))
+        assert "lunch with Carol" in alice and "call with Dan" in bob, (alice, bob)
+        print(f"1. ✅ Conversations routed by topic source: alice -> {alice!r}, bob -> {bob!r}")
+
+        count = 2000
+        start = time.perf_counter()
+        await asyncio.gather(*(host.send(f"user-{i}") for i in range(count)))
+        replies = await asyncio.gather(*(host.send(f"user-{i}", f"meeting {i}") for i in range(count)))
+        elapsed = time.perf_counter() - start
+        assert all(f"meeting {i}" in reply for i, reply in enumerate(replies))
+        print(f"2. ✅ {count} conversations x 2 turns in {elapsed:.2f}s: "
+              f"{host.stats['messages'] / elapsed:.0f} messages/sec, {count * 2 / elapsed:.0f} turns/sec")
+
+        await asyncio.sleep(0.1)  # Let the last deliveries finish
+        start = time.perf_counter()
+        evicted = await host.evict_idle(0)
+        evict_seconds = time.perf_counter() - start
+        stats = host.get_stats()
+        assert evicted == count + 2 and stats['active'] == 0 and stats['instantiated_agents'] == 0, stats
+        print(f"3. ✅ Evicted {evicted} idle conversations to disk in {evict_seconds:.2f}s")
+
+        # Memory: a batch of active conversations, then the same batch after eviction
+        sample = 500
+        gc.collect()
+        tracemalloc.start()
+        baseline = tracemalloc.get_traced_memory()[0]
+        await asyncio.gather(*(host.send(f"sample-{i}") for i in range(sample)))
+        await asyncio.gather(*(host.send(f"sample-{i}", f"meeting {i}") for i in range(sample)))
+        await asyncio.sleep(0.1)
+        gc.collect()
+        active_bytes = tracemalloc.get_traced_memory()[0] - baseline
+        await host.evict_idle(0)
+        gc.collect()
+        idle_bytes = tracemalloc.get_traced_memory()[0] - baseline
+        tracemalloc.stop()
+        print(f"4. ✅ Memory: {active_bytes / sample / 1024:.1f} KB per active conversation, "
+              f"{idle_bytes / sample:.0f} bytes per evicted one")
+
+        reply = await host.send("alice", "Friday at noon")
+        state = humanloop.state_persister.load_agent_state("alice", "SchedulingAssistant")
+        contents = [m["content"] for m in state["memory"]["messages"]]
+        assert "lunch with Carol" in contents and reply == "When should I book 'Friday at noon'?", contents
+        print(f"5. ✅ Evicted conversation resumed from disk with its history ({len(contents)} messages)")
+
+        # Reopening a parked conversation with no input, then parking it again, keeps its history
+        before = humanloop.state_persister.load_agent_state("bob", "SchedulingAssistant")
+        await host.send("bob")
+        await asyncio.sleep(0.1)
+        await host.evict_idle(0)
+        after = humanloop.state_persister.load_agent_state("bob", "SchedulingAssistant")
+        assert after == before and "call with Dan" in str(after), after
+        print(f"6. ✅ Parked conversation reopened without input kept its {len(after['memory']['messages'])} messages")
+
+        await host.stop()
+        print(f"   Host stats: {host.get_stats()}")
+
+    print("\n✅ Multiplexed conversations test completed!")
+
+if __name__ == "__main__":
+    asyncio.run(test_conversations())
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Test script for the SQLite state persister behind the humanloop agents
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from autogen_ext.models.replay import ReplayChatCompletionClient
+
+import main as humanloop
+from persistence import SqliteStatePersister
+
+
+def replay_config(*replies):
+    return ReplayChatCompletionClient(list(replies)).dump_component().model_dump()
+
+
+def agent_state(n):
+    messages = [{"content": f"message {i}", "source": "User", "type": "UserMessage"} for i in range(n)]
+    return {"memory": {"messages": messages}}
+
+
+async def test_persistence():
+    """Conversations survive restarts, and saves write only what changed"""
+    print("💾 Testing SQLite State Persister")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "state.db")
+        persister = SqliteStatePersister(path, batch_size=100)
+        persister.save_agent_state("c1", "User", agent_state(3))
+        assert persister.load_agent_state("c1", "User") == agent_state(3), "Unflushed save not visible"
+        persister.flush()
+        persister.save_agent_state("c1", "User", agent_state(5))
+        persister.flush()
+        assert persister.stats['messages_written'] == 5, "Second save rewrote old messages"
+        persister.save_agent_state("c1", "User", agent_state(2))  # History truncated
+        persister.flush()
+        assert persister.stats['full_rewrites'] == 1
+        assert SqliteStatePersister(path).load_agent_state("c1", "User") == agent_state(2)
+        print(f"1. ✅ Deltas appended, rewrites detected, state survives reopening: {persister.get_stats()}")
+
+        # Two user turns, each in a fresh runtime as after a restart
+        humanloop.state_persister = SqliteStatePersister(path)
+        question = await humanloop.main(replay_config(), None, "default")
+        assert question.startswith("Hi! How can I help")
+        question = await humanloop.main(replay_config("Sure - who is the meeting with, and when?"),
+                                        "Book a meeting please", "default")
+        assert question == "Sure - who is the meeting with, and when?"
+        humanloop.state_persister = SqliteStatePersister(path)  # Process restart
+        state = humanloop.state_persister.load_agent_state("default", "SchedulingAssistant")
+        contents = [m["content"] for m in state["memory"]["messages"]]
+        assert contents[-2:] == ["Book a meeting please", "Sure - who is the meeting with, and when?"], contents
+        question = await humanloop.main(replay_config("Booked for Friday?"), "Alice, Friday 3pm", "default")
+        state = humanloop.state_persister.load_agent_state("default", "SchedulingAssistant")
+        assert len(state["memory"]["messages"]) == len(contents) + 2
+        print(f"2. ✅ Conversation resumed after restart with {len(state['memory']['messages'])} assistant messages")
+
+        # Reopening with no user input: the assistant handles no message but its saved state must survive
+        history = state["memory"]["messages"]
+        rewrites = humanloop.state_persister.stats['full_rewrites']
+        question = await humanloop.main(replay_config(), None, "default")
+        assert question.startswith("Hi! How can I help")
+        state = humanloop.state_persister.load_agent_state("default", "SchedulingAssistant")
+        assert state["memory"]["messages"] == history, state
+        assert humanloop.state_persister.stats['full_rewrites'] == rewrites
+        print(f"3. ✅ Reopening without input kept the assistant's {len(history)} messages (no rewrite)")
+
+        # Park thousands of paused conversations
+        parked = SqliteStatePersister(os.path.join(tmp, "parked.db"), batch_size=500)
+        start = time.perf_counter()
+        for turn in range(1, 4):
+            for c in range(3000):
+                parked.save_agent_state(f"conv-{c}", "SchedulingAssistant", agent_state(turn * 2))
+            parked.flush()
+        elapsed = time.perf_counter() - start
+        stats = parked.get_stats()
+        assert stats['messages_written'] == 3000 * 6 and stats['pending'] == 0
+        size_kb = os.path.getsize(os.path.join(tmp, "parked.db")) / 1024
+        print(f"4. ✅ 3000 conversations x 3 turns parked in {elapsed:.2f}s with {stats['flushes']} transactions; "
+              f"{stats['messages_written']} message rows written, nothing held in memory ({size_kb:.0f} KB on disk)")
+
+        start = time.perf_counter()
+        assert len(parked.load_agent_state("conv-2999", "SchedulingAssistant")["memory"]["messages"]) == 6
+        print(f"5. ✅ Lazy load of one parked conversation: {(time.perf_counter() - start) * 1000:.2f} ms")
+
+    print("\n✅ State persister test completed!")
+
+if __name__ == "__main__":
+    asyncio.run(test_persistence())
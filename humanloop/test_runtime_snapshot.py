@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Test script and benchmark for binary runtime snapshots
+"""
+
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from autogen_core import AgentId, SingleThreadedAgentRuntime
+from autogen_ext.models.replay import ReplayChatCompletionClient
+
+import main as humanloop
+import runtime_snapshot
+from persistence import SqliteStatePersister
+from runtime_snapshot import load_snapshot, read_snapshot, save_snapshot
+
+
+def conversation_state(i, turns=3):
+    messages = [{"content": "Hi! How can I help you? I can help schedule meetings", "source": "User",
+                 "type": "UserMessage"}]
+    for turn in range(turns):
+        messages.append({"content": f"Book a meeting with person {i} on day {turn}", "source": "User",
+                         "type": "UserMessage"})
+        messages.append({"content": f"Sure - what time on day {turn} suits person {i}?", "source": "SchedulingAssistant",
+                         "type": "AssistantMessage", "thought": None})
+    return {"memory": {"messages": messages}}
+
+
+async def new_runtime():
+    runtime = SingleThreadedAgentRuntime()
+    await humanloop.register_agents(runtime, ReplayChatCompletionClient(["unused"]))
+    return runtime
+
+
+async def test_runtime_snapshot():
+    """Every agent's state in one compact file, restored into a fresh runtime"""
+    print("📸 Testing Runtime Snapshots")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        humanloop.state_persister = SqliteStatePersister(os.path.join(tmp, "state.db"))
+        conversations = 5000  # x 2 agent types = 10k agents
+        runtime = await new_runtime()
+        for i in range(conversations):
+            for agent_type in humanloop.AGENT_TYPES:
+                await runtime.agent_load_state(AgentId(agent_type, f"conv-{i}"), conversation_state(i))
+        agents = len(runtime._instantiated_agents)
+        assert agents == 10000
+
+        start = time.perf_counter()
+        json_bytes = len(json.dumps(await runtime.save_state()).encode())
+        json_seconds = time.perf_counter() - start
+        print(f"   JSON runtime.save_state(): {json_bytes / 1024:.0f} KB in {json_seconds * 1000:.0f} ms")
+
+        results = {}
+        for compress in (False, True):
+            path = os.path.join(tmp, f"runtime-{compress}.snap")
+            results[compress] = await save_snapshot(runtime, path, compress=compress)
+            stats = results[compress]
+            print(f"   snapshot ({stats['codec']}): {stats['bytes'] / 1024:.0f} KB in {stats['seconds'] * 1000:.0f} ms")
+        assert results[True]['bytes'] < results[False]['bytes'] < json_bytes
+        print(f"1. ✅ {agents} agents snapshotted; zstd file is {json_bytes / results[True]['bytes']:.0f}x "
+              f"smaller than JSON")
+
+        restored = await new_runtime()
+        stats = await load_snapshot(restored, os.path.join(tmp, "runtime-True.snap"))
+        assert stats['agents'] == agents and len(restored._instantiated_agents) == agents
+        for key in ("conv-0", "conv-4999"):
+            agent_id = AgentId("SchedulingAssistant", key)
+            assert await restored.agent_save_state(agent_id) == await runtime.agent_save_state(agent_id)
+        print(f"2. ✅ Restored {stats['agents']} agents into a fresh runtime in {stats['seconds'] * 1000:.0f} ms")
+
+        # A restored agent keeps the snapshot state instead of reloading from the persister
+        humanloop.state_persister.save_agent_state("conv-0", "SchedulingAssistant", conversation_state(0, turns=0))
+        agent = await restored.try_get_underlying_agent_instance(AgentId("SchedulingAssistant", "conv-0"))
+        await agent.ensure_state_loaded()
+        assert len((await agent.save_state())["memory"]["messages"]) == 7
+        print("3. ✅ Restored agents don't reload older state from the persister")
+
+        path = os.path.join(tmp, "runtime-True.snap")
+        with open(path, "rb") as f:
+            data = f.read()
+        with open(os.path.join(tmp, "truncated.snap"), "wb") as f:
+            f.write(data[:len(data) // 2])
+        try:
+            sum(1 for _ in read_snapshot(os.path.join(tmp, "truncated.snap")))
+            raise AssertionError("Truncated snapshot was accepted")
+        except Exception as e:
+            assert "truncated" in str(e) or "zstd" in type(e).__module__ or "Zstd" in type(e).__name__, e
+        with open(os.path.join(tmp, "future.snap"), "wb") as f:
+            f.write(runtime_snapshot._HEADER.pack(runtime_snapshot.SNAPSHOT_MAGIC, 99, 0))
+        try:
+            list(read_snapshot(os.path.join(tmp, "future.snap")))
+            raise AssertionError("Unknown format version was accepted")
+        except ValueError as e:
+            assert "format 99" in str(e)
+        print("4. ✅ Truncated files and newer format versions are rejected")
+
+    print("\n✅ Runtime snapshot test completed!")
+
+if __name__ == "__main__":
+    asyncio.run(test_runtime_snapshot())
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Test script for the humanloop runtime telemetry
+"""
+
+import asyncio
+import contextlib
+import io
+import os
+import sys
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from autogen_core.models import CreateResult, RequestUsage
+from autogen_ext.models.replay import ReplayChatCompletionClient
+
+import main as humanloop
+from conversations import ConversationHost
+from persistence import SqliteStatePersister
+
+
+class SlowModelClient(ReplayChatCompletionClient):
+    """Answers after `latency` seconds; never answers a message containing 'hang'"""
+
+    def __init__(self, latency: float):
+        super().__init__([])
+        self.latency = latency
+
+    async def create(self, messages, **kwargs):
+        await asyncio.sleep(60 if "hang" in messages[-1].content else self.latency)
+        return CreateResult(finish_reason="stop", content="Which day suits you?", cached=False,
+                            usage=RequestUsage(prompt_tokens=0, completion_tokens=0))
+
+
+async def test_telemetry():
+    """Queue delay, handler time, turn time and stuck conversations are measured"""
+    print("⏱️ Testing Runtime Telemetry")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        humanloop.state_persister = SqliteStatePersister(os.path.join(tmp, "state.db"))
+        host = ConversationHost(SlowModelClient(latency=0.1), turn_timeout=5)
+        await host.start()
+        telemetry = host.telemetry
+        telemetry.stuck_after = 0.3
+
+        await asyncio.gather(*(host.send(f"c{i}") for i in range(20)))
+        await asyncio.gather(*(host.send(f"c{i}", "Book a meeting") for i in range(20)))
+        stats = telemetry.get_stats()
+        assert {"UserTextMessage", "AssistantTextMessage", "GetSlowUserMessage"} <= set(stats['handler_time'])
+        assert stats['handler_time']['UserTextMessage']['avg_ms'] >= 100, stats['handler_time']
+        assert stats['turn_time']['count'] == 20 and stats['turn_time']['avg_ms'] >= 100
+        assert stats['in_flight_turns'] == 0 and not stats['stuck']
+        print(f"1. ✅ 20 turns: avg {stats['turn_time']['avg_ms']:.0f} ms, of which the assistant's handler "
+              f"{stats['handler_time']['UserTextMessage']['avg_ms']:.0f} ms; queue delay "
+              f"{stats['queue_delay']['UserTextMessage']['avg_ms']:.2f} ms")
+
+        hung = asyncio.create_task(host.send("c0", "please hang"))
+        await asyncio.sleep(0.5)
+        stuck = telemetry.stuck_conversations()
+        assert list(stuck) == ["c0"] and stuck["c0"] > 0.3, stuck
+        print(f"2. ✅ Stuck conversation detected: c0 waiting {stuck['c0']:.2f}s for the assistant")
+
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            telemetry.start_reporting(interval=0.1)
+            await asyncio.sleep(0.25)
+            telemetry.stop_reporting()
+        lines = output.getvalue().splitlines()
+        assert any("stuck: c0" in line for line in lines) and any("UserTextMessage" in line for line in lines)
+        print(f"3. ✅ Periodic report ({len(lines)} lines), e.g.:")
+        for line in lines[:3]:
+            print(f"   {line}")
+
+        hung.cancel()
+        await host.stop()
+
+    print("\n✅ Runtime telemetry test completed!")
+
+if __name__ == "__main__":
+    asyncio.run(test_telemetry())
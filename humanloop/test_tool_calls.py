@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Test script for parallel tool execution in the SchedulingAssistant
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+import threading
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from autogen_core import DefaultInterventionHandler, FunctionCall, SingleThreadedAgentRuntime
+from autogen_core.models import CreateResult, FunctionExecutionResultMessage, RequestUsage
+from autogen_core.tools import BaseTool
+from autogen_ext.models.replay import ReplayChatCompletionClient
+from pydantic import BaseModel
+
+import main as humanloop
+from main import (
+    BlockingTool,
+    GetSlowUserMessage,
+    ScheduleMeetingOutput,
+    ScheduleMeetingTool,
+    SchedulingAssistant,
+    SlowUserProxyAgent,
+    TerminateMessage,
+    TerminationHandler,
+    NeedsUserInputHandler,
+    UserTextMessage,
+    conversation_topic,
+)
+
+
+class SlowCalendarTool(ScheduleMeetingTool):
+    """A blocking calendar API taking `delay` seconds per booking"""
+
+    def __init__(self, delay: float):
+        super().__init__()
+        self.delay = delay
+        self.threads = set()
+
+    def run_blocking(self, args, cancellation_token):
+        self.threads.add(threading.current_thread().name)
+        time.sleep(args.recipient == "Hang" and 2 or self.delay)
+        return ScheduleMeetingOutput(confirmation=f"Booked {args.recipient}")
+
+
+class AvailabilityInput(BaseModel):
+    recipient: str
+
+class AvailabilityOutput(BaseModel):
+    free: bool
+
+class AvailabilityTool(BaseTool[AvailabilityInput, AvailabilityOutput]):
+    """An async tool; runs on the event loop"""
+
+    def __init__(self):
+        super().__init__(AvailabilityInput, AvailabilityOutput, "check_availability", "Checks a calendar")
+
+    async def run(self, args, cancellation_token):
+        await asyncio.sleep(0.3)
+        return AvailabilityOutput(free=True)
+
+
+class ToolCallingClient(ReplayChatCompletionClient):
+    """Returns the given tool calls first, then a text reply; records each request"""
+
+    def __init__(self, calls):
+        super().__init__([])
+        self.calls = calls
+        self.requests = []
+
+    async def create(self, messages, **kwargs):
+        self.requests.append(messages)
+        if len(self.requests) == 1:
+            content = self.calls
+        else:
+            content = f"Done: {len(messages[-1].content)} results"
+        return CreateResult(finish_reason="stop", content=content, cached=False,
+                            usage=RequestUsage(prompt_tokens=0, completion_tokens=0))
+
+
+def booking(call_id, recipient):
+    return FunctionCall(id=call_id, name="schedule_meeting",
+                        arguments=f'{{"recipient": "{recipient}", "date": "2026-10-23", "time": "10:00"}}')
+
+
+class TurnClock(DefaultInterventionHandler):
+    """When the turn ended (stop_when only checks once a second)"""
+    ended_at = None
+
+    async def on_publish(self, message, *, message_context):
+        if isinstance(message, (TerminateMessage, GetSlowUserMessage)):
+            self.ended_at = time.perf_counter()
+        return message
+
+
+async def run_turn(client, tools, tool_timeout=2.0):
+    termination, needs_input, clock = TerminationHandler(), NeedsUserInputHandler(), TurnClock()
+    runtime = SingleThreadedAgentRuntime(intervention_handlers=[needs_input, termination, clock])
+    await SlowUserProxyAgent.register(runtime, "User", lambda: SlowUserProxyAgent("User", "I am a user"))
+    await SchedulingAssistant.register(runtime, "SchedulingAssistant", lambda: SchedulingAssistant(
+        "SchedulingAssistant", "AI that helps you schedule meetings", client, tools=tools, tool_timeout=tool_timeout))
+    await runtime.publish_message(UserTextMessage(content="Book them all", source="User"), conversation_topic("t"))
+    start = time.perf_counter()
+    runtime.start()
+    await runtime.stop_when(lambda: termination.is_terminated or needs_input.needs_user_input)
+    return clock.ended_at - start, termination, needs_input
+
+
+async def test_tool_calls():
+    """Tool calls run concurrently and their results go back in one follow-up request"""
+    print("🛠️ Testing Parallel Tool Execution")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        humanloop.state_persister = humanloop.SqliteStatePersister(os.path.join(tmp, "state.db"))
+
+        calendar = SlowCalendarTool(delay=0.3)
+        calls = [booking(f"call-{i}", name) for i, name in enumerate(["Alice", "Bob", "Carol", "Dan"])]
+        calls.append(FunctionCall(id="call-4", name="check_availability", arguments='{"recipient": "Erin"}'))
+        client = ToolCallingClient(calls)
+        elapsed, termination, _ = await run_turn(client, [calendar, AvailabilityTool()])
+        assert termination.termination_msg == "Done: 5 results", termination.termination_msg
+        assert elapsed < 0.9, f"Tool calls ran one after another ({elapsed:.2f}s)"
+        print(f"1. ✅ 5 tool calls of 0.3s each took {elapsed:.2f}s in total (sequential: 1.5s)")
+        assert all(name.startswith("humanloop-tool") for name in calendar.threads) and len(calendar.threads) == 4
+        print(f"2. ✅ Blocking calls ran on {len(calendar.threads)} pool threads; the async call stayed on the loop")
+
+        follow_up = client.requests[1][-1]
+        assert len(client.requests) == 2 and isinstance(follow_up, FunctionExecutionResultMessage)
+        assert [r.call_id for r in follow_up.content] == [c.id for c in calls]
+        print(f"3. ✅ One follow-up request carried all {len(follow_up.content)} results, in call order")
+
+        client = ToolCallingClient([booking("ok", "Alice"), booking("slow", "Hang"),
+                                    FunctionCall(id="bad", name="cancel_meeting", arguments="{}")])
+        elapsed, termination, needs_input = await run_turn(client, [SlowCalendarTool(delay=0.1)], tool_timeout=0.5)
+        results = {r.call_id: r for r in client.requests[1][-1].content}
+        assert not results["ok"].is_error and results["slow"].is_error and results["bad"].is_error
+        assert "timed out" in results["slow"].content and needs_input.needs_user_input and not termination.is_terminated
+        assert elapsed < 1.5
+        print(f"4. ✅ Timeout and unknown tool reported as errors after {elapsed:.2f}s; the assistant asks the user")
+
+    class ForgotRunBlocking(BlockingTool[BaseModel, ScheduleMeetingOutput]):
+        pass
+
+    try:
+        ForgotRunBlocking(BaseModel, ScheduleMeetingOutput, "incomplete", "Has no run_blocking")
+        assert False, "a BlockingTool without run_blocking should not be constructible"
+    except TypeError:
+        pass
+    print("5. ✅ A BlockingTool that does not implement run_blocking cannot be constructed, instead of failing when called")
+
+    print("\n✅ Parallel tool execution test completed!")
+
+if __name__ == "__main__":
+    asyncio.run(test_tool_calls())
@@ -0,0 +1,265 @@
+"""
+Offline query queue for intermittently connected deployments, on ship_queue.db.
+
+Uses the existing `queries(id, query, response, timestamp, synced)` table, plus `attempts`
+and `last_error` columns added on open. When the model cannot be reached, a prompt is answered
+from an earlier response to the same query if there is one, and otherwise queued as an
+unsynced row. A SyncWorker on the shared background loop drains unsynced rows in batches once
+the model is reachable again: it first sends the oldest row alone as a probe, then answers the
+rest of the batch with bounded concurrency and writes all of its answers in a single
+transaction. A row that fails for any reason other than connectivity is retried up to
+`max_attempts` times and then parked, so it no longer holds up the rows queued after it.
+
+Usage:
+    queue = ShipQueue()
+    status, response, query_id = await ask(queue, agent.chat, prompt)  # "online", "cached" or "queued"
+    worker = SyncWorker(queue, answer=lambda q: Agent(stateless=True).chat(q))
+    worker.start(get_background_loop())
+"""
+
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+DEFAULT_QUEUE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "ship_queue.db")
+
+Answer = Callable[[str], Awaitable[str]]
+
+
+def is_unreachable(error: BaseException) -> bool:
+    """True for errors meaning the model could not be reached (as opposed to a bad request)"""
+    if isinstance(error, (ConnectionError, TimeoutError, asyncio.TimeoutError)):
+        return True
+    # httpx / openai connection and timeout errors, without importing either
+    return any("Connection" in cls.__name__ or "Timeout" in cls.__name__ for cls in type(error).__mro__)
+
+
+class ShipQueue:
+    """The queries table: queued prompts, their responses and sync state"""
+
+    def __init__(self, path: str = DEFAULT_QUEUE_PATH, max_attempts: int = 3):
+        self.path = path
+        self.max_attempts = max_attempts  # Failed answers before a row is parked
+        self._lock = threading.Lock()
+        # timeout: wait for another process's write instead of failing with "database is locked"
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS queries (
+                id INTEGER PRIMARY KEY,
+                query TEXT,
+                response TEXT,
+                timestamp TEXT,
+                synced BOOLEAN DEFAULT FALSE
+            );
+            CREATE INDEX IF NOT EXISTS idx_queries_synced ON queries(synced, id);
+            CREATE INDEX IF NOT EXISTS idx_queries_query ON queries(query);
+        """)
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(queries)")}
+        with self._conn:
+            if "attempts" not in columns:
+                self._conn.execute("ALTER TABLE queries ADD COLUMN attempts INTEGER NOT NULL DEFAULT 0")
+            if "last_error" not in columns:
+                self._conn.execute("ALTER TABLE queries ADD COLUMN last_error TEXT")
+
+    def enqueue(self, query: str) -> int:
+        """Queue a prompt to be answered when the model is reachable"""
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "INSERT INTO queries (query, timestamp, synced) VALUES (?, ?, 0)",
+                (query, datetime.now().isoformat()))
+            return cursor.lastrowid
+
+    def record(self, query: str, response: str) -> int:
+        """Store a prompt answered online, so it can be served later while offline"""
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "INSERT INTO queries (query, response, timestamp, synced) VALUES (?, ?, ?, 1)",
+                (query, response, datetime.now().isoformat()))
+            return cursor.lastrowid
+
+    def cached_response(self, query: str) -> Optional[str]:
+        """Most recent model answer to exactly this query, if any (unsynced rows only hold placeholders)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response FROM queries WHERE query = ? AND synced = 1 AND response IS NOT NULL "
+                "ORDER BY id DESC LIMIT 1",
+                (query,)).fetchone()
+        return row[0] if row else None
+
+    def get(self, query_id: int) -> Optional[Dict]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT id, query, response, timestamp, synced, attempts, last_error FROM queries WHERE id = ?",
+                (query_id,)).fetchone()
+        if row is None:
+            return None
+        return {'id': row[0], 'query': row[1], 'response': row[2], 'timestamp': row[3], 'synced': bool(row[4]),
+                'attempts': row[5], 'last_error': row[6], 'parked': not row[4] and row[5] >= self.max_attempts}
+
+    def unsynced(self, limit: int) -> List[Tuple[int, str]]:
+        """Oldest queued prompts first, skipping parked rows"""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT id, query FROM queries WHERE synced = 0 AND attempts < ? ORDER BY id LIMIT ?",
+                (self.max_attempts, limit)).fetchall()
+
+    def mark_synced(self, answers: List[Tuple[int, str]]) -> int:
+        """Write a batch of (id, response) answers in one transaction"""
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "UPDATE queries SET response = ?, synced = 1 WHERE id = ? AND synced = 0",
+                [(response, query_id) for query_id, response in answers])
+        return len(answers)
+
+    def mark_failed(self, failures: List[Tuple[int, str]]) -> int:
+        """Count a failed answer against each (id, error) row in one transaction"""
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "UPDATE queries SET attempts = attempts + 1, last_error = ? WHERE id = ? AND synced = 0",
+                [(error, query_id) for query_id, error in failures])
+        return len(failures)
+
+    def pending_count(self) -> int:
+        """Rows still waiting to be answered (parked rows excluded)"""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM queries WHERE synced = 0 AND attempts < ?", (self.max_attempts,)).fetchone()[0]
+
+    def parked_count(self) -> int:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM queries WHERE synced = 0 AND attempts >= ?", (self.max_attempts,)).fetchone()[0]
+
+    def requeue_parked(self) -> int:
+        """Give parked rows another `max_attempts` tries, e.g. after fixing the model configuration"""
+        with self._lock, self._conn:
+            return self._conn.execute(
+                "UPDATE queries SET attempts = 0 WHERE synced = 0 AND attempts >= ?", (self.max_attempts,)).rowcount
+
+    def close(self):
+        self._conn.close()
+
+
+async def ask(queue: ShipQueue, answer: Answer, query: str) -> Tuple[str, Optional[str], Optional[int]]:
+    """Answer online if possible; otherwise serve a cached answer or queue the prompt.
+
+    Returns (status, response, query_id) with status "online", "cached" or "queued"."""
+    try:
+        response = await answer(query)
+    except Exception as e:
+        if not is_unreachable(e):
+            raise
+        cached = queue.cached_response(query)
+        if cached is not None:
+            return "cached", cached, None
+        return "queued", None, queue.enqueue(query)
+    return "online", response, queue.record(query, response)
+
+
+class SyncWorker:
+    """Drains unsynced queries in batches while the model is reachable"""
+
+    def __init__(self, queue: ShipQueue, answer: Answer, batch_size: int = 50,
+                 concurrency: int = 4, interval: float = 5.0):
+        self.queue = queue
+        self.answer = answer
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.interval = interval  # Seconds between polls when idle or offline
+        self.stats = {'batches': 0, 'synced': 0, 'failed': 0, 'offline_polls': 0, 'probes_failed': 0}
+        self.sync_seconds = 0.0  # Time spent in batches that synced something
+        self.last_sync_at: Optional[float] = None
+        self._stop_requested = False
+        self._future = None
+
+    async def _answer_one(self, semaphore: asyncio.Semaphore, query_id: int, query: str):
+        async with semaphore:
+            try:
+                return query_id, await self.answer(query), None
+            except Exception as e:
+                return query_id, None, e
+
+    async def drain_once(self) -> int:
+        """Answer and commit one batch; returns how many rows were synced"""
+        rows = self.queue.unsynced(self.batch_size)
+        if not rows:
+            return 0
+        start = time.perf_counter()
+        semaphore = asyncio.Semaphore(self.concurrency)
+        # One request tells us whether the model is back before we send the whole batch
+        probe = await self._answer_one(semaphore, *rows[0])
+        if probe[2] is not None and is_unreachable(probe[2]):
+            self.stats['probes_failed'] += 1
+            return 0
+        results = [probe] + list(await asyncio.gather(
+            *(self._answer_one(semaphore, query_id, query) for query_id, query in rows[1:])))
+        answers = [(query_id, response) for query_id, response, error in results if error is None]
+        errors = [(query_id, error) for query_id, _, error in results if error is not None]
+        self.stats['failed'] += len(errors)
+        # Connectivity errors leave the row as it was; anything else counts towards parking it
+        failures = [(query_id, f"{type(error).__name__}: {error}") for query_id, error in errors
+                    if not is_unreachable(error)]
+        if failures:
+            self.queue.mark_failed(failures)
+            for query_id, error in failures:
+                print(f"Queued query #{query_id} failed: {error}")
+        if answers:
+            self.queue.mark_synced(answers)
+            self.stats['batches'] += 1
+            self.stats['synced'] += len(answers)
+            self.sync_seconds += time.perf_counter() - start
+            self.last_sync_at = time.time()
+        return len(answers)
+
+    async def run(self):
+        """Drain batch after batch; back off for `interval` when the queue is empty or the model is down"""
+        while not self._stop_requested:
+            synced = await self.drain_once()
+            if synced == 0:
+                if self.queue.pending_count():
+                    self.stats['offline_polls'] += 1
+                await asyncio.sleep(self.interval)
+
+    def start(self, background_loop):
+        if self._future is None or self._future.done():
+            self._stop_requested = False
+            self._future = background_loop.submit(self.run())
+
+    @property
+    def running(self) -> bool:
+        return self._future is not None and not self._future.done()
+
+    def stop(self):
+        self._stop_requested = True
+        if self._future is not None:
+            self._future.cancel()
+
+    def get_stats(self) -> Dict:
+        """Sync counts, throughput and queue depth"""
+        return dict(
+            self.stats,
+            pending=self.queue.pending_count(),
+            parked=self.queue.parked_count(),
+            rows_per_second=self.stats['synced'] / self.sync_seconds if self.sync_seconds else 0.0,
+            last_sync_at=self.last_sync_at,
+        )
+
+
+_sync_worker: Optional[SyncWorker] = None
+_sync_worker_lock = threading.Lock()
+
+
+def get_sync_worker(answer: Answer, path: str = DEFAULT_QUEUE_PATH) -> SyncWorker:
+    """Process-wide sync worker on the shared background loop, started on first use"""
+    global _sync_worker
+    with _sync_worker_lock:
+        if _sync_worker is None:
+            from streamlit_loop import get_background_loop
+            _sync_worker = SyncWorker(ShipQueue(path), answer)
+            _sync_worker.start(get_background_loop())
+        return _sync_worker
@@ -0,0 +1,238 @@
+"""
+Persistent background event loop shared by the Streamlit apps.
+
+Streamlit re-executes the script on every interaction, and wrapping each async call in
+asyncio.run creates and tears down an event loop every time. That breaks connection reuse
+in async HTTP clients bound to a loop and cancels any background task. Instead, one
+long-lived loop runs in a daemon thread per process and each browser session submits
+coroutines to it through a SessionRunner. Tasks those coroutines spawn on the loop (an
+engine's background narrations, speculation, ...) belong to the same session, so ending
+the session cancels them too.
+
+Usage:
+    runner = get_session_runner(st.session_state)
+    result = runner.run(engine.execute_turn(), timeout=120)
+    st.write_stream(runner.stream(agent.chat_stream(prompt)))
+"""
+
+import asyncio
+import concurrent.futures
+import contextvars
+import threading
+import uuid
+import weakref
+from typing import Any, AsyncIterator, Coroutine, Dict, Iterator, Optional, Set
+
+DEFAULT_TIMEOUT = 120.0
+
+# Session whose coroutine is running; inherited by every task it creates
+_current_session: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("streamlit_session", default=None)
+
+
+async def _next_item(agen: AsyncIterator):
+    # StopAsyncIteration cannot cross a future, so report exhaustion as a flag
+    try:
+        return False, await agen.__anext__()
+    except StopAsyncIteration:
+        return True, None
+
+
+async def _in_session(coro: Coroutine, session_id: str):
+    # Runs in its own task context, so only this coroutine and its tasks see the session
+    _current_session.set(session_id)
+    return await coro
+
+
+class BackgroundLoop:
+    """An asyncio event loop running forever in a daemon thread"""
+
+    def __init__(self, name: str = "streamlit-background-loop"):
+        self._name = name
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._session_futures: Dict[str, Set[concurrent.futures.Future]] = {}
+        self._session_tasks: Dict[str, Set[asyncio.Task]] = {}  # tasks spawned by session coroutines
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        self.start()
+        return self._loop
+
+    def start(self) -> None:
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            ready = threading.Event()
+
+            def run_forever():
+                self._loop = asyncio.new_event_loop()
+                self._loop.set_task_factory(self._task_factory)
+                asyncio.set_event_loop(self._loop)
+                ready.set()
+                self._loop.run_forever()
+
+            self._thread = threading.Thread(target=run_forever, name=self._name, daemon=True)
+            self._thread.start()
+            ready.wait()
+
+    def _task_factory(self, loop: asyncio.AbstractEventLoop, coro: Coroutine, **kwargs) -> asyncio.Task:
+        task = asyncio.Task(coro, loop=loop, **kwargs)
+        session_id = _current_session.get()
+        if session_id is not None:
+            with self._lock:
+                self._session_tasks.setdefault(session_id, set()).add(task)
+            task.add_done_callback(lambda t: self._forget_task(session_id, t))
+        return task
+
+    def submit(self, coro: Coroutine, session_id: Optional[str] = None) -> concurrent.futures.Future:
+        """Schedule a coroutine on the loop and return a thread-safe future"""
+        if session_id is not None:
+            coro = _in_session(coro, session_id)
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        if session_id is not None:
+            with self._lock:
+                self._session_futures.setdefault(session_id, set()).add(future)
+            future.add_done_callback(lambda f: self._forget(session_id, f))
+        return future
+
+    def run(self, coro: Coroutine, timeout: Optional[float] = DEFAULT_TIMEOUT, session_id: Optional[str] = None) -> Any:
+        """Run a coroutine on the loop and block the calling thread until it finishes"""
+        if threading.current_thread() is self._thread:
+            raise RuntimeError("BackgroundLoop.run() cannot be called from the loop thread")
+        future = self.submit(coro, session_id)
+        try:
+            return future.result(timeout=timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise TimeoutError(f"Background task did not finish within {timeout} seconds")
+
+    def stream(self, agen: AsyncIterator, timeout: Optional[float] = DEFAULT_TIMEOUT,
+               session_id: Optional[str] = None) -> Iterator:
+        """Iterate an async generator on the loop from a synchronous caller such as st.write_stream.
+
+        `timeout` applies to each item. If the caller stops early (the script was rerun or
+        stopped), the step in flight is cancelled, which also ends the async generator."""
+        pending = None
+        try:
+            while True:
+                pending = self.submit(_next_item(agen), session_id)
+                try:
+                    done, item = pending.result(timeout=timeout)
+                except concurrent.futures.TimeoutError:
+                    raise TimeoutError(f"Background stream produced nothing for {timeout} seconds")
+                pending = None
+                if done:
+                    return
+                yield item
+        finally:
+            if pending is not None and not pending.done():
+                pending.cancel()
+            elif pending is None:
+                self.submit(agen.aclose())
+
+    def cancel_session(self, session_id: str) -> int:
+        """Cancel every pending future submitted for a session and every task it spawned"""
+        with self._lock:
+            futures = self._session_futures.pop(session_id, set())
+            tasks = self._session_tasks.pop(session_id, set())
+        cancelled = 0
+        for future in futures:
+            if future.cancel():
+                cancelled += 1
+        for task in tasks:
+            if not task.done():
+                # Tasks belong to the loop thread
+                self._loop.call_soon_threadsafe(task.cancel)
+                cancelled += 1
+        return cancelled
+
+    def pending(self, session_id: Optional[str] = None) -> int:
+        with self._lock:
+            if session_id is not None:
+                return len(self._session_futures.get(session_id, ()))
+            return sum(len(f) for f in self._session_futures.values())
+
+    def spawned(self, session_id: str) -> int:
+        """Tasks still running that a session's coroutines created on the loop"""
+        with self._lock:
+            return len(self._session_tasks.get(session_id, ()))
+
+    def _forget(self, session_id: str, future: concurrent.futures.Future) -> None:
+        with self._lock:
+            futures = self._session_futures.get(session_id)
+            if futures is not None:
+                futures.discard(future)
+                if not futures:
+                    del self._session_futures[session_id]
+
+    def _forget_task(self, session_id: str, task: asyncio.Task) -> None:
+        with self._lock:
+            tasks = self._session_tasks.get(session_id)
+            if tasks is not None:
+                tasks.discard(task)
+                if not tasks:
+                    del self._session_tasks[session_id]
+
+    def stop(self) -> None:
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._thread = None
+        if loop is not None and thread is not None:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(timeout=5)
+
+
+_background_loop: Optional[BackgroundLoop] = None
+_background_loop_lock = threading.Lock()
+
+
+def get_background_loop() -> BackgroundLoop:
+    """Process-wide background loop, started on first use"""
+    global _background_loop
+    with _background_loop_lock:
+        if _background_loop is None:
+            _background_loop = BackgroundLoop()
+        _background_loop.start()
+        return _background_loop
+
+
+class SessionRunner:
+    """Per-session handle on the shared loop; pending work is cancelled when the session ends"""
+
+    def __init__(self, background_loop: BackgroundLoop, session_id: Optional[str] = None):
+        self.background_loop = background_loop
+        self.session_id = session_id or uuid.uuid4().hex
+        # Streamlit drops session_state when the browser session ends; cancel its work then
+        weakref.finalize(self, background_loop.cancel_session, self.session_id)
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        return self.background_loop.loop
+
+    def submit(self, coro: Coroutine) -> concurrent.futures.Future:
+        return self.background_loop.submit(coro, self.session_id)
+
+    def run(self, coro: Coroutine, timeout: Optional[float] = DEFAULT_TIMEOUT) -> Any:
+        return self.background_loop.run(coro, timeout=timeout, session_id=self.session_id)
+
+    def stream(self, agen: AsyncIterator, timeout: Optional[float] = DEFAULT_TIMEOUT) -> Iterator:
+        return self.background_loop.stream(agen, timeout=timeout, session_id=self.session_id)
+
+    def cancel_all(self) -> int:
+        return self.background_loop.cancel_session(self.session_id)
+
+    def pending(self) -> int:
+        return self.background_loop.pending(self.session_id)
+
+    def spawned(self) -> int:
+        return self.background_loop.spawned(self.session_id)
+
+
+def get_session_runner(session_state) -> SessionRunner:
+    """Get or create the SessionRunner stored in a Streamlit session_state"""
+    runner = session_state.get("_session_runner")
+    if runner is None:
+        runner = SessionRunner(get_background_loop())
+        session_state["_session_runner"] = runner
+    return runner